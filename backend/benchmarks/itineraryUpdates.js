@@ -0,0 +1,172 @@
+// Benchmark: itinerary edits as single scoped updates (ItineraryService) against the
+// previous load-trip, mutate and save() implementation, on 30-day trips carrying
+// thousands of likes. Needs a MongoDB server; the benchmark database is
+// dropped afterwards. Run with: npm run bench:itinerary
+import mongoose from 'mongoose';
+import { performance } from 'perf_hooks';
+import Trip from '../models/Trip.js';
+import itineraryService from '../services/itineraryService.js';
+
+const MONGODB_URI = process.env.BENCH_MONGODB_URI || 'mongodb://localhost:27017/travel-assistant-bench';
+const DAYS = 30;
+const ACTIVITIES_PER_DAY = 6;
+const ITERATIONS = parseInt(process.env.BENCH_ITERATIONS) || 200;
+
+const userId = new mongoose.Types.ObjectId();
+
+const buildActivity = (day, i) => ({
+  name: `Day ${day} activity ${i}`,
+  description: 'A representative activity description of a sentence or two.',
+  category: 'sightseeing',
+  location: { name: 'Somewhere', address: '1 Main Street', coordinates: { latitude: 48.85, longitude: 2.35 } },
+  duration: { hours: 2, minutes: 0 },
+  estimatedCost: { min: 10, max: 20, currency: 'EUR' },
+  timeSlot: { startTime: '09:00', endTime: '11:00' },
+  notes: 'Book ahead in summer.'
+});
+
+const createTrip = (likes) => {
+  const startDate = new Date('2030-06-01');
+
+  return Trip.create({
+    user: userId,
+    title: `Benchmark trip with ${likes} likes`,
+    destination: { city: 'Paris', country: 'France' },
+    startDate,
+    endDate: new Date(startDate.getTime() + DAYS * 24 * 60 * 60 * 1000),
+    duration: DAYS,
+    isPublic: true,
+    itinerary: Array.from({ length: DAYS }, (_, d) => ({
+      day: d + 1,
+      date: new Date(startDate.getTime() + d * 24 * 60 * 60 * 1000),
+      theme: 'Exploring',
+      activities: Array.from({ length: ACTIVITIES_PER_DAY }, (_, i) => buildActivity(d + 1, i))
+    })),
+    likes: Array.from({ length: likes }, () => new mongoose.Types.ObjectId()),
+    likesCount: likes
+  });
+};
+
+// Previous implementations, kept as the baseline
+const legacy = {
+  async addActivity(tripId, dayIndex, activity) {
+    const trip = await Trip.findOne({ _id: tripId, user: userId });
+    trip.itinerary[dayIndex].activities.push(activity);
+    await trip.save();
+  },
+
+  async updateActivity(tripId, dayIndex, activityId, updates) {
+    const trip = await Trip.findOne({ _id: tripId, user: userId });
+    const activity = trip.itinerary[dayIndex].activities.id(activityId);
+    Object.assign(activity, updates);
+    await trip.save();
+  },
+
+  async deleteActivity(tripId, dayIndex, activityId) {
+    const trip = await Trip.findOne({ _id: tripId, user: userId });
+    trip.itinerary[dayIndex].activities.pull(activityId);
+    await trip.save();
+  },
+
+  async reorderActivities(tripId, dayIndex, activityIds) {
+    const trip = await Trip.findOne({ _id: tripId, user: userId });
+    const day = trip.itinerary[dayIndex];
+    day.activities = activityIds.map(id => day.activities.find(activity => activity._id.toString() === id));
+    await trip.save();
+  },
+
+  async updateDayInfo(tripId, dayIndex, { theme, notes }) {
+    const trip = await Trip.findOne({ _id: tripId, user: userId });
+    trip.itinerary[dayIndex].theme = theme;
+    trip.itinerary[dayIndex].notes = notes;
+    await trip.save();
+  }
+};
+
+const current = {
+  addActivity: (tripId, dayIndex, activity) =>
+    itineraryService.addActivity(tripId, userId, dayIndex, activity),
+  updateActivity: (tripId, dayIndex, activityId, updates) =>
+    itineraryService.updateActivity(tripId, userId, dayIndex, activityId, updates),
+  deleteActivity: (tripId, dayIndex, activityId) =>
+    itineraryService.deleteActivity(tripId, userId, dayIndex, activityId),
+  reorderActivities: (tripId, dayIndex, activityIds) =>
+    itineraryService.reorderActivities(tripId, userId, dayIndex, activityIds),
+  updateDayInfo: (tripId, dayIndex, info) =>
+    itineraryService.updateDayInfo(tripId, userId, dayIndex, info)
+};
+
+const activityIdsOf = async (tripId, dayIndex) => {
+  const trip = await Trip.findById(tripId).select({ itinerary: { $slice: [dayIndex, 1] } }).lean();
+  return trip.itinerary[0].activities.map(activity => activity._id.toString());
+};
+
+// Each operation leaves the day as it found it, so every iteration sees the same trip
+const OPERATIONS = {
+  'add + delete activity': async (impl, tripId, i) => {
+    const dayIndex = i % DAYS;
+    await impl.addActivity(tripId, dayIndex, { _id: new mongoose.Types.ObjectId(), ...buildActivity(dayIndex + 1, 'new') });
+    const ids = await activityIdsOf(tripId, dayIndex);
+    await impl.deleteActivity(tripId, dayIndex, ids[ids.length - 1]);
+  },
+  'update activity': async (impl, tripId, i, ids) => {
+    const dayIndex = i % DAYS;
+    await impl.updateActivity(tripId, dayIndex, ids[dayIndex][0], { completed: i % 2 === 0, notes: `Edit ${i}` });
+  },
+  'reorder activities': async (impl, tripId, i, ids) => {
+    const dayIndex = i % DAYS;
+    const order = i % 2 === 0 ? [...ids[dayIndex]].reverse() : ids[dayIndex];
+    await impl.reorderActivities(tripId, dayIndex, order);
+  },
+  'update day': async (impl, tripId, i) => {
+    await impl.updateDayInfo(tripId, i % DAYS, { theme: `Theme ${i}`, notes: `Notes ${i}` });
+  }
+};
+
+const measure = async (fn) => {
+  // Warm up connections and query plans
+  for (let i = 0; i < 10; i++) await fn(i);
+
+  const startedAt = performance.now();
+  for (let i = 0; i < ITERATIONS; i++) await fn(i);
+  return (performance.now() - startedAt) / ITERATIONS;
+};
+
+const run = async () => {
+  await mongoose.connect(MONGODB_URI);
+  await mongoose.connection.dropDatabase();
+
+  const results = [];
+
+  for (const likes of [0, 2000, 10000]) {
+    const trip = await createTrip(likes);
+    const ids = await Promise.all(trip.itinerary.map((_, dayIndex) => activityIdsOf(trip._id, dayIndex)));
+    const tripBytes = Buffer.byteLength(JSON.stringify(trip.toObject()));
+
+    for (const [name, operation] of Object.entries(OPERATIONS)) {
+      const before = await measure(i => operation(legacy, trip._id, i, ids));
+      const after = await measure(i => operation(current, trip._id, i, ids));
+
+      results.push({
+        likes,
+        'trip KB': Math.round(tripBytes / 1024),
+        operation: name,
+        'load + save ms': before.toFixed(2),
+        'scoped update ms': after.toFixed(2),
+        speedup: `${(before / after).toFixed(1)}x`
+      });
+    }
+  }
+
+  console.table(results);
+};
+
+run()
+  .catch(error => {
+    console.error(error);
+    process.exitCode = 1;
+  })
+  .finally(async () => {
+    if (mongoose.connection.readyState === 1) await mongoose.connection.dropDatabase();
+    await mongoose.disconnect();
+  });
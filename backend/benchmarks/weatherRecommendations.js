@@ -0,0 +1,100 @@
+// Microbenchmark: WeatherService.getWeatherRecommendations against the previous
+// if-chain implementation. Run with: npm run bench:recommendations
+import { performance } from 'perf_hooks';
+import weatherService from '../services/weatherService.js';
+
+// Previous implementation, kept as the baseline
+const legacyGetWeatherRecommendations = (weatherData) => {
+  const recommendations = [];
+  const temp = weatherData.current?.temperature || weatherData.temperature?.avg;
+  const condition = weatherData.current?.condition || weatherData.condition?.main;
+  const precipitation = weatherData.precipitation || 0;
+
+  if (temp < 0) {
+    recommendations.push({ type: 'clothing', message: 'Very cold weather - wear heavy winter clothing, including warm layers, gloves, and waterproof boots.' });
+    recommendations.push({ type: 'activity', message: 'Consider indoor activities like museums, shopping centers, or cozy cafes.' });
+  } else if (temp < 10) {
+    recommendations.push({ type: 'clothing', message: 'Cold weather - dress in warm layers, bring a jacket and comfortable walking shoes.' });
+  } else if (temp < 20) {
+    recommendations.push({ type: 'clothing', message: 'Cool weather - light layers recommended, bring a light jacket for evening.' });
+  } else if (temp < 30) {
+    recommendations.push({ type: 'clothing', message: 'Pleasant weather - comfortable clothing, light layers for temperature changes.' });
+  } else {
+    recommendations.push({ type: 'clothing', message: 'Hot weather - wear light, breathable clothing, hat, and sunscreen.' });
+    recommendations.push({ type: 'activity', message: 'Stay hydrated and consider indoor activities during peak heat hours (12-4 PM).' });
+  }
+
+  if (precipitation > 5) {
+    recommendations.push({ type: 'weather', message: 'Heavy rain expected - bring umbrella, waterproof clothing, and plan indoor activities.' });
+  } else if (precipitation > 0) {
+    recommendations.push({ type: 'weather', message: 'Light rain possible - bring umbrella or light rain jacket.' });
+  }
+
+  switch (condition) {
+    case 'Snow':
+      recommendations.push({ type: 'activity', message: 'Snowy conditions - great for winter sports but be cautious of slippery surfaces.' });
+      break;
+    case 'Clear':
+      recommendations.push({ type: 'activity', message: 'Perfect weather for outdoor activities, sightseeing, and photography.' });
+      break;
+    case 'Clouds':
+      recommendations.push({ type: 'activity', message: 'Overcast but good for walking tours and outdoor activities.' });
+      break;
+    case 'Thunderstorm':
+      recommendations.push({ type: 'safety', message: 'Thunderstorm conditions - avoid outdoor activities and seek shelter.' });
+      break;
+  }
+
+  return recommendations;
+};
+
+const CONDITIONS = ['Clear', 'Clouds', 'Rain', 'Snow', 'Thunderstorm', 'Drizzle', 'Mist'];
+
+// Deterministic daily forecasts shaped like the /api/weather/trip response
+const buildDays = (count) => Array.from({ length: count }, (_, i) => ({
+  temperature: { avg: -10 + ((i * 7) % 45) + 0.5 },
+  condition: { main: CONDITIONS[i % CONDITIONS.length] },
+  precipitation: (i * 3) % 11
+}));
+
+const measure = (fn, iterations) => {
+  // Warm up so both implementations are measured after JIT compilation
+  for (let i = 0; i < Math.min(iterations, 1000); i++) fn();
+
+  const startedAt = performance.now();
+  for (let i = 0; i < iterations; i++) fn();
+  const elapsed = performance.now() - startedAt;
+
+  return {
+    msPerOp: elapsed / iterations,
+    opsPerSec: Math.round((iterations / elapsed) * 1000)
+  };
+};
+
+const compare = (name, iterations, days) => {
+  // Keep the results, as the trip route does, so allocations cannot be optimized away
+  const before = measure(() => days.map(day => legacyGetWeatherRecommendations(day)), iterations);
+  const after = measure(() => days.map(day => weatherService.getWeatherRecommendations(day)), iterations);
+
+  return {
+    case: name,
+    'if-chain ops/s': before.opsPerSec,
+    'compiled ops/s': after.opsPerSec,
+    speedup: `${(before.msPerOp / after.msPerOp).toFixed(1)}x`
+  };
+};
+
+// Both implementations must agree before their speed is worth comparing
+const sample = buildDays(500);
+const mismatch = sample.find(day =>
+  JSON.stringify(legacyGetWeatherRecommendations(day)) !== JSON.stringify(weatherService.getWeatherRecommendations(day)));
+if (mismatch) {
+  console.error('Implementations disagree for', mismatch);
+  process.exit(1);
+}
+
+console.table([
+  compare('1 day', 200000, buildDays(1)),
+  compare('30-day trip', 20000, buildDays(30)),
+  compare('50-city batch x 5 days', 5000, buildDays(250))
+]);
@@ -0,0 +1,353 @@
+// Monthly climate normals (1991-2020 averages, rounded) for popular destinations.
+// Row: [city, country, country code, lat, lon, mean wind m/s, [
+//   avg high C, avg low C, precipitation mm, rainy days, relative humidity %
+// ]] with one value per month, January first.
+export const CLIMATE_NORMALS = [
+  ['Paris', 'France', 'FR', 48.86, 2.35, 4.0, [
+    [7.6, 8.8, 12.8, 16, 19.8, 23, 25.2, 25, 20.9, 16.2, 10.9, 7.8],
+    [2.7, 2.8, 5.3, 7.3, 10.9, 13.8, 15.8, 15.7, 12.7, 9.6, 5.8, 3.4],
+    [51, 41, 48, 52, 63, 50, 62, 53, 48, 62, 51, 58],
+    [10, 9, 10, 9, 10, 8, 8, 7, 8, 10, 10, 11],
+    [83, 78, 73, 69, 70, 69, 68, 71, 76, 82, 84, 85]
+  ]],
+  ['London', 'United Kingdom', 'GB', 51.51, -0.13, 4.3, [
+    [8.1, 8.8, 11.5, 14.6, 18.1, 21.2, 23.4, 23, 20, 15.7, 11.4, 8.6],
+    [2.4, 2.3, 3.9, 5.5, 8.6, 11.6, 13.8, 13.6, 11.4, 8.6, 5.3, 3],
+    [55, 41, 42, 44, 49, 45, 45, 50, 49, 69, 59, 55],
+    [11, 9, 9, 9, 8, 8, 8, 8, 8, 11, 10, 10],
+    [81, 77, 72, 67, 67, 66, 66, 68, 73, 79, 82, 83]
+  ]],
+  ['Rome', 'Italy', 'IT', 41.9, 12.5, 3.3, [
+    [12.6, 13.7, 16.2, 19.2, 23.6, 27.9, 31.1, 31.4, 27.4, 22.4, 17, 13.5],
+    [2.1, 2.9, 4.8, 7.5, 11.4, 15.2, 17.8, 17.9, 14.9, 11, 6.4, 3.5],
+    [67, 73, 58, 81, 53, 34, 19, 37, 73, 113, 115, 81],
+    [7, 8, 7, 9, 6, 4, 2, 3, 6, 8, 10, 8],
+    [76, 74, 72, 71, 70, 67, 64, 65, 69, 75, 78, 78]
+  ]],
+  ['Florence', 'Italy', 'IT', 43.77, 11.25, 2.5, [
+    [10.6, 12.6, 16, 19.4, 24.4, 28.8, 32.2, 32, 27.2, 21.3, 15, 10.8],
+    [1.7, 2.5, 4.9, 7.6, 11.6, 15.3, 17.8, 17.9, 14.6, 10.4, 5.8, 2.5],
+    [65, 62, 70, 80, 71, 55, 33, 53, 79, 98, 115, 78],
+    [7, 7, 8, 9, 8, 6, 3, 4, 6, 8, 9, 8],
+    [74, 70, 67, 68, 66, 62, 58, 60, 66, 72, 76, 77]
+  ]],
+  ['Venice', 'Italy', 'IT', 45.44, 12.33, 3.0, [
+    [6.5, 8.9, 13.2, 17.7, 22.5, 26.4, 28.7, 28.3, 24, 18.5, 12.2, 7.4],
+    [-0.5, 0.7, 4.2, 8.2, 12.6, 16.5, 18.5, 18.2, 14.8, 10.1, 5.2, 0.6],
+    [47, 54, 57, 69, 68, 75, 55, 64, 66, 68, 79, 60],
+    [6, 6, 7, 9, 9, 9, 6, 6, 6, 7, 8, 7],
+    [81, 76, 73, 72, 70, 70, 68, 70, 73, 77, 80, 82]
+  ]],
+  ['Barcelona', 'Spain', 'ES', 41.39, 2.17, 3.5, [
+    [14.8, 15.6, 17.4, 19.1, 22.5, 26.1, 28.6, 29, 26, 22.5, 17.9, 15.1],
+    [8.8, 9.4, 11, 12.8, 16, 19.7, 22.6, 23, 20.4, 16.8, 12.4, 9.7],
+    [41, 29, 42, 49, 59, 42, 20, 61, 91, 91, 58, 40],
+    [5, 4, 5, 6, 7, 4, 2, 5, 6, 7, 5, 5],
+    [69, 67, 67, 68, 69, 68, 68, 70, 71, 71, 70, 69]
+  ]],
+  ['Madrid', 'Spain', 'ES', 40.42, -3.7, 3.0, [
+    [9.8, 12, 16.3, 18.2, 22.2, 28.2, 32.1, 31.3, 26.4, 19.4, 13.5, 10],
+    [2.7, 3.7, 6.2, 7.7, 11.3, 16.1, 19, 18.8, 15.4, 10.7, 6.3, 3.6],
+    [33, 35, 25, 45, 50, 22, 12, 10, 28, 57, 55, 42],
+    [6, 6, 4, 7, 7, 3, 1, 2, 4, 7, 7, 7],
+    [71, 65, 56, 57, 52, 44, 38, 40, 50, 63, 70, 74]
+  ]],
+  ['Lisbon', 'Portugal', 'PT', 38.72, -9.14, 4.3, [
+    [14.8, 16.2, 18.6, 19.8, 22.3, 25.9, 28.2, 28.7, 26.9, 22.9, 18.3, 15.3],
+    [8.3, 9.2, 10.8, 11.9, 13.9, 16.8, 18.3, 18.7, 17.8, 15.3, 11.8, 9.6],
+    [100, 96, 58, 65, 53, 13, 4, 6, 33, 100, 128, 127],
+    [10, 9, 7, 9, 6, 2, 0, 1, 3, 8, 10, 11],
+    [80, 77, 72, 71, 69, 67, 65, 66, 68, 74, 79, 81]
+  ]],
+  ['Amsterdam', 'Netherlands', 'NL', 52.37, 4.9, 5.5, [
+    [6, 6.8, 9.8, 13.9, 17.5, 19.9, 22.2, 22, 18.9, 14.7, 10, 6.8],
+    [1.1, 0.8, 2.6, 4.6, 8.2, 10.9, 13.1, 12.8, 10.5, 7.6, 4.4, 1.9],
+    [68, 53, 58, 41, 55, 67, 78, 87, 82, 85, 85, 75],
+    [12, 10, 11, 8, 9, 9, 9, 10, 10, 12, 13, 12],
+    [88, 85, 81, 76, 75, 77, 78, 80, 84, 86, 89, 89]
+  ]],
+  ['Berlin', 'Germany', 'DE', 52.52, 13.4, 3.8, [
+    [3, 4.6, 8.7, 14.5, 19.2, 22.5, 24.8, 24.3, 19.5, 13.9, 7.7, 3.9],
+    [-1.9, -1.5, 1.3, 4.2, 8.7, 12.3, 14.3, 13.9, 10.3, 6.3, 2.3, -0.8],
+    [42, 33, 40, 37, 54, 69, 56, 58, 45, 37, 44, 55],
+    [10, 8, 9, 7, 8, 9, 9, 8, 7, 8, 9, 10],
+    [84, 80, 74, 67, 66, 66, 67, 70, 76, 82, 86, 86]
+  ]],
+  ['Prague', 'Czech Republic', 'CZ', 50.08, 14.44, 3.5, [
+    [1.3, 3.6, 8.4, 14.6, 19.4, 22.5, 24.6, 24.4, 19.1, 13.3, 6.6, 2.4],
+    [-3.7, -2.8, 0.2, 4, 8.5, 11.6, 13.5, 13.2, 9.5, 4.9, 0.8, -2.3],
+    [23, 23, 28, 31, 60, 70, 75, 64, 40, 30, 32, 26],
+    [7, 6, 7, 7, 9, 9, 9, 8, 6, 6, 7, 7],
+    [84, 80, 74, 67, 68, 69, 68, 70, 76, 81, 86, 86]
+  ]],
+  ['Vienna', 'Austria', 'AT', 48.21, 16.37, 4.2, [
+    [3, 5.3, 10, 15.8, 20.5, 23.7, 26.2, 25.8, 20.6, 14.5, 8, 3.9],
+    [-1.5, -0.5, 2.9, 6.9, 11.4, 14.6, 16.6, 16.4, 12.6, 8, 3.5, 0],
+    [37, 39, 47, 52, 75, 75, 70, 64, 58, 40, 48, 45],
+    [8, 7, 8, 7, 9, 9, 9, 8, 7, 6, 8, 8],
+    [78, 73, 67, 61, 63, 63, 62, 64, 71, 76, 80, 81]
+  ]],
+  ['Zurich', 'Switzerland', 'CH', 47.38, 8.54, 2.4, [
+    [2.9, 4.7, 9.6, 14.1, 18.5, 22, 24.2, 23.5, 19.2, 13.9, 7.6, 3.9],
+    [-2.3, -1.9, 1.2, 4.3, 8.6, 11.9, 13.8, 13.5, 10.3, 6.6, 1.8, -1],
+    [67, 66, 76, 89, 116, 128, 134, 133, 94, 85, 81, 84],
+    [10, 9, 12, 11, 13, 13, 12, 12, 10, 10, 11, 11],
+    [84, 80, 74, 70, 72, 71, 72, 76, 81, 85, 86, 86]
+  ]],
+  ['Athens', 'Greece', 'GR', 37.98, 23.73, 3.1, [
+    [13.4, 14.4, 16.7, 20.5, 25.6, 30.8, 33.5, 33.4, 28.9, 23.9, 19.1, 15],
+    [6.8, 7, 8.6, 11.6, 15.9, 20.6, 23.1, 23.1, 19.5, 15.6, 11.7, 8.5],
+    [56, 47, 41, 31, 23, 10, 6, 6, 12, 44, 66, 70],
+    [11, 9, 8, 7, 5, 2, 1, 1, 3, 6, 9, 11],
+    [69, 68, 64, 60, 55, 48, 44, 45, 52, 61, 68, 71]
+  ]],
+  ['Istanbul', 'Turkey', 'TR', 41.01, 28.98, 4.0, [
+    [8.5, 9.1, 11.5, 16.2, 21, 25.8, 28.3, 28.6, 24.8, 19.9, 14.8, 10.7],
+    [3.3, 3.3, 4.6, 8.3, 12.7, 17.1, 19.9, 20.5, 17.1, 13.4, 8.7, 5.3],
+    [105, 78, 71, 46, 35, 34, 33, 47, 58, 99, 96, 120],
+    [15, 12, 11, 9, 7, 5, 4, 5, 7, 11, 12, 15],
+    [80, 78, 76, 74, 74, 72, 72, 73, 74, 78, 78, 79]
+  ]],
+  ['Moscow', 'Russia', 'RU', 55.76, 37.62, 2.3, [
+    [-4, -3.7, 2.6, 11.3, 18.6, 22, 24.3, 21.9, 15.7, 8.7, 0.9, -3],
+    [-9.1, -9.8, -4.4, 2.2, 7.7, 12.1, 14.4, 12.5, 7.4, 2.7, -3.3, -7.6],
+    [53, 44, 39, 37, 49, 80, 85, 82, 68, 71, 55, 52],
+    [10, 8, 9, 8, 9, 10, 11, 10, 10, 10, 10, 10],
+    [83, 80, 74, 67, 64, 70, 73, 76, 80, 82, 85, 85]
+  ]],
+  ['Reykjavik', 'Iceland', 'IS', 64.15, -21.94, 5.5, [
+    [1.9, 2.3, 3.2, 5.7, 9.4, 11.7, 13.6, 13.1, 10.1, 6.8, 3.6, 2.3],
+    [-3, -2.9, -2.1, 0.2, 3.6, 6.7, 8.4, 7.8, 5.2, 2.1, -1.2, -2.7],
+    [76, 72, 82, 58, 44, 50, 52, 62, 67, 86, 73, 79],
+    [15, 13, 15, 13, 11, 11, 11, 13, 14, 16, 14, 15],
+    [78, 77, 77, 76, 76, 79, 81, 81, 79, 78, 78, 78]
+  ]],
+  ['Dubai', 'United Arab Emirates', 'AE', 25.2, 55.27, 3.8, [
+    [24, 25.4, 28.2, 32.9, 37.6, 39.5, 40.8, 41.3, 38.9, 35.4, 30.5, 26.2],
+    [14.3, 15.4, 17.6, 21, 24.6, 27.2, 29.9, 30.2, 27.6, 23.9, 19.6, 16.1],
+    [19, 25, 22, 7, 0, 0, 0, 0, 0, 1, 3, 16],
+    [3, 3, 3, 1, 0, 0, 0, 0, 0, 0, 1, 2],
+    [65, 65, 63, 55, 53, 58, 56, 57, 60, 60, 61, 64]
+  ]],
+  ['Cairo', 'Egypt', 'EG', 30.04, 31.24, 3.4, [
+    [18.9, 20.4, 23.5, 28.3, 32, 33.9, 34.7, 34.2, 32.6, 29.2, 24.8, 20.3],
+    [9, 9.9, 11.6, 14.6, 17.7, 20.1, 22, 22.1, 20.4, 17.8, 14.1, 10.4],
+    [5, 4, 4, 1, 0, 0, 0, 0, 0, 1, 4, 6],
+    [1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 1, 1],
+    [59, 54, 53, 47, 46, 49, 58, 61, 60, 60, 61, 61]
+  ]],
+  ['Marrakech', 'Morocco', 'MA', 31.63, -7.99, 2.5, [
+    [18.4, 19.9, 22.3, 23.7, 27.7, 31.3, 36.8, 36.5, 31.5, 27.6, 22.2, 19.1],
+    [6.2, 7.7, 9.7, 11.2, 14.2, 16.6, 20.1, 20.5, 18.4, 15.1, 10.3, 7.4],
+    [32, 38, 38, 39, 24, 4, 1, 3, 7, 21, 40, 31],
+    [4, 5, 5, 5, 3, 1, 0, 1, 2, 3, 5, 4],
+    [66, 64, 62, 60, 57, 55, 48, 49, 55, 61, 65, 67]
+  ]],
+  ['Cape Town', 'South Africa', 'ZA', -33.92, 18.42, 5.0, [
+    [26.1, 26.5, 25.4, 23, 20.5, 18.5, 17.9, 18.3, 19.6, 21.7, 23.5, 25],
+    [15.7, 15.7, 14.5, 12.4, 10.3, 8.5, 7.8, 8.3, 9.6, 11.4, 13.4, 15],
+    [15, 17, 20, 41, 69, 93, 82, 77, 40, 30, 14, 17],
+    [3, 3, 4, 7, 10, 12, 11, 11, 8, 6, 4, 4],
+    [71, 72, 74, 77, 79, 80, 80, 79, 76, 73, 71, 70]
+  ]],
+  ['Nairobi', 'Kenya', 'KE', -1.29, 36.82, 3.3, [
+    [25.1, 26.4, 26, 24.3, 22.9, 21.8, 21.1, 21.8, 24.1, 25, 23.4, 23.9],
+    [12.2, 12.3, 13.6, 14.5, 13.6, 11.8, 11, 11.2, 11.5, 12.9, 13.8, 12.9],
+    [58, 40, 85, 178, 131, 35, 18, 24, 24, 51, 136, 81],
+    [5, 4, 8, 15, 13, 5, 4, 4, 3, 6, 14, 9],
+    [62, 58, 63, 71, 74, 72, 71, 69, 63, 62, 72, 69]
+  ]],
+  ['New York', 'United States', 'US', 40.71, -74.01, 4.5, [
+    [3.9, 5.3, 9.8, 16.2, 21.6, 26.3, 29.4, 28.5, 24.4, 18.2, 12.3, 6.6],
+    [-2.7, -1.8, 1.8, 7.1, 12.3, 17.5, 20.8, 20.2, 16.2, 10.1, 4.8, 0.3],
+    [92, 80, 110, 102, 94, 114, 117, 116, 109, 101, 86, 103],
+    [11, 10, 11, 11, 11, 10, 10, 10, 9, 9, 9, 11],
+    [61, 59, 58, 56, 61, 64, 64, 67, 68, 66, 64, 64]
+  ]],
+  ['Los Angeles', 'United States', 'US', 34.05, -118.24, 3.0, [
+    [20, 20.3, 20.9, 22.3, 23.1, 25.1, 27.8, 29.1, 28.3, 26.2, 22.8, 19.9],
+    [9.3, 9.9, 11.2, 12.6, 14.7, 16.6, 18.6, 19.1, 18.3, 15.7, 11.8, 9.3],
+    [79, 97, 56, 21, 7, 2, 0, 0, 4, 17, 19, 57],
+    [6, 6, 5, 3, 1, 0, 0, 0, 1, 2, 3, 5],
+    [63, 66, 70, 70, 74, 75, 75, 74, 72, 70, 65, 63]
+  ]],
+  ['San Francisco', 'United States', 'US', 37.77, -122.42, 4.5, [
+    [14.3, 16, 17.2, 18.3, 19.1, 20.9, 21.1, 21.8, 23.2, 21.8, 17.8, 14.4],
+    [7.6, 8.7, 9.3, 10, 11.1, 12.3, 13.1, 13.8, 13.8, 12.6, 10.1, 7.7],
+    [114, 114, 74, 37, 14, 4, 0, 1, 3, 28, 80, 113],
+    [11, 11, 10, 6, 3, 1, 0, 0, 1, 4, 8, 11],
+    [75, 74, 71, 70, 71, 72, 76, 76, 72, 70, 72, 76]
+  ]],
+  ['Chicago', 'United States', 'US', 41.88, -87.63, 5.0, [
+    [-0.6, 1.7, 8.2, 15.1, 21.3, 26.8, 29.1, 28, 24, 16.8, 8.8, 1.8],
+    [-8.4, -6.6, -1.7, 3.9, 9.6, 15.4, 18.8, 18.3, 13.9, 6.9, 0.6, -5.3],
+    [52, 49, 65, 95, 105, 103, 96, 105, 84, 86, 79, 58],
+    [11, 9, 11, 12, 12, 11, 10, 9, 9, 10, 10, 11],
+    [72, 71, 69, 64, 64, 66, 68, 71, 72, 69, 73, 76]
+  ]],
+  ['Miami', 'United States', 'US', 25.76, -80.19, 4.2, [
+    [24.5, 25.6, 26.6, 28.2, 30, 31.4, 32.2, 32.3, 31.4, 29.6, 27.3, 25.3],
+    [16, 17.1, 18.6, 20.9, 23.5, 24.9, 25.5, 25.6, 25.2, 23.4, 20.2, 17.6],
+    [46, 57, 74, 80, 150, 261, 171, 214, 231, 147, 90, 53],
+    [7, 6, 6, 6, 10, 16, 16, 17, 17, 12, 8, 7],
+    [72, 71, 69, 67, 70, 75, 75, 76, 77, 74, 73, 73]
+  ]],
+  ['Toronto', 'Canada', 'CA', 43.65, -79.38, 4.4, [
+    [-0.7, 0.4, 4.7, 11.5, 18.4, 23.8, 26.6, 25.5, 21, 14, 7.5, 2.1],
+    [-6.7, -5.6, -1.9, 4.1, 9.9, 14.9, 18, 17.4, 13.4, 7.1, 2.1, -3.1],
+    [62, 55, 54, 69, 75, 71, 65, 75, 74, 64, 74, 60],
+    [16, 12, 12, 12, 12, 11, 10, 10, 9, 11, 13, 15],
+    [76, 74, 70, 64, 64, 66, 67, 70, 72, 73, 76, 78]
+  ]],
+  ['Vancouver', 'Canada', 'CA', 49.28, -123.12, 3.5, [
+    [6.9, 8.2, 10.3, 13.2, 16.7, 19.6, 22.2, 22.2, 18.9, 13.5, 9.2, 6.3],
+    [1.4, 1.6, 3.4, 5.6, 8.8, 11.7, 13.7, 13.8, 10.8, 7, 3.5, 0.8],
+    [168, 104, 113, 88, 65, 53, 36, 38, 51, 120, 188, 161],
+    [19, 15, 17, 14, 12, 10, 6, 6, 8, 16, 20, 19],
+    [87, 83, 80, 77, 76, 75, 74, 76, 81, 86, 87, 87]
+  ]],
+  ['Mexico City', 'Mexico', 'MX', 19.43, -99.13, 2.5, [
+    [21.3, 23, 25.1, 26.3, 26.1, 24.4, 23, 23.2, 22.4, 22.1, 21.7, 21],
+    [6.2, 7.4, 9.4, 11, 12.2, 12.8, 12.2, 12.4, 12.1, 10.4, 8.2, 6.8],
+    [8, 7, 12, 25, 55, 134, 161, 163, 130, 56, 12, 6],
+    [2, 2, 3, 6, 11, 18, 22, 21, 18, 9, 3, 2],
+    [54, 49, 44, 46, 52, 63, 67, 68, 70, 65, 60, 57]
+  ]],
+  ['Cancun', 'Mexico', 'MX', 21.16, -86.85, 4.5, [
+    [28.1, 28.7, 29.9, 31.1, 32.3, 32.5, 32.7, 32.9, 32.4, 31, 29.6, 28.4],
+    [19.6, 19.7, 20.8, 22.4, 24, 24.8, 24.6, 24.5, 24.1, 23, 21.5, 20.2],
+    [90, 48, 43, 39, 87, 146, 86, 111, 189, 252, 104, 92],
+    [9, 6, 5, 4, 6, 11, 8, 10, 14, 15, 10, 9],
+    [80, 78, 77, 76, 78, 80, 78, 79, 81, 83, 81, 80]
+  ]],
+  ['Rio de Janeiro', 'Brazil', 'BR', -22.91, -43.17, 3.0, [
+    [30.2, 30.7, 29.9, 28.4, 26.7, 25.8, 25.4, 25.9, 25.9, 26.6, 27.9, 29.3],
+    [23.4, 23.6, 23.2, 21.6, 19.9, 18.7, 18.2, 18.7, 19.3, 20.6, 21.8, 22.8],
+    [137, 130, 136, 95, 70, 50, 43, 43, 54, 86, 103, 144],
+    [11, 9, 10, 9, 8, 6, 5, 5, 7, 10, 11, 12],
+    [79, 79, 80, 80, 80, 79, 77, 77, 79, 80, 79, 80]
+  ]],
+  ['Buenos Aires', 'Argentina', 'AR', -34.6, -58.38, 3.8, [
+    [30.4, 28.7, 26.4, 22.7, 19, 15.6, 14.9, 17.3, 18.9, 22.5, 25.7, 28.6],
+    [20.4, 19.4, 17.9, 14.3, 11.2, 8.3, 7.6, 8.8, 10.4, 13.6, 16.3, 18.7],
+    [139, 130, 141, 127, 92, 60, 75, 71, 72, 127, 119, 121],
+    [9, 8, 9, 9, 7, 7, 7, 7, 7, 10, 10, 10],
+    [64, 69, 72, 76, 77, 79, 78, 74, 70, 70, 67, 64]
+  ]],
+  ['Lima', 'Peru', 'PE', -12.05, -77.04, 3.5, [
+    [26, 26.8, 26.3, 24.3, 21.7, 19.7, 18.9, 18.5, 19.1, 20.4, 22.1, 24.2],
+    [19.6, 20.2, 19.7, 18, 16.3, 15.5, 15.1, 14.8, 14.9, 15.5, 16.6, 18.3],
+    [1, 1, 1, 0, 1, 1, 1, 1, 1, 0, 0, 0],
+    [0, 0, 0, 0, 1, 2, 3, 3, 2, 1, 0, 0],
+    [80, 79, 80, 82, 84, 85, 85, 85, 84, 83, 81, 80]
+  ]],
+  ['Tokyo', 'Japan', 'JP', 35.68, 139.69, 3.2, [
+    [9.8, 10.9, 14.2, 19.4, 23.6, 26.1, 29.9, 31.3, 27.5, 22, 16.7, 12],
+    [1.2, 2.1, 5, 9.8, 14.6, 18.5, 22.4, 23.5, 20.3, 14.8, 8.8, 3.8],
+    [52, 56, 118, 125, 138, 168, 154, 168, 210, 198, 93, 51],
+    [5, 6, 10, 10, 11, 13, 12, 9, 12, 11, 8, 5],
+    [52, 53, 57, 62, 68, 75, 77, 74, 75, 71, 64, 56]
+  ]],
+  ['Kyoto', 'Japan', 'JP', 35.01, 135.77, 1.8, [
+    [9.1, 10, 14.1, 20.1, 24.9, 28.1, 32, 33.7, 29.2, 23.4, 17.3, 11.6],
+    [1.2, 1.4, 4, 8.9, 14, 18.8, 23.2, 24.3, 20.3, 13.8, 7.8, 3.1],
+    [53, 65, 106, 117, 151, 200, 224, 154, 179, 143, 74, 58],
+    [8, 9, 11, 10, 11, 13, 13, 9, 11, 9, 7, 8],
+    [67, 65, 62, 62, 65, 71, 75, 72, 73, 72, 71, 69]
+  ]],
+  ['Seoul', 'South Korea', 'KR', 37.57, 126.98, 2.5, [
+    [1.5, 4.6, 10.6, 17.8, 23, 27.1, 28.6, 29.6, 25.8, 19.8, 11.6, 4.1],
+    [-5.9, -3.5, 1.6, 7.6, 13, 18.2, 22, 22.4, 17.3, 10.3, 3.3, -3.5],
+    [17, 25, 47, 65, 106, 133, 415, 348, 141, 53, 48, 22],
+    [6, 5, 7, 8, 9, 10, 17, 14, 9, 6, 8, 7],
+    [57, 56, 57, 56, 62, 68, 79, 76, 69, 64, 62, 59]
+  ]],
+  ['Beijing', 'China', 'CN', 39.9, 116.41, 2.6, [
+    [1.8, 5, 11.6, 20.3, 26, 30.2, 31.5, 30.2, 26, 19, 10.1, 3.3],
+    [-8.4, -5.6, 0.4, 7.9, 13.6, 18.8, 22, 20.8, 15, 7.9, -0.6, -6.5],
+    [3, 5, 9, 27, 34, 78, 185, 160, 46, 22, 9, 2],
+    [2, 2, 3, 5, 6, 10, 13, 12, 7, 5, 2, 1],
+    [43, 42, 40, 42, 49, 61, 75, 76, 67, 61, 55, 47]
+  ]],
+  ['Shanghai', 'China', 'CN', 31.23, 121.47, 3.1, [
+    [8.1, 10.1, 13.8, 19.5, 24.5, 27.8, 32.2, 31.5, 27.9, 23.1, 17.4, 11.1],
+    [1.6, 3.1, 6.4, 11.4, 16.5, 20.8, 25, 24.8, 21.2, 15.8, 9.8, 3.7],
+    [74, 59, 97, 80, 91, 183, 147, 215, 100, 55, 54, 43],
+    [10, 9, 13, 12, 11, 14, 12, 12, 10, 7, 8, 7],
+    [74, 73, 72, 72, 72, 79, 78, 78, 76, 73, 74, 71]
+  ]],
+  ['Hong Kong', 'Hong Kong', 'HK', 22.32, 114.17, 4.0, [
+    [18.7, 19.2, 21.5, 25, 28.3, 30.2, 31.4, 31.1, 30.1, 27.9, 24.4, 20.3],
+    [14.6, 15.2, 17.5, 21, 24.2, 26.2, 26.8, 26.6, 25.7, 23.8, 20.2, 16],
+    [33, 35, 81, 156, 292, 481, 382, 432, 307, 94, 39, 27],
+    [6, 9, 11, 11, 15, 19, 17, 17, 13, 6, 5, 4],
+    [74, 80, 82, 83, 83, 83, 81, 81, 78, 73, 72, 69]
+  ]],
+  ['Bangkok', 'Thailand', 'TH', 13.76, 100.5, 2.8, [
+    [32.5, 33.3, 34.3, 35.1, 34.3, 33.4, 32.9, 32.7, 32.4, 32.2, 32.2, 31.8],
+    [22.6, 24.3, 25.9, 27, 26.6, 26.3, 25.9, 25.7, 25.3, 24.9, 24, 22.4],
+    [13, 20, 42, 91, 248, 200, 196, 238, 330, 240, 53, 8],
+    [2, 2, 4, 7, 17, 17, 18, 20, 22, 16, 5, 1],
+    [67, 70, 70, 69, 74, 74, 75, 76, 79, 78, 72, 66]
+  ]],
+  ['Singapore', 'Singapore', 'SG', 1.35, 103.82, 2.8, [
+    [30.1, 31.2, 31.6, 32, 31.9, 31.5, 31, 31.1, 31.1, 31.4, 30.8, 30.1],
+    [23.3, 23.6, 24, 24.5, 24.9, 24.9, 24.6, 24.6, 24.4, 24.3, 23.9, 23.5],
+    [222, 105, 154, 166, 172, 130, 159, 176, 169, 194, 257, 288],
+    [10, 7, 10, 12, 12, 11, 12, 12, 12, 14, 17, 15],
+    [84, 82, 83, 84, 83, 81, 82, 82, 82, 83, 86, 86]
+  ]],
+  ['Denpasar', 'Indonesia', 'ID', -8.65, 115.22, 3.2, [
+    [30.5, 30.6, 30.8, 31.3, 31, 30.2, 29.5, 29.6, 30.2, 31, 31.4, 30.7],
+    [24, 24.1, 24, 24.1, 23.7, 23.1, 22.4, 22.4, 22.9, 23.6, 24, 24],
+    [345, 274, 234, 88, 93, 53, 55, 25, 47, 63, 179, 276],
+    [18, 17, 15, 8, 7, 6, 5, 4, 4, 6, 11, 16],
+    [81, 82, 81, 79, 78, 78, 76, 75, 75, 76, 78, 81]
+  ]],
+  ['Delhi', 'India', 'IN', 28.61, 77.21, 2.5, [
+    [20.5, 24.4, 30.2, 36.7, 40.1, 39.4, 35.2, 34.1, 34.2, 33.4, 28.5, 22.9],
+    [7.6, 10.5, 15.4, 21.3, 25.9, 27.7, 27.4, 26.8, 25.2, 19.8, 13.4, 8.6],
+    [19, 20, 15, 7, 20, 74, 210, 233, 124, 17, 6, 9],
+    [2, 2, 2, 1, 2, 4, 10, 11, 5, 1, 0, 1],
+    [70, 63, 51, 34, 33, 47, 70, 75, 68, 54, 58, 68]
+  ]],
+  ['Mumbai', 'India', 'IN', 19.08, 72.88, 3.0, [
+    [30.6, 31.2, 32.7, 33.2, 33.6, 32.4, 30.3, 29.8, 30.7, 33.3, 33.9, 32.6],
+    [16.8, 17.9, 21.2, 24, 26.6, 26.3, 25.3, 24.9, 24.5, 23.8, 21.4, 18.5],
+    [1, 0, 0, 1, 12, 507, 840, 546, 310, 93, 10, 2],
+    [0, 0, 0, 0, 1, 14, 22, 19, 13, 3, 1, 0],
+    [61, 62, 64, 69, 70, 78, 85, 84, 80, 71, 63, 61]
+  ]],
+  ['Sydney', 'Australia', 'AU', -33.87, 151.21, 4.5, [
+    [26, 25.8, 24.8, 22.4, 19.5, 17, 16.4, 17.8, 20.1, 22.2, 23.7, 25.2],
+    [18.9, 19, 17.6, 14.7, 11.6, 9.3, 8.1, 9, 11.1, 13.6, 15.6, 17.5],
+    [91, 131, 117, 115, 93, 132, 70, 78, 60, 71, 84, 78],
+    [8, 9, 10, 8, 8, 9, 7, 6, 7, 8, 9, 8],
+    [65, 68, 67, 65, 66, 65, 59, 54, 55, 57, 62, 63]
+  ]],
+  ['Melbourne', 'Australia', 'AU', -37.81, 144.96, 4.4, [
+    [25.9, 25.8, 23.9, 20.3, 16.7, 14.1, 13.5, 15, 17.2, 19.7, 22, 24.2],
+    [14.5, 14.9, 13.5, 11.2, 9.5, 7.6, 6.9, 7.3, 8.5, 9.9, 11.5, 13],
+    [40, 44, 37, 45, 39, 40, 35, 46, 48, 55, 60, 52],
+    [5, 5, 6, 7, 8, 8, 9, 9, 9, 9, 8, 6],
+    [47, 50, 51, 55, 61, 65, 64, 58, 54, 51, 50, 47]
+  ]],
+  ['Auckland', 'New Zealand', 'NZ', -36.85, 174.76, 5.0, [
+    [23.7, 24.2, 22.8, 20.4, 17.8, 15.5, 14.7, 15.1, 16.5, 18.1, 20, 22],
+    [15.6, 16.2, 15, 12.7, 10.7, 8.8, 7.7, 8.2, 9.6, 11, 12.6, 14.6],
+    [73, 66, 87, 99, 113, 126, 145, 118, 105, 100, 86, 93],
+    [8, 7, 9, 11, 13, 15, 16, 15, 13, 12, 10, 9],
+    [79, 80, 80, 83, 85, 88, 88, 85, 81, 79, 77, 78]
+  ]]
+];
+
+// Common alternative names mapped to the table entry
+export const CITY_ALIASES = {
+  bali: 'denpasar',
+  marrakesh: 'marrakech',
+  'new york city': 'new york',
+  nyc: 'new york',
+  rio: 'rio de janeiro',
+  'new delhi': 'delhi',
+  bombay: 'mumbai'
+};
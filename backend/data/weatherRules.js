@@ -0,0 +1,101 @@
+// Weather recommendation rules, compiled into a lookup table by WeatherService.
+// `when` holds the conditions a day must meet: numeric inputs take lt/lte/gt/gte
+// bounds (temperatures in Celsius, precipitation in mm), condition takes a list of
+// OpenWeather main conditions. Matching rules contribute their recommendations in
+// table order.
+export const WEATHER_RULES = [
+  // Temperature
+  {
+    when: { temperature: { lt: 0 } },
+    recommendations: [
+      {
+        type: 'clothing',
+        message: 'Very cold weather - wear heavy winter clothing, including warm layers, gloves, and waterproof boots.'
+      },
+      {
+        type: 'activity',
+        message: 'Consider indoor activities like museums, shopping centers, or cozy cafes.'
+      }
+    ]
+  },
+  {
+    when: { temperature: { gte: 0, lt: 10 } },
+    recommendations: [{
+      type: 'clothing',
+      message: 'Cold weather - dress in warm layers, bring a jacket and comfortable walking shoes.'
+    }]
+  },
+  {
+    when: { temperature: { gte: 10, lt: 20 } },
+    recommendations: [{
+      type: 'clothing',
+      message: 'Cool weather - light layers recommended, bring a light jacket for evening.'
+    }]
+  },
+  {
+    when: { temperature: { gte: 20, lt: 30 } },
+    recommendations: [{
+      type: 'clothing',
+      message: 'Pleasant weather - comfortable clothing, light layers for temperature changes.'
+    }]
+  },
+  {
+    when: { temperature: { gte: 30 } },
+    recommendations: [
+      {
+        type: 'clothing',
+        message: 'Hot weather - wear light, breathable clothing, hat, and sunscreen.'
+      },
+      {
+        type: 'activity',
+        message: 'Stay hydrated and consider indoor activities during peak heat hours (12-4 PM).'
+      }
+    ]
+  },
+
+  // Precipitation
+  {
+    when: { precipitation: { gt: 5 } },
+    recommendations: [{
+      type: 'weather',
+      message: 'Heavy rain expected - bring umbrella, waterproof clothing, and plan indoor activities.'
+    }]
+  },
+  {
+    when: { precipitation: { gt: 0, lte: 5 } },
+    recommendations: [{
+      type: 'weather',
+      message: 'Light rain possible - bring umbrella or light rain jacket.'
+    }]
+  },
+
+  // Conditions
+  {
+    when: { condition: ['Snow'] },
+    recommendations: [{
+      type: 'activity',
+      message: 'Snowy conditions - great for winter sports but be cautious of slippery surfaces.'
+    }]
+  },
+  {
+    when: { condition: ['Clear'] },
+    recommendations: [{
+      type: 'activity',
+      message: 'Perfect weather for outdoor activities, sightseeing, and photography.'
+    }]
+  },
+  {
+    when: { condition: ['Clouds'] },
+    recommendations: [{
+      type: 'activity',
+      message: 'Overcast but good for walking tours and outdoor activities.'
+    }]
+  },
+  {
+    when: { condition: ['Thunderstorm'] },
+    recommendations: [{
+      type: 'safety',
+      message: 'Thunderstorm conditions - avoid outdoor activities and seek shelter.'
+    }]
+  }
+];
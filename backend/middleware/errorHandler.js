@@ -105,6 +105,11 @@ export const errorHandler = (err, req, res, next) => {
     };
   }
 
+  // Overload and open-circuit errors tell the client when to retry
+  if (err.retryAfter) {
+    res.set('Retry-After', String(Math.max(1, Math.ceil(err.retryAfter / 1000))));
+  }
+
   res.status(error.statusCode || 500).json({
     success: false,
     message: error.message || 'Server Error',
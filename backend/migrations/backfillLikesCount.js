@@ -0,0 +1,41 @@
+// Backfill Trip.likesCount from the likes array and replace the { isPublic, likes }
+// index with { isPublic, likesCount, createdAt }. Safe to run more than once.
+// Run with: npm run migrate:likes-count
+import mongoose from 'mongoose';
+import dotenv from 'dotenv';
+import Trip from '../models/Trip.js';
+
+dotenv.config();
+
+const OLD_INDEX = 'isPublic_1_likes_-1';
+
+const likesSize = { $size: { $ifNull: ['$likes', []] } };
+
+const run = async () => {
+  await mongoose.connect(process.env.MONGODB_URI || 'mongodb://localhost:27017/travel-assistant');
+
+  // Only trips whose count is missing or wrong are rewritten
+  const result = await Trip.updateMany(
+    { $expr: { $ne: ['$likesCount', likesSize] } },
+    [{ $set: { likesCount: likesSize } }],
+    { timestamps: false }
+  );
+  console.log(`Backfilled likesCount on ${result.modifiedCount} trips`);
+
+  try {
+    await Trip.collection.dropIndex(OLD_INDEX);
+    console.log(`Dropped index ${OLD_INDEX}`);
+  } catch (error) {
+    if (error.codeName !== 'IndexNotFound') throw error;
+  }
+
+  await Trip.createIndexes();
+  console.log('Trip indexes are up to date');
+};
+
+run()
+  .catch(error => {
+    console.error('Migration failed:', error);
+    process.exitCode = 1;
+  })
+  .finally(() => mongoose.disconnect());
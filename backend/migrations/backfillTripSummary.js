@@ -0,0 +1,23 @@
+// Compute Trip.summary (total cost, activity and completed counts) for existing trips.
+// The summary is recomputed inside the database, so no itinerary is loaded. Safe to
+// run more than once. Run with: npm run migrate:trip-summary
+import mongoose from 'mongoose';
+import dotenv from 'dotenv';
+import Trip from '../models/Trip.js';
+
+dotenv.config();
+
+const run = async () => {
+  await mongoose.connect(process.env.MONGODB_URI || 'mongodb://localhost:27017/travel-assistant');
+
+  // Trips whose stored summary is already right are matched but not rewritten
+  const result = await Trip.refreshSummaries({});
+  console.log(`Updated the summary of ${result.modifiedCount} of ${result.matchedCount} trips`);
+};
+
+run()
+  .catch(error => {
+    console.error('Migration failed:', error);
+    process.exitCode = 1;
+  })
+  .finally(() => mongoose.disconnect());
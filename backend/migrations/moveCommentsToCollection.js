@@ -0,0 +1,68 @@
+// Move comments embedded in trips into the comments collection and set each trip's
+// commentsCount. Comments keep their _id, so the migration is safe to run more than once.
+// Run with: npm run migrate:comments
+import mongoose from 'mongoose';
+import dotenv from 'dotenv';
+import Trip from '../models/Trip.js';
+import Comment from '../models/Comment.js';
+
+dotenv.config();
+
+const run = async () => {
+  await mongoose.connect(process.env.MONGODB_URI || 'mongodb://localhost:27017/travel-assistant');
+  await Comment.createIndexes();
+
+  // The embedded array is no longer in the Trip schema, so read it from the raw collection
+  const cursor = Trip.collection.find(
+    { 'comments.0': { $exists: true } },
+    { projection: { comments: 1 } }
+  );
+
+  let trips = 0;
+  let moved = 0;
+
+  for await (const trip of cursor) {
+    const comments = trip.comments
+      .filter(comment => comment.user && comment.text)
+      .map(comment => ({
+        _id: comment._id,
+        trip: trip._id,
+        user: comment.user,
+        text: comment.text,
+        createdAt: comment.createdAt || trip._id.getTimestamp()
+      }));
+
+    try {
+      const inserted = await Comment.collection.insertMany(comments, { ordered: false });
+      moved += inserted.insertedCount;
+    } catch (error) {
+      // Comments copied by an earlier, interrupted run
+      const writeErrors = [].concat(error.writeErrors || []);
+      if (writeErrors.length === 0 || !writeErrors.every(writeError => writeError.code === 11000)) throw error;
+      moved += error.result?.insertedCount ?? 0;
+    }
+
+    await Trip.collection.updateOne(
+      { _id: trip._id },
+      {
+        $set: { commentsCount: await Comment.countDocuments({ trip: trip._id }) },
+        $unset: { comments: '' }
+      }
+    );
+    trips++;
+  }
+
+  const { modifiedCount } = await Trip.collection.updateMany(
+    { commentsCount: { $exists: false } },
+    { $set: { commentsCount: 0 } }
+  );
+
+  console.log(`Moved ${moved} comments from ${trips} trips; set commentsCount on ${modifiedCount} trips without comments`);
+};
+
+run()
+  .catch(error => {
+    console.error('Migration failed:', error);
+    process.exitCode = 1;
+  })
+  .finally(() => mongoose.disconnect());
@@ -0,0 +1,31 @@
+// Replace the discover feed index with one that ends in _id, so keyset pages can seek
+// straight to their first trip. Safe to run more than once.
+// Run with: npm run migrate:trip-indexes
+import mongoose from 'mongoose';
+import dotenv from 'dotenv';
+import Trip from '../models/Trip.js';
+
+dotenv.config();
+
+const OLD_INDEX = 'isPublic_1_likesCount_-1_createdAt_-1';
+
+const run = async () => {
+  await mongoose.connect(process.env.MONGODB_URI || 'mongodb://localhost:27017/travel-assistant');
+
+  try {
+    await Trip.collection.dropIndex(OLD_INDEX);
+    console.log(`Dropped index ${OLD_INDEX}`);
+  } catch (error) {
+    if (error.codeName !== 'IndexNotFound') throw error;
+  }
+
+  await Trip.createIndexes();
+  console.log('Trip indexes are up to date');
+};
+
+run()
+  .catch(error => {
+    console.error('Migration failed:', error);
+    process.exitCode = 1;
+  })
+  .finally(() => mongoose.disconnect());
@@ -0,0 +1,28 @@
+import mongoose from 'mongoose';
+
+// Shared cache tier: entries are removed by MongoDB's TTL monitor once expiresAt passes
+const cacheEntrySchema = new mongoose.Schema({
+  namespace: {
+    type: String,
+    required: true
+  },
+  key: {
+    type: String,
+    required: true
+  },
+  value: mongoose.Schema.Types.Mixed,
+  expiresAt: {
+    type: Date,
+    required: true
+  }
+}, {
+  timestamps: true,
+  minimize: false
+});
+
+cacheEntrySchema.index({ namespace: 1, key: 1 }, { unique: true });
+cacheEntrySchema.index({ expiresAt: 1 }, { expireAfterSeconds: 0 });
+
+const CacheEntry = mongoose.model('CacheEntry', cacheEntrySchema);
+
+export default CacheEntry;
@@ -0,0 +1,69 @@
+import mongoose from 'mongoose';
+import User from './User.js';
+
+const commentSchema = new mongoose.Schema({
+  trip: {
+    type: mongoose.Schema.Types.ObjectId,
+    ref: 'Trip',
+    required: true
+  },
+  user: {
+    type: mongoose.Schema.Types.ObjectId,
+    ref: 'User',
+    required: true
+  },
+  text: {
+    type: String,
+    required: [true, 'Comment text is required'],
+    trim: true
+  },
+  createdAt: {
+    type: Date,
+    default: Date.now
+  }
+});
+
+// Newest-first pages of one trip's comments; _id breaks ties between equal timestamps
+commentSchema.index({ trip: 1, createdAt: -1, _id: -1 });
+
+// Static method to get one page of a trip's comments, newest first, with each author's
+// name and avatar resolved in the same query. after is the { createdAt, _id } of the last
+// comment on the previous page.
+commentSchema.statics.findPage = async function(tripId, { after = null, limit = 20 } = {}) {
+  const match = { trip: new mongoose.Types.ObjectId(tripId) };
+  if (after) {
+    match.$or = [
+      { createdAt: { $lt: after.createdAt } },
+      { createdAt: after.createdAt, _id: { $lt: after._id } }
+    ];
+  }
+
+  const comments = await this.aggregate([
+    { $match: match },
+    { $sort: { createdAt: -1, _id: -1 } },
+    { $limit: limit + 1 },
+    {
+      $lookup: {
+        from: User.collection.collectionName,
+        let: { userId: '$user' },
+        pipeline: [
+          { $match: { $expr: { $eq: ['$_id', '$$userId'] } } },
+          { $project: { name: 1, avatar: 1 } }
+        ],
+        as: 'user'
+      }
+    },
+    // Authors who deleted their account come back as null
+    { $set: { user: { $ifNull: [{ $arrayElemAt: ['$user', 0] }, null] } } },
+    { $project: { trip: 0, __v: 0 } }
+  ]);
+
+  return {
+    comments: comments.slice(0, limit),
+    hasMore: comments.length > limit
+  };
+};
+
+const Comment = mongoose.model('Comment', commentSchema);
+
+export default Comment;
@@ -0,0 +1,32 @@
+import mongoose from 'mongoose';
+
+// Durable queue entry used by the 'mongo' job queue driver
+const jobSchema = new mongoose.Schema({
+  queue: {
+    type: String,
+    required: true
+  },
+  payload: mongoose.Schema.Types.Mixed,
+  status: {
+    type: String,
+    enum: ['queued', 'running', 'completed', 'failed'],
+    default: 'queued'
+  },
+  attempts: {
+    type: Number,
+    default: 0
+  },
+  lockedUntil: Date,
+  lastError: String,
+  finishedAt: Date
+}, {
+  timestamps: true
+});
+
+jobSchema.index({ queue: 1, status: 1, createdAt: 1 });
+// Finished jobs are kept for a week for debugging
+jobSchema.index({ finishedAt: 1 }, { expireAfterSeconds: 7 * 24 * 60 * 60 });
+
+const Job = mongoose.model('Job', jobSchema);
+
+export default Job;
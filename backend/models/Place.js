@@ -0,0 +1,53 @@
+import mongoose from 'mongoose';
+
+const PLACE_TTL_DAYS = parseInt(process.env.PLACES_CACHE_TTL_DAYS) || 7;
+
+// Google place data by placeId: search results for the local place index and full
+// details for the details cache. Documents expire PLACES_CACHE_TTL_DAYS after refreshedAt.
+const placeSchema = new mongoose.Schema({
+  placeId: {
+    type: String,
+    required: true
+  },
+  name: String,
+  location: {
+    type: {
+      type: String,
+      enum: ['Point']
+    },
+    // [longitude, latitude]. No default: an empty array would be inserted for places
+    // upserted without a location (details-only) and rejected by the 2dsphere index
+    coordinates: {
+      type: [Number],
+      default: undefined
+    }
+  },
+  types: [String],
+  rating: Number,
+  priceLevel: Number,
+  tags: [String], // Searches that returned the place, e.g. 'cuisine:italian'
+  summary: mongoose.Schema.Types.Mixed, // PlacesService.formatPlacesResponse entry
+  details: mongoose.Schema.Types.Mixed, // PlacesService.formatPlaceDetails output
+  notFound: {
+    type: Boolean,
+    default: false
+  },
+  detailsRefreshedAt: Date,
+  refreshedAt: {
+    type: Date,
+    required: true
+  }
+}, {
+  minimize: false
+});
+
+placeSchema.index({ placeId: 1 }, { unique: true });
+placeSchema.index({ location: '2dsphere' });
+placeSchema.index({ types: 1 });
+placeSchema.index({ rating: -1 });
+placeSchema.index({ priceLevel: 1 });
+placeSchema.index({ refreshedAt: 1 }, { expireAfterSeconds: PLACE_TTL_DAYS * 24 * 60 * 60 });
+
+const Place = mongoose.model('Place', placeSchema);
+
+export default Place;
@@ -0,0 +1,32 @@
+import mongoose from 'mongoose';
+
+const COVERAGE_TTL_HOURS = parseInt(process.env.PLACES_COVERAGE_TTL_HOURS) || 24;
+
+// A search whose results are in the places collection, keyed like the search itself
+// (e.g. 'nearby|u09tv|restaurant'), with the circle it covered. Records expire
+// PLACES_COVERAGE_TTL_HOURS after refreshedAt.
+const placeCoverageSchema = new mongoose.Schema({
+  key: {
+    type: String,
+    required: true
+  },
+  center: {
+    lat: Number,
+    lng: Number
+  },
+  radius: {
+    type: Number,
+    required: true
+  },
+  refreshedAt: {
+    type: Date,
+    required: true
+  }
+});
+
+placeCoverageSchema.index({ key: 1 }, { unique: true });
+placeCoverageSchema.index({ refreshedAt: 1 }, { expireAfterSeconds: COVERAGE_TTL_HOURS * 60 * 60 });
+
+const PlaceCoverage = mongoose.model('PlaceCoverage', placeCoverageSchema);
+
+export default PlaceCoverage;
@@ -149,7 +149,9 @@ const tripSchema = new mongoose.Schema({
       longitude: Number
     },
     timezone: String,
-    placeId: String // Google Places ID
+    placeId: String, // Google Places ID
+    owmCityId: Number, // OpenWeather city ID
+    countryCode: String // ISO 3166 alpha-2
   },
   startDate: {
     type: Date,
@@ -243,23 +245,58 @@ const tripSchema = new mongoose.Schema({
     type: mongoose.Schema.Types.ObjectId,
     ref: 'User'
   }],
-  comments: [{
-    user: {
-      type: mongoose.Schema.Types.ObjectId,
-      ref: 'User'
+  // Kept equal to likes.length by the like route, so feeds can sort and report
+  // popularity without reading the likes array
+  likesCount: {
+    type: Number,
+    default: 0,
+    min: 0
+  },
+  // Comments live in the comments collection; this is kept equal to their number
+  commentsCount: {
+    type: Number,
+    default: 0,
+    min: 0
+  },
+  // Totals over the itinerary, kept up to date on every write so trip lists can show
+  // cost and progress without loading the itinerary
+  summary: {
+    totalCost: {
+      type: Number,
+      default: 0
     },
-    text: String,
-    createdAt: {
-      type: Date,
-      default: Date.now
+    activityCount: {
+      type: Number,
+      default: 0
+    },
+    completedCount: {
+      type: Number,
+      default: 0
     }
-  }],
+  },
   tags: [String],
   aiGenerated: {
     type: Boolean,
     default: true
   },
   generationPrompt: String, // Store the original prompt used for AI generation
+  generation: {
+    jobId: String,
+    status: {
+      type: String,
+      enum: ['generating', 'completed', 'failed'],
+      default: 'completed'
+    },
+    step: String, // queued, itinerary, weather, done
+    progress: {
+      type: Number,
+      default: 100
+    },
+    error: String,
+    aiInfo: mongoose.Schema.Types.Mixed,
+    startedAt: Date,
+    completedAt: Date
+  },
   lastModified: {
     type: Date,
     default: Date.now
@@ -309,15 +346,65 @@ tripSchema.virtual('progressPercentage').get(function() {
 tripSchema.index({ user: 1, startDate: -1 });
 tripSchema.index({ destination: 1 });
 tripSchema.index({ status: 1 });
-tripSchema.index({ isPublic: 1, likes: -1 });
+// Weather prefetch: active trips that have not ended yet (WeatherPrefetchService.findUpcomingTrips)
+tripSchema.index({ status: 1, endDate: 1, startDate: 1 });
+// Trip list and discover sort orders, ending in _id for keyset pagination
+tripSchema.index({ user: 1, createdAt: -1, _id: -1 });
+tripSchema.index({ user: 1, status: 1, createdAt: -1, _id: -1 });
+tripSchema.index({ isPublic: 1, likesCount: -1, createdAt: -1, _id: -1 });
 tripSchema.index({ createdAt: -1 });
 
-// Pre-save middleware to calculate duration
+// Fields toSummary reads; list queries select only these
+const SUMMARY_FIELDS = 'title destination startDate endDate duration status summary';
+
+// The stored summary of an itinerary, counted the same way as the virtuals above
+const summarizeItinerary = (itinerary = []) => {
+  const summary = { totalCost: 0, activityCount: 0, completedCount: 0 };
+
+  itinerary.forEach(day => {
+    (day.activities || []).forEach(activity => {
+      summary.activityCount++;
+      if (activity.completed) summary.completedCount++;
+      if (activity.estimatedCost && activity.estimatedCost.max) {
+        summary.totalCost += Number(activity.estimatedCost.max) || 0;
+      }
+    });
+  });
+
+  return summary;
+};
+
+// summarizeItinerary as an aggregation expression, for updates that never load the trip
+const SUMMARY_EXPRESSION = {
+  $let: {
+    vars: {
+      activities: {
+        $reduce: {
+          input: { $ifNull: ['$itinerary', []] },
+          initialValue: [],
+          in: { $concatArrays: ['$$value', { $ifNull: ['$$this.activities', []] }] }
+        }
+      }
+    },
+    in: {
+      totalCost: { $sum: '$$activities.estimatedCost.max' },
+      activityCount: { $size: '$$activities' },
+      completedCount: {
+        $size: { $filter: { input: '$$activities', cond: { $eq: ['$$this.completed', true] } } }
+      }
+    }
+  }
+};
+
+// Pre-save middleware to calculate duration and the itinerary summary
 tripSchema.pre('save', function(next) {
   if (this.startDate && this.endDate) {
     const diffTime = new Date(this.endDate) - new Date(this.startDate);
     this.duration = Math.ceil(diffTime / (1000 * 60 * 60 * 24));
   }
+  if (this.isNew || this.isModified('itinerary')) {
+    this.summary = summarizeItinerary(this.itinerary);
+  }
   this.lastModified = new Date();
   next();
 });
@@ -326,26 +413,56 @@ tripSchema.pre('save', function(next) {
 tripSchema.statics.findPublicTrips = function(limit = 10) {
   return this.find({ isPublic: true })
     .populate('user', 'name avatar')
-    .sort({ likes: -1, createdAt: -1 })
+    .sort({ likesCount: -1, createdAt: -1 })
     .limit(limit);
 };
 
-// Method to get trip summary
-tripSchema.methods.getSummary = function() {
+// Static method to find trip summaries as plain objects, without loading itineraries.
+// fields adds to the summary fields, e.g. 'user likesCount'.
+tripSchema.statics.findSummaries = function(query, fields = '') {
+  return this.find(query)
+    .select(`${SUMMARY_FIELDS} ${fields}`)
+    .lean();
+};
+
+tripSchema.statics.summarizeItinerary = summarizeItinerary;
+
+// Static method to recompute the stored summary of matching trips inside the database,
+// for itinerary updates that bypass save()
+tripSchema.statics.refreshSummaries = function(filter) {
+  return this.updateMany(filter, [{ $set: { summary: SUMMARY_EXPRESSION } }], { timestamps: false });
+};
+
+// Static method to build a trip summary from a document or a findSummaries result
+tripSchema.statics.toSummary = function(trip) {
+  const { totalCost = 0, activityCount = 0, completedCount = 0 } = trip.summary || {};
+
+  let progressPercentage = activityCount > 0 ? Math.round((completedCount / activityCount) * 100) : 0;
+  if (trip.status === 'completed') progressPercentage = 100;
+  if (trip.status === 'planning') progressPercentage = 0;
+
+  const diffDays = Math.ceil((new Date(trip.startDate) - new Date()) / (1000 * 60 * 60 * 24));
+
   return {
-    _id: this._id,
-    title: this.title,
-    destination: this.destination,
-    startDate: this.startDate,
-    endDate: this.endDate,
-    duration: this.duration,
-    status: this.status,
-    totalCost: this.totalCost,
-    progressPercentage: this.progressPercentage,
-    daysRemaining: this.daysRemaining
+    _id: trip._id,
+    title: trip.title,
+    destination: trip.destination,
+    startDate: trip.startDate,
+    endDate: trip.endDate,
+    duration: trip.duration,
+    status: trip.status,
+    totalCost,
+    activityCount,
+    progressPercentage,
+    daysRemaining: diffDays > 0 ? diffDays : 0
   };
 };
 
+// Method to get trip summary
+tripSchema.methods.getSummary = function() {
+  return this.constructor.toSummary(this);
+};
+
 const Trip = mongoose.model('Trip', tripSchema);
 
 export default Trip;
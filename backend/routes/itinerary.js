@@ -2,10 +2,25 @@ import express from 'express';
 import Trip from '../models/Trip.js';
 import aiService from '../services/aiService.js';
 import placesService from '../services/placesService.js';
+import itineraryService from '../services/itineraryService.js';
 import { asyncHandler } from '../middleware/errorHandler.js';
 
 const router = express.Router();
 
+// Day numbers start at 1; null for anything that is not a day number
+const parseDayIndex = (dayNumber) => {
+  const dayIndex = Number(dayNumber) - 1;
+  return Number.isInteger(dayIndex) && dayIndex >= 0 ? dayIndex : null;
+};
+
+const invalidDay = (res) => res.status(400).json({
+  success: false,
+  message: 'Invalid day number'
+});
+
+// Each route below is a single update scoped to the trip owner; a trip, day or activity
+// that does not exist is reported by itineraryService as a 404 or 400 AppError.
+
 // @desc    Add activity to a specific day
 // @route   POST /api/itinerary/:tripId/days/:dayNumber/activities
 // @access  Private
@@ -13,25 +28,8 @@ router.post('/:tripId/days/:dayNumber/activities', asyncHandler(async (req, res)
   const { tripId, dayNumber } = req.params;
   const activityData = req.body;
 
-  const trip = await Trip.findOne({
-    _id: tripId,
-    user: req.user._id
-  });
-
-  if (!trip) {
-    return res.status(404).json({
-      success: false,
-      message: 'Trip not found'
-    });
-  }
-
-  const dayIndex = parseInt(dayNumber) - 1;
-  if (dayIndex < 0 || dayIndex >= trip.itinerary.length) {
-    return res.status(400).json({
-      success: false,
-      message: 'Invalid day number'
-    });
-  }
+  const dayIndex = parseDayIndex(dayNumber);
+  if (dayIndex === null) return invalidDay(res);
 
   // Validate required activity fields
   if (!activityData.name) {
@@ -41,7 +39,7 @@ router.post('/:tripId/days/:dayNumber/activities', asyncHandler(async (req, res)
     });
   }
 
-  const newActivity = {
+  const newActivity = await itineraryService.addActivity(tripId, req.user._id, dayIndex, {
     name: activityData.name,
     description: activityData.description || '',
     category: activityData.category || 'other',
@@ -53,10 +51,7 @@ router.post('/:tripId/days/:dayNumber/activities', asyncHandler(async (req, res)
     bookingInfo: activityData.bookingInfo || { isBookingRequired: false },
     notes: activityData.notes || '',
     completed: false
-  };
-
-  trip.itinerary[dayIndex].activities.push(newActivity);
-  await trip.save();
+  });
 
   res.status(201).json({
     success: true,
@@ -70,49 +65,12 @@ router.post('/:tripId/days/:dayNumber/activities', asyncHandler(async (req, res)
 // @access  Private
 router.put('/:tripId/days/:dayNumber/activities/:activityId', asyncHandler(async (req, res) => {
   const { tripId, dayNumber, activityId } = req.params;
-  const updates = req.body;
 
-  const trip = await Trip.findOne({
-    _id: tripId,
-    user: req.user._id
-  });
+  const dayIndex = parseDayIndex(dayNumber);
+  if (dayIndex === null) return invalidDay(res);
 
-  if (!trip) {
-    return res.status(404).json({
-      success: false,
-      message: 'Trip not found'
-    });
-  }
-
-  const dayIndex = parseInt(dayNumber) - 1;
-  if (dayIndex < 0 || dayIndex >= trip.itinerary.length) {
-    return res.status(400).json({
-      success: false,
-      message: 'Invalid day number'
-    });
-  }
-
-  const activity = trip.itinerary[dayIndex].activities.id(activityId);
-  if (!activity) {
-    return res.status(404).json({
-      success: false,
-      message: 'Activity not found'
-    });
-  }
-
-  // Update allowed fields
-  const allowedFields = [
-    'name', 'description', 'category', 'location', 'duration',
-    'estimatedCost', 'timeSlot', 'priority', 'bookingInfo', 'notes', 'completed'
-  ];
-
-  allowedFields.forEach(field => {
-    if (updates[field] !== undefined) {
-      activity[field] = updates[field];
-    }
-  });
-
-  await trip.save();
+  // Only allowed fields are applied
+  const activity = await itineraryService.updateActivity(tripId, req.user._id, dayIndex, activityId, req.body);
 
   res.json({
     success: true,
@@ -127,36 +85,10 @@ router.put('/:tripId/days/:dayNumber/activities/:activityId', asyncHandler(async
 router.delete('/:tripId/days/:dayNumber/activities/:activityId', asyncHandler(async (req, res) => {
   const { tripId, dayNumber, activityId } = req.params;
 
-  const trip = await Trip.findOne({
-    _id: tripId,
-    user: req.user._id
-  });
-
-  if (!trip) {
-    return res.status(404).json({
-      success: false,
-      message: 'Trip not found'
-    });
-  }
-
-  const dayIndex = parseInt(dayNumber) - 1;
-  if (dayIndex < 0 || dayIndex >= trip.itinerary.length) {
-    return res.status(400).json({
-      success: false,
-      message: 'Invalid day number'
-    });
-  }
-
-  const activity = trip.itinerary[dayIndex].activities.id(activityId);
-  if (!activity) {
-    return res.status(404).json({
-      success: false,
-      message: 'Activity not found'
-    });
-  }
+  const dayIndex = parseDayIndex(dayNumber);
+  if (dayIndex === null) return invalidDay(res);
 
-  trip.itinerary[dayIndex].activities.pull(activityId);
-  await trip.save();
+  await itineraryService.deleteActivity(tripId, req.user._id, dayIndex, activityId);
 
   res.json({
     success: true,
@@ -171,10 +103,11 @@ router.get('/:tripId/suggestions', asyncHandler(async (req, res) => {
   const { tripId } = req.params;
   const { day } = req.query;
 
+  // Only what suggestions need; the likes array can be large
   const trip = await Trip.findOne({
     _id: tripId,
     user: req.user._id
-  });
+  }).select('destination preferences itinerary.activities.name itinerary.activities.category');
 
   if (!trip) {
     return res.status(404).json({
@@ -212,11 +145,7 @@ router.get('/:tripId/suggestions', asyncHandler(async (req, res) => {
   } catch (error) {
     // Fallback to Places API if AI fails
     try {
-      const places = await placesService.getPopularAttractions(
-        trip.destination.city,
-        trip.destination.country,
-        10
-      );
+      const places = await placesService.getPopularAttractionsFor(trip.destination, 10);
 
       const suggestions = places.map(place => ({
         name: place.name,
@@ -258,53 +187,15 @@ router.put('/:tripId/days/:dayNumber/reorder', asyncHandler(async (req, res) =>
     });
   }
 
-  const trip = await Trip.findOne({
-    _id: tripId,
-    user: req.user._id
-  });
-
-  if (!trip) {
-    return res.status(404).json({
-      success: false,
-      message: 'Trip not found'
-    });
-  }
+  const dayIndex = parseDayIndex(dayNumber);
+  if (dayIndex === null) return invalidDay(res);
 
-  const dayIndex = parseInt(dayNumber) - 1;
-  if (dayIndex < 0 || dayIndex >= trip.itinerary.length) {
-    return res.status(400).json({
-      success: false,
-      message: 'Invalid day number'
-    });
-  }
-
-  const day = trip.itinerary[dayIndex];
-  const currentActivities = day.activities;
-
-  // Validate all activity IDs exist
-  const validIds = activityIds.every(id => 
-    currentActivities.find(activity => activity._id.toString() === id)
-  );
-
-  if (!validIds || activityIds.length !== currentActivities.length) {
-    return res.status(400).json({
-      success: false,
-      message: 'Invalid activity IDs or missing activities'
-    });
-  }
-
-  // Reorder activities
-  const reorderedActivities = activityIds.map(id => 
-    currentActivities.find(activity => activity._id.toString() === id)
-  );
-
-  day.activities = reorderedActivities;
-  await trip.save();
+  const activities = await itineraryService.reorderActivities(tripId, req.user._id, dayIndex, activityIds);
 
   res.json({
     success: true,
     message: 'Activities reordered successfully',
-    data: day.activities
+    data: activities
   });
 }));
 
@@ -315,32 +206,10 @@ router.put('/:tripId/days/:dayNumber', asyncHandler(async (req, res) => {
   const { tripId, dayNumber } = req.params;
   const { theme, notes } = req.body;
 
-  const trip = await Trip.findOne({
-    _id: tripId,
-    user: req.user._id
-  });
-
-  if (!trip) {
-    return res.status(404).json({
-      success: false,
-      message: 'Trip not found'
-    });
-  }
-
-  const dayIndex = parseInt(dayNumber) - 1;
-  if (dayIndex < 0 || dayIndex >= trip.itinerary.length) {
-    return res.status(400).json({
-      success: false,
-      message: 'Invalid day number'
-    });
-  }
-
-  const day = trip.itinerary[dayIndex];
-
-  if (theme !== undefined) day.theme = theme;
-  if (notes !== undefined) day.notes = notes;
+  const dayIndex = parseDayIndex(dayNumber);
+  if (dayIndex === null) return invalidDay(res);
 
-  await trip.save();
+  const day = await itineraryService.updateDayInfo(tripId, req.user._id, dayIndex, { theme, notes });
 
   res.json({
     success: true,
@@ -0,0 +1,83 @@
+import express from 'express';
+import rateLimit from 'express-rate-limit';
+import { pipeline } from 'stream/promises';
+import placesService from '../services/placesService.js';
+import { asyncHandler } from '../middleware/errorHandler.js';
+
+const router = express.Router();
+
+// Google serves photos at most 1600px wide
+const MAX_PHOTO_WIDTH = 1600;
+const PHOTO_REFERENCE_PATTERN = /^[\w-]{10,2048}$/;
+
+const photoWidth = (req) => parseInt(req.query.maxwidth) || 400;
+
+// Photos already on disk are served without counting against any limit (the global
+// limiter skips this route). Downloads spend Google quota, so they get a stricter limit.
+const downloadLimiter = rateLimit({
+  windowMs: (process.env.RATE_LIMIT_WINDOW || 15) * 60 * 1000,
+  max: parseInt(process.env.PLACE_PHOTO_RATE_LIMIT_MAX) || 30,
+  skip: (req) => placesService.hasCachedPhoto(req.params.ref, photoWidth(req)),
+  message: {
+    success: false,
+    message: 'Too many new photos requested from this IP, please try again later.'
+  },
+  standardHeaders: true,
+  legacyHeaders: false
+});
+
+// @desc    Get a place photo, cached on disk after the first request
+// @route   GET /api/places/photo/:ref?maxwidth=400
+// @access  Public (requested by <img> tags, which cannot send a bearer token)
+router.get('/:ref', downloadLimiter, asyncHandler(async (req, res) => {
+  const { ref } = req.params;
+  const maxWidth = photoWidth(req);
+
+  if (!PHOTO_REFERENCE_PATTERN.test(ref)) {
+    return res.status(400).json({
+      success: false,
+      message: 'Invalid photo reference'
+    });
+  }
+
+  if (maxWidth < 1 || maxWidth > MAX_PHOTO_WIDTH) {
+    return res.status(400).json({
+      success: false,
+      message: `maxwidth must be between 1 and ${MAX_PHOTO_WIDTH}`
+    });
+  }
+
+  let photo;
+  try {
+    photo = await placesService.openPhoto(ref, maxWidth);
+  } catch (error) {
+    return res.status(error.statusCode || 502).json({
+      success: false,
+      message: error.message
+    });
+  }
+
+  // The ETag is the hash of the bytes, so a photo never changes under its ETag
+  res.set({
+    'Content-Type': photo.contentType,
+    'Cache-Control': 'public, max-age=31536000, immutable',
+    'Cross-Origin-Resource-Policy': 'cross-origin',
+    ETag: `"${photo.hash}"`
+  });
+
+  if (req.fresh) {
+    photo.stream.destroy();
+    return res.status(304).end();
+  }
+
+  res.set('Content-Length', photo.size);
+
+  try {
+    await pipeline(photo.stream, res);
+  } catch (error) {
+    // Client went away mid-photo; nothing left to send
+    if (error.code !== 'ERR_STREAM_PREMATURE_CLOSE') console.warn('Place photo stream failed:', error.message);
+  }
+}));
+
+export default router;
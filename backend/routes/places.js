@@ -1,39 +1,76 @@
 import express from 'express';
 import placesService from '../services/placesService.js';
 import { asyncHandler } from '../middleware/errorHandler.js';
+import { decodeCursor } from '../utils/cursor.js';
+import { openNdjsonStream } from '../utils/ndjson.js';
 
 const router = express.Router();
 
-// @desc    Search for places by text query
-// @route   GET /api/places/search
+const MAX_BATCH_PLACES = 100;
+
+// Google returns at most three pages (60 results) for a text search
+const MAX_STREAMED_PAGES = 3;
+
+// @desc    Search for places by text query, a page at a time
+// @route   GET /api/places/search (?cursor= for the next page, ?stream=true for NDJSON)
 // @access  Private
 router.get('/search', asyncHandler(async (req, res) => {
-  const { q: query, lat, lng, radius = 10000, type } = req.query;
+  const { q: query, lat, lng, radius = 10000, type, cursor } = req.query;
 
-  if (!query) {
+  if (!query && !cursor) {
     return res.status(400).json({
       success: false,
       message: 'Search query is required'
     });
   }
 
-  const location = lat && lng ? { lat: parseFloat(lat), lng: parseFloat(lng) } : null;
+  const pageCursor = cursor ? decodeCursor(cursor) : null;
+  if (cursor && (typeof pageCursor?.token !== 'string' || !Number.isFinite(pageCursor.readyAt))) {
+    return res.status(400).json({
+      success: false,
+      message: 'Invalid cursor'
+    });
+  }
+
+  const options = {
+    location: lat && lng ? { lat: parseFloat(lat), lng: parseFloat(lng) } : null,
+    radius: parseInt(radius),
+    type,
+    cursor: pageCursor
+  };
+
+  // Stream every remaining page as it arrives: one {places, cursor} line per page
+  if (req.query.stream === 'true') {
+    const stream = openNdjsonStream(req, res);
+
+    try {
+      let page = await placesService.searchPlacesPage(query, options);
+      stream.send(page);
+
+      for (let pages = 1; page.cursor && pages < MAX_STREAMED_PAGES && !stream.closed; pages++) {
+        page = await placesService.searchPlacesPage(query, { cursor: decodeCursor(page.cursor) });
+        stream.send(page);
+      }
+    } catch (error) {
+      stream.send({ error: error.message });
+    }
+
+    return stream.close();
+  }
 
   try {
-    const places = await placesService.searchPlaces(
-      query,
-      location,
-      parseInt(radius),
-      type
-    );
+    const { places, cursor: nextCursor } = await placesService.searchPlacesPage(query, options);
 
     res.json({
       success: true,
-      data: places
+      data: places,
+      pagination: {
+        nextCursor
+      }
     });
 
   } catch (error) {
-    res.status(500).json({
+    res.status(error.statusCode || 500).json({
       success: false,
       message: error.message
     });
@@ -62,13 +99,59 @@ router.get('/details/:placeId', asyncHandler(async (req, res) => {
     });
 
   } catch (error) {
-    res.status(500).json({
+    res.status(error.statusCode || 500).json({
       success: false,
       message: error.message
     });
   }
 }));
 
+// @desc    Get details for several places at once (e.g. every activity in an itinerary)
+// @route   POST /api/places/details/batch
+// @access  Private
+router.post('/details/batch', asyncHandler(async (req, res) => {
+  const { placeIds } = req.body;
+
+  if (!Array.isArray(placeIds) || placeIds.length === 0) {
+    return res.status(400).json({
+      success: false,
+      message: 'placeIds must be a non-empty array'
+    });
+  }
+
+  if (placeIds.length > MAX_BATCH_PLACES) {
+    return res.status(400).json({
+      success: false,
+      message: `At most ${MAX_BATCH_PLACES} place IDs can be requested at once`
+    });
+  }
+
+  if (!placeIds.every(placeId => typeof placeId === 'string' && placeId.length > 0)) {
+    return res.status(400).json({
+      success: false,
+      message: 'Each place ID must be a non-empty string'
+    });
+  }
+
+  const details = await placesService.getPlaceDetailsBulk(placeIds);
+
+  // Same order as the request; ids that could not be resolved carry an error instead
+  const data = placeIds.map(placeId => {
+    const place = details.get(placeId);
+    if (place) return place;
+
+    return {
+      placeId,
+      error: place === null ? 'Place not found' : 'Place details unavailable'
+    };
+  });
+
+  res.json({
+    success: true,
+    data
+  });
+}));
+
 // @desc    Find nearby places by type
 // @route   GET /api/places/nearby
 // @access  Private
@@ -86,11 +169,19 @@ router.get('/nearby', asyncHandler(async (req, res) => {
     lat: parseFloat(lat),
     lng: parseFloat(lng)
   };
+  const searchRadius = parseInt(radius);
+
+  if (!Number.isFinite(location.lat) || !Number.isFinite(location.lng) || !(searchRadius > 0)) {
+    return res.status(400).json({
+      success: false,
+      message: 'Latitude, longitude and radius must be numbers'
+    });
+  }
 
   try {
     const places = await placesService.findNearbyPlaces(
       location,
-      parseInt(radius),
+      searchRadius,
       type
     );
 
@@ -1,6 +1,7 @@
 import express from 'express';
 import User from '../models/User.js';
 import Trip from '../models/Trip.js';
+import Comment from '../models/Comment.js';
 import { asyncHandler } from '../middleware/errorHandler.js';
 
 const router = express.Router();
@@ -146,8 +147,12 @@ router.delete('/account', asyncHandler(async (req, res) => {
     });
   }
 
-  // Delete user's trips
-  await Trip.deleteMany({ user: req.user._id });
+  // Delete user's trips and the comments on them
+  const tripIds = await Trip.distinct('_id', { user: req.user._id });
+  await Promise.all([
+    Trip.deleteMany({ user: req.user._id }),
+    Comment.deleteMany({ trip: { $in: tripIds } })
+  ]);
 
   // Delete user account
   await User.findByIdAndDelete(req.user._id);
@@ -4,6 +4,8 @@ import { asyncHandler } from '../middleware/errorHandler.js';
 
 const router = express.Router();
 
+const MAX_BATCH_LOCATIONS = 50;
+
 // @desc    Get current weather for a destination
 // @route   GET /api/weather/current
 // @access  Private
@@ -164,4 +166,60 @@ router.get('/recommendations', asyncHandler(async (req, res) => {
   }
 }));
 
+// @desc    Get current weather for several destinations at once
+// @route   POST /api/weather/batch
+// @access  Private
+router.post('/batch', asyncHandler(async (req, res) => {
+  const { locations, units = 'metric' } = req.body;
+
+  if (!Array.isArray(locations) || locations.length === 0) {
+    return res.status(400).json({
+      success: false,
+      message: 'A non-empty locations array is required'
+    });
+  }
+
+  if (locations.length > MAX_BATCH_LOCATIONS) {
+    return res.status(400).json({
+      success: false,
+      message: `At most ${MAX_BATCH_LOCATIONS} locations can be requested at once`
+    });
+  }
+
+  const invalidIndex = locations.findIndex(location =>
+    !(location?.city && location?.country) &&
+    !(Number.isFinite(Number(location?.lat)) && Number.isFinite(Number(location?.lon)))
+  );
+
+  if (invalidIndex !== -1) {
+    return res.status(400).json({
+      success: false,
+      message: `Location ${invalidIndex} needs city and country, or lat and lon`
+    });
+  }
+
+  const results = await weatherService.getCurrentWeatherBatch(
+    locations.map(location => ({ ...location, units: location.units || units }))
+  );
+
+  // Compact per-location summary; failed lookups carry their error instead
+  const data = results.map(weather => weather.error ? { error: weather.error } : {
+    location: weather.location,
+    temperature: weather.current.temperature,
+    feelsLike: weather.current.feelsLike,
+    condition: weather.current.condition,
+    description: weather.current.description,
+    icon: weather.current.icon,
+    humidity: weather.current.humidity,
+    windSpeed: weather.current.windSpeed,
+    units: weather.units,
+    timestamp: weather.timestamp
+  });
+
+  res.json({
+    success: true,
+    data
+  });
+}));
+
 export default router;
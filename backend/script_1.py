@@ -8,6 +8,13 @@ package_json = """{
   "scripts": {
     "start": "node server.js",
     "dev": "nodemon server.js",
+    "bench:weather": "node benchmarks/weatherAggregation.js",
+    "bench:recommendations": "node benchmarks/weatherRecommendations.js",
+    "bench:itinerary": "node benchmarks/itineraryUpdates.js",
+    "migrate:likes-count": "node migrations/backfillLikesCount.js",
+    "migrate:comments": "node migrations/moveCommentsToCollection.js",
+    "migrate:trip-summary": "node migrations/backfillTripSummary.js",
+    "migrate:trip-indexes": "node migrations/tripListIndexes.js",
     "test": "echo \\"Error: no test specified\\" && exit 1"
   },
   "dependencies": {
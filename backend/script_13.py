@@ -1,19 +1,100 @@
 # Create Trip Routes
 trip_routes = """import express from 'express';
+import mongoose from 'mongoose';
 import Trip from '../models/Trip.js';
+import Comment from '../models/Comment.js';
 import aiService from '../services/aiService.js';
-import weatherService from '../services/weatherService.js';
 import placesService from '../services/placesService.js';
+import geocodingService from '../services/geocodingService.js';
+import tripGenerationService from '../services/tripGenerationService.js';
+import tripCountCache from '../services/tripCountCache.js';
 import { asyncHandler } from '../middleware/errorHandler.js';
+import { openEventStream } from '../utils/sse.js';
+import { encodeCursor, decodeCursor, afterKeyset } from '../utils/cursor.js';
 
 const router = express.Router();
 
+const MAX_TRIPS_PAGE = 50;
+const MAX_COMMENTS_PAGE = 50;
+
+// Sort keys of newest-first lists and of the discover feed, most significant first,
+// all descending
+const NEWEST_FIRST_KEYS = ['createdAt', '_id'];
+const DISCOVER_KEYS = ['likesCount', 'createdAt', '_id'];
+
+const sortBy = (keys) => Object.fromEntries(keys.map(key => [key, -1]));
+
+// Cursor for the page after item, holding its sort key values
+const cursorAfter = (item, keys) => encodeCursor({
+  ...(keys.includes('likesCount') && { likesCount: item.likesCount || 0 }),
+  createdAt: item.createdAt.toISOString(),
+  id: item._id.toString()
+});
+
+// The sort key values held by a cursorAfter cursor, or null if it is not a valid cursor
+// for keys
+const parseCursor = (cursor, keys) => {
+  const state = decodeCursor(cursor);
+  const createdAt = new Date(state?.createdAt);
+
+  if (!state || Number.isNaN(createdAt.getTime()) || !mongoose.isValidObjectId(state.id)) return null;
+  if (keys.includes('likesCount') && !Number.isInteger(state.likesCount)) return null;
+
+  return {
+    ...(keys.includes('likesCount') && { likesCount: state.likesCount }),
+    createdAt,
+    _id: new mongoose.Types.ObjectId(state.id)
+  };
+};
+
+// One page of a keyset-sorted list. A cursor continues after the item it was issued for;
+// without one, the page parameter is honoured by skipping, as before cursors existed.
+const findPage = async (findItems, query, keys, { after, page, limit }) => {
+  const skip = after ? 0 : (page - 1) * limit;
+
+  const items = await findItems(after ? { $and: [query, afterKeyset(keys, after)] } : query)
+    .sort(sortBy(keys))
+    .skip(skip)
+    .limit(limit + 1);
+
+  const hasMore = items.length > limit;
+  const pageItems = items.slice(0, limit);
+
+  return {
+    items: pageItems,
+    nextCursor: hasMore ? cursorAfter(pageItems[pageItems.length - 1], keys) : null
+  };
+};
+
+// Page and limit query parameters, defaulting to the first page of limit items
+const parsePaging = ({ page, limit }) => ({
+  page: Math.max(parseInt(page) || 1, 1),
+  limit: Math.min(Math.max(parseInt(limit) || 10, 1), MAX_TRIPS_PAGE)
+});
+
+// Pagination block of a trip list response. Requests without a cursor get the page
+// fields they always had; total is otherwise only counted when includeTotal=true.
+const buildPagination = ({ cursor, page, limit, total, nextCursor }) => ({
+  ...(!cursor && { current: page, pages: Math.ceil(total / limit) }),
+  ...(total !== undefined && { total }),
+  limit,
+  nextCursor
+});
+
 // @desc    Get all trips for the authenticated user
-// @route   GET /api/trips
+// @route   GET /api/trips?cursor=&limit=10 (or ?page=&limit=)
 // @access  Private
 router.get('/', asyncHandler(async (req, res) => {
-  const { page = 1, limit = 10, status, search } = req.query;
-  const skip = (page - 1) * limit;
+  const { status, search, cursor } = req.query;
+  const { page, limit } = parsePaging(req.query);
+
+  const after = cursor ? parseCursor(cursor, NEWEST_FIRST_KEYS) : null;
+  if (cursor && !after) {
+    return res.status(400).json({
+      success: false,
+      message: 'Invalid cursor'
+    });
+  }
 
   // Build query
   let query = { user: req.user._id };
@@ -30,23 +111,24 @@ router.get('/', asyncHandler(async (req, res) => {
     ];
   }
 
-  const trips = await Trip.find(query)
-    .sort({ createdAt: -1 })
-    .skip(skip)
-    .limit(parseInt(limit));
+  // Summaries come from the stored summary fields, so itineraries are never read
+  const { items: trips, nextCursor } = await findPage(
+    (filter) => Trip.findSummaries(filter, 'createdAt'),
+    query,
+    NEWEST_FIRST_KEYS,
+    { after, page, limit }
+  );
 
-  const total = await Trip.countDocuments(query);
+  // One user's trips are few and indexed by user, so their total is counted directly
+  const total = !cursor || req.query.includeTotal === 'true'
+    ? await Trip.countDocuments(query)
+    : undefined;
 
   res.json({
     success: true,
     data: {
-      trips: trips.map(trip => trip.getSummary()),
-      pagination: {
-        current: parseInt(page),
-        pages: Math.ceil(total / limit),
-        total,
-        limit: parseInt(limit)
-      }
+      trips: trips.map(trip => Trip.toSummary(trip)),
+      pagination: buildPagination({ cursor, page, limit, total, nextCursor })
     }
   });
 }));
@@ -74,7 +156,7 @@ router.get('/:id', asyncHandler(async (req, res) => {
 }));
 
 // @desc    Create a new trip with AI-generated itinerary
-// @route   POST /api/trips
+// @route   POST /api/trips (?async=true for job mode, ?stream=true for streamed days)
 // @access  Private
 router.post('/', asyncHandler(async (req, res) => {
   const {
@@ -138,64 +220,122 @@ router.post('/', asyncHandler(async (req, res) => {
     budget
   };
 
+  // Fields shared by every way of creating the trip
+  const tripFields = {
+    user: req.user._id,
+    title,
+    description,
+    destination,
+    startDate,
+    endDate,
+    duration,
+    travelers,
+    preferences,
+    budget: budget || { total: 0, currency: 'USD' },
+    generationPrompt: `Trip to ${destination.city}, ${destination.country} for ${duration} days`,
+    status: 'planning'
+  };
+
+  // Job mode: store a placeholder trip and generate the itinerary in the background
+  if (req.query.async === 'true' || req.get('Prefer')?.includes('respond-async')) {
+    const trip = await Trip.create({
+      ...tripFields,
+      itinerary: [],
+      generation: {
+        jobId: new mongoose.Types.ObjectId().toString(),
+        status: 'generating',
+        step: 'queued',
+        progress: 0
+      }
+    });
+
+    try {
+      await tripGenerationService.enqueue(trip);
+    } catch (error) {
+      await Trip.deleteOne({ _id: trip._id });
+      throw error;
+    }
+
+    const statusUrl = `/api/trips/${trip._id}/status`;
+
+    return res.status(202).location(statusUrl).json({
+      success: true,
+      message: 'Trip created. Itinerary generation has started.',
+      data: {
+        tripId: trip._id,
+        jobId: trip.generation.jobId,
+        status: trip.generation.status,
+        statusUrl,
+        streamUrl: `${statusUrl}/stream`
+      }
+    });
+  }
+
+  // Streaming mode: send each itinerary day as a Server-Sent Event as soon as it is generated
+  if (req.query.stream === 'true') {
+    const stream = openEventStream(req, res);
+
+    // Geocoding and weather do not depend on the itinerary, so run them while the model is generating
+    const destinationPromise = geocodingService.resolve(destination);
+    const weatherPromise = destinationPromise.then(resolved =>
+      tripGenerationService.getWeather(resolved, startDate, endDate));
+
+    let aiResult = null;
+    try {
+      aiResult = await aiService.generateItineraryStream(tripData, (day) => stream.send('day', day));
+    } catch (error) {
+      console.error('Trip creation error:', error);
+    }
+
+    try {
+      const weatherInfo = await weatherPromise;
+      const trip = await Trip.create({
+        ...tripFields,
+        destination: await destinationPromise,
+        itinerary: aiResult ? tripGenerationService.applyWeather(aiResult.itinerary, weatherInfo) : [],
+        aiGenerated: !!aiResult
+      });
+
+      stream.send('complete', {
+        trip,
+        aiInfo: aiResult ? tripGenerationService.getAiInfo(aiResult) : null,
+        weatherInfo: weatherInfo ? {
+          forecast: weatherInfo.forecast?.slice(0, 5) // First 5 days
+        } : null,
+        ...(!aiResult && { warning: 'AI service unavailable. Please add activities manually.' })
+      });
+    } catch (error) {
+      console.error('Trip creation error:', error);
+      stream.send('error', { message: 'Failed to save trip' });
+    }
+
+    return stream.close();
+  }
+
+  // Resolve coordinates and provider ids once, alongside itinerary generation; never rejects
+  const destinationPromise = geocodingService.resolve(destination);
+
   try {
     // Generate itinerary using AI
     const aiResult = await aiService.generateItinerary(tripData);
 
     // Get weather forecast for the trip
-    let weatherInfo = null;
-    try {
-      weatherInfo = await weatherService.getWeatherForTrip(
-        destination.city,
-        destination.country,
-        startDate,
-        endDate
-      );
-    } catch (weatherError) {
-      console.warn('Weather service unavailable:', weatherError.message);
-    }
+    const resolvedDestination = await destinationPromise;
+    const weatherInfo = await tripGenerationService.getWeather(resolvedDestination, startDate, endDate);
 
-    // Create trip in database
+    // Create trip in database with weather already merged into each day
     const trip = await Trip.create({
-      user: req.user._id,
-      title,
-      description,
-      destination,
-      startDate,
-      endDate,
-      duration,
-      travelers,
-      preferences,
-      budget: budget || { total: 0, currency: 'USD' },
-      itinerary: aiResult.itinerary,
-      generationPrompt: `Trip to ${destination.city}, ${destination.country} for ${duration} days`,
-      status: 'planning'
+      ...tripFields,
+      destination: resolvedDestination,
+      itinerary: tripGenerationService.applyWeather(aiResult.itinerary, weatherInfo)
     });
 
-    // Add weather information to itinerary if available
-    if (weatherInfo && weatherInfo.forecast) {
-      for (let i = 0; i < trip.itinerary.length && i < weatherInfo.forecast.length; i++) {
-        trip.itinerary[i].weather = {
-          temperature: weatherInfo.forecast[i].temperature,
-          condition: weatherInfo.forecast[i].condition?.main || weatherInfo.forecast[i].condition,
-          precipitation: weatherInfo.forecast[i].precipitation || 0,
-          humidity: weatherInfo.forecast[i].humidity
-        };
-      }
-      await trip.save();
-    }
-
     res.status(201).json({
       success: true,
       message: 'Trip created successfully with AI-generated itinerary',
       data: {
         trip,
-        aiInfo: {
-          totalBudgetEstimate: aiResult.totalBudgetEstimate,
-          generalTips: aiResult.generalTips,
-          bestTimeToVisit: aiResult.bestTimeToVisit,
-          localCustoms: aiResult.localCustoms
-        },
+        aiInfo: tripGenerationService.getAiInfo(aiResult),
         weatherInfo: weatherInfo ? {
           forecast: weatherInfo.forecast?.slice(0, 5) // First 5 days
         } : null
@@ -204,22 +344,13 @@ router.post('/', asyncHandler(async (req, res) => {
 
   } catch (error) {
     console.error('Trip creation error:', error);
-    
+
     // If AI generation fails, create a basic trip structure
     const basicTrip = await Trip.create({
-      user: req.user._id,
-      title,
-      description,
-      destination,
-      startDate,
-      endDate,
-      duration,
-      travelers,
-      preferences,
-      budget: budget || { total: 0, currency: 'USD' },
+      ...tripFields,
+      destination: await destinationPromise,
       itinerary: [], // Empty itinerary to be filled manually
-      aiGenerated: false,
-      status: 'planning'
+      aiGenerated: false
     });
 
     res.status(201).json({
@@ -233,6 +364,79 @@ router.post('/', asyncHandler(async (req, res) => {
   }
 }));
 
+// @desc    Get itinerary generation status for a trip
+// @route   GET /api/trips/:id/status
+// @access  Private
+router.get('/:id/status', asyncHandler(async (req, res) => {
+  const trip = await Trip.findOne({
+    _id: req.params.id,
+    user: req.user._id
+  }).select('generation').lean();
+
+  if (!trip) {
+    return res.status(404).json({
+      success: false,
+      message: 'Trip not found'
+    });
+  }
+
+  res.json({
+    success: true,
+    data: tripGenerationService.formatStatus(trip)
+  });
+}));
+
+// @desc    Stream itinerary generation progress (Server-Sent Events)
+// @route   GET /api/trips/:id/status/stream
+// @access  Private
+router.get('/:id/status/stream', asyncHandler(async (req, res) => {
+  const query = { _id: req.params.id, user: req.user._id };
+  const trip = await Trip.findOne(query).select('generation').lean();
+
+  if (!trip) {
+    return res.status(404).json({
+      success: false,
+      message: 'Trip not found'
+    });
+  }
+
+  const stream = openEventStream(req, res);
+
+  let lastState = '';
+  const publish = (status) => {
+    const state = `${status.status}:${status.step}:${status.progress}`;
+    if (state === lastState) return;
+    lastState = state;
+
+    stream.send('progress', status);
+    if (status.status !== 'generating') {
+      stream.send('done', status);
+      stream.close();
+    }
+  };
+
+  // Updates from this process arrive immediately; the poll picks up jobs run by other processes
+  const unsubscribe = tripGenerationService.subscribe(trip._id, (generation) => {
+    publish(tripGenerationService.formatStatus({ _id: trip._id, generation }));
+  });
+
+  const poll = setInterval(async () => {
+    try {
+      const latest = await Trip.findOne(query).select('generation').lean();
+      if (latest) publish(tripGenerationService.formatStatus(latest));
+    } catch (error) {
+      console.warn('Generation status poll failed:', error.message);
+    }
+  }, 2000);
+
+  stream.onClose(() => {
+    unsubscribe();
+    clearInterval(poll);
+  });
+
+  publish(tripGenerationService.formatStatus(trip));
+}));
+
 // @desc    Update a trip
 // @route   PUT /api/trips/:id
 // @access  Private
@@ -306,7 +510,10 @@ router.delete('/:id', asyncHandler(async (req, res) => {
     });
   }
 
-  await Trip.deleteOne({ _id: trip._id });
+  await Promise.all([
+    Trip.deleteOne({ _id: trip._id }),
+    Comment.deleteMany({ trip: trip._id })
+  ]);
 
   res.json({
     success: true,
@@ -318,10 +525,25 @@ router.delete('/:id', asyncHandler(async (req, res) => {
 // @route   POST /api/trips/:id/like
 // @access  Private
 router.post('/:id/like', asyncHandler(async (req, res) => {
-  const trip = await Trip.findOne({
-    _id: req.params.id,
-    isPublic: true
-  });
+  const userId = req.user._id;
+
+  // Each update only matches when it changes the like, so likesCount stays equal to
+  // likes.length under concurrent requests. A like is not an edit of the trip, so
+  // timestamps are left alone.
+  const toggle = (filter, update) => Trip.findOneAndUpdate(
+    { _id: req.params.id, isPublic: true, ...filter },
+    update,
+    { new: true, projection: { likesCount: 1 }, timestamps: false }
+  ).lean();
+
+  // Like
+  let trip = await toggle({ likes: { $ne: userId } }, { $addToSet: { likes: userId }, $inc: { likesCount: 1 } });
+  const liked = !!trip;
+
+  if (!liked) {
+    // Unlike
+    trip = await toggle({ likes: userId }, { $pull: { likes: userId }, $inc: { likesCount: -1 } });
+  }
 
   if (!trip) {
     return res.status(404).json({
@@ -330,25 +552,12 @@ router.post('/:id/like', asyncHandler(async (req, res) => {
     });
   }
 
-  const userId = req.user._id;
-  const hasLiked = trip.likes.includes(userId);
-
-  if (hasLiked) {
-    // Unlike
-    trip.likes = trip.likes.filter(id => !id.equals(userId));
-  } else {
-    // Like
-    trip.likes.push(userId);
-  }
-
-  await trip.save();
-
   res.json({
     success: true,
-    message: hasLiked ? 'Trip unliked' : 'Trip liked',
+    message: liked ? 'Trip liked' : 'Trip unliked',
     data: {
-      liked: !hasLiked,
-      likesCount: trip.likes.length
+      liked,
+      likesCount: trip.likesCount
     }
   });
 }));
@@ -366,10 +575,12 @@ router.post('/:id/comments', asyncHandler(async (req, res) => {
     });
   }
 
-  const trip = await Trip.findOne({
-    _id: req.params.id,
-    isPublic: true
-  });
+  // Count the comment in the same update that checks the trip is public
+  const trip = await Trip.findOneAndUpdate(
+    { _id: req.params.id, isPublic: true },
+    { $inc: { commentsCount: 1 } },
+    { projection: { _id: 1 }, timestamps: false }
+  ).lean();
 
   if (!trip) {
     return res.status(404).json({
@@ -378,30 +589,89 @@ router.post('/:id/comments', asyncHandler(async (req, res) => {
     });
   }
 
-  trip.comments.push({
-    user: req.user._id,
-    text: text.trim(),
-    createdAt: new Date()
-  });
-
-  await trip.save();
+  let comment;
+  try {
+    comment = await Comment.create({
+      trip: trip._id,
+      user: req.user._id,
+      text: text.trim()
+    });
+  } catch (error) {
+    await Trip.updateOne({ _id: trip._id }, { $inc: { commentsCount: -1 } }, { timestamps: false });
+    throw error;
+  }
 
-  // Populate user info in the new comment
-  await trip.populate('comments.user', 'name avatar');
+  // The author is the signed-in user, so no populate is needed
+  const { _id, name, avatar } = req.user;
 
   res.status(201).json({
     success: true,
     message: 'Comment added successfully',
-    data: trip.comments[trip.comments.length - 1]
+    data: {
+      _id: comment._id,
+      user: { _id, name, avatar },
+      text: comment.text,
+      createdAt: comment.createdAt
+    }
+  });
+}));
+
+// @desc    Get comments on a trip, newest first
+// @route   GET /api/trips/:id/comments?cursor=&limit=20
+// @access  Private (public trips, or the owner's own)
+router.get('/:id/comments', asyncHandler(async (req, res) => {
+  const limit = Math.min(Math.max(parseInt(req.query.limit) || 20, 1), MAX_COMMENTS_PAGE);
+
+  const after = req.query.cursor ? parseCursor(req.query.cursor, NEWEST_FIRST_KEYS) : null;
+  if (req.query.cursor && !after) {
+    return res.status(400).json({
+      success: false,
+      message: 'Invalid cursor'
+    });
+  }
+
+  const trip = await Trip.findOne({
+    _id: req.params.id,
+    $or: [{ isPublic: true }, { user: req.user._id }]
+  }).select('commentsCount').lean();
+
+  if (!trip) {
+    return res.status(404).json({
+      success: false,
+      message: 'Trip not found'
+    });
+  }
+
+  const { comments, hasMore } = await Comment.findPage(trip._id, { after, limit });
+  const last = comments[comments.length - 1];
+
+  res.json({
+    success: true,
+    data: {
+      comments,
+      pagination: {
+        nextCursor: hasMore ? cursorAfter(last, NEWEST_FIRST_KEYS) : null,
+        total: trip.commentsCount || 0,
+        limit
+      }
+    }
   });
 }));
 
 // @desc    Get public trips (discover feed)
-// @route   GET /api/trips/public
+// @route   GET /api/trips/public/discover?cursor=&limit=10 (or ?page=&limit=)
 // @access  Public (but requires auth for personalization)
 router.get('/public/discover', asyncHandler(async (req, res) => {
-  const { page = 1, limit = 10, destination, themes } = req.query;
-  const skip = (page - 1) * limit;
+  const { destination, themes, cursor } = req.query;
+  const { page, limit } = parsePaging(req.query);
+
+  const after = cursor ? parseCursor(cursor, DISCOVER_KEYS) : null;
+  if (cursor && !after) {
+    return res.status(400).json({
+      success: false,
+      message: 'Invalid cursor'
+    });
+  }
 
   let query = { isPublic: true };
 
@@ -417,30 +687,35 @@ router.get('/public/discover', asyncHandler(async (req, res) => {
     query['preferences.themes'] = { $in: themeArray };
   }
 
-  const trips = await Trip.find(query)
-    .populate('user', 'name avatar')
-    .sort({ likes: -1, createdAt: -1 })
-    .skip(skip)
-    .limit(parseInt(limit));
+  const { items: trips, nextCursor } = await findPage(
+    (filter) => Trip.findSummaries(filter, 'user likesCount commentsCount createdAt').populate('user', 'name avatar'),
+    query,
+    DISCOVER_KEYS,
+    { after, page, limit }
+  );
+
+  // Counting public trips scans every match, so feed totals are cached briefly
+  const total = !cursor || req.query.includeTotal === 'true'
+    ? await tripCountCache.count(query)
+    : undefined;
 
-  const total = await Trip.countDocuments(query);
+  // Which of this page's trips the user liked, without reading any likes arrays back
+  const likedIds = req.user
+    ? await Trip.distinct('_id', { _id: { $in: trips.map(trip => trip._id) }, likes: req.user._id })
+    : [];
+  const liked = new Set(likedIds.map(id => id.toString()));
 
   res.json({
     success: true,
     data: {
       trips: trips.map(trip => ({
-        ...trip.getSummary(),
+        ...Trip.toSummary(trip),
         user: trip.user,
-        likesCount: trip.likes.length,
-        commentsCount: trip.comments.length,
-        liked: req.user ? trip.likes.includes(req.user._id) : false
+        likesCount: trip.likesCount,
+        commentsCount: trip.commentsCount,
+        liked: liked.has(trip._id.toString())
       })),
-      pagination: {
-        current: parseInt(page),
-        pages: Math.ceil(total / limit),
-        total,
-        limit: parseInt(limit)
-      }
+      pagination: buildPagination({ cursor, page, limit, total, nextCursor })
     }
   });
 }));
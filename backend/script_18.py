@@ -167,13 +167,19 @@ POST /api/auth/logout       - Logout user
 ### Trip Management
 
 ```
-GET    /api/trips           - Get user's trips
+GET    /api/trips           - Get user's trips (?cursor= for keyset pages, ?page= still works)
 POST   /api/trips           - Create new trip (AI-generated itinerary)
+POST   /api/trips?async=true - Create trip and generate itinerary in the background (202)
+POST   /api/trips?stream=true - Create trip, streaming itinerary days as Server-Sent Events
 GET    /api/trips/:id       - Get specific trip
+GET    /api/trips/:id/status        - Get itinerary generation progress
+GET    /api/trips/:id/status/stream - Stream generation progress (Server-Sent Events)
 PUT    /api/trips/:id       - Update trip
 DELETE /api/trips/:id       - Delete trip
 POST   /api/trips/:id/like  - Like/unlike public trip
-GET    /api/trips/public/discover - Get public trips
+POST   /api/trips/:id/comments - Comment on public trip
+GET    /api/trips/:id/comments - List trip comments (cursor-paginated)
+GET    /api/trips/public/discover - Get public trips (?cursor= or ?page=)
 ```
 
 ### Itinerary Management
@@ -189,13 +195,16 @@ PUT    /api/itinerary/:tripId/days/:day/reorder        - Reorder activities
 ### Places & Weather
 
 ```
-GET /api/places/search           - Search places
+GET /api/places/search           - Search places (?cursor= next page, ?stream=true NDJSON)
 GET /api/places/details/:id      - Get place details
+POST /api/places/details/batch   - Get details for several places
+GET /api/places/photo/:ref       - Get a place photo (public, cached on disk)
 GET /api/places/attractions      - Get popular attractions
 GET /api/places/restaurants      - Get restaurants
 GET /api/weather/current         - Get current weather
 GET /api/weather/forecast        - Get weather forecast
 GET /api/weather/trip            - Get weather for trip dates
+POST /api/weather/batch          - Get current weather for several destinations
 ```
 
 ### User Management
@@ -301,6 +310,10 @@ travel-backend/
 ```bash
 npm start          # Start production server
 npm run dev        # Start development server with nodemon
+npm run migrate:likes-count  # Backfill trip like counts (once, when upgrading)
+npm run migrate:comments     # Move embedded trip comments to their own collection (once)
+npm run migrate:trip-summary # Compute stored trip summaries for trip lists (once)
+npm run migrate:trip-indexes # Rebuild trip list indexes for cursor pagination (once)
 npm test           # Run tests (to be implemented)
 ```
 
@@ -145,6 +145,9 @@ uploads/*.jpeg
 uploads/*.png
 uploads/*.gif
 
+# Place photo cache (content-addressed, rebuilt on demand)
+uploads/place-photos/
+
 # Keep uploads directory but ignore files
 !uploads/.gitkeep
 
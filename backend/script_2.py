@@ -19,6 +19,66 @@ OPENAI_API_KEY=your-openai-api-key-here
 GROQ_API_KEY=your-groq-api-key-here
 HUGGINGFACE_API_KEY=your-huggingface-api-key-here
 
+# AI Provider Routing (hedged requests across configured providers)
+AI_PROVIDER_WEIGHTS=openai:1,groq:1,huggingface:0.5
+AI_MAX_IN_FLIGHT=8
+AI_HEDGE_PERCENTILE=95
+AI_HEDGE_MIN_MS=1500
+AI_HEDGE_DEFAULT_MS=15000
+AI_BREAKER_FAILURE_THRESHOLD=5
+AI_BREAKER_RESET_MS=30000
+AI_TARGET_LATENCY_MS=20000
+AI_QUEUE_MAX=20
+AI_QUEUE_TIMEOUT_MS=10000
+AI_COALESCE_TIMEOUT_MS=120000
+
+# Outbound HTTP connection pool
+HTTP_MAX_SOCKETS=50
+HTTP_MAX_FREE_SOCKETS=10
+HTTP_DNS_TTL_MS=60000
+
+# AI Itinerary Cache
+AI_CACHE_ENABLED=true
+AI_CACHE_MAX_ENTRIES=200
+AI_CACHE_TTL_HOURS=24
+
+# Long trips are planned as a day-theme outline plus concurrently generated day blocks
+AI_CHUNK_THRESHOLD_DAYS=7
+AI_CHUNK_DAYS=3
+AI_CHUNK_CONCURRENCY=3
+
+# Weather Cache (fresh/stale windows are set per endpoint)
+WEATHER_CACHE_MAX_ENTRIES=1000
+WEATHER_CACHE_SHARED=true
+
+# Background forecast refresh for trips inside the 5-day forecast window
+WEATHER_PREFETCH_ENABLED=true
+WEATHER_PREFETCH_CRON=*/30 * * * *
+WEATHER_PREFETCH_BATCH_SIZE=10
+WEATHER_PREFETCH_BATCH_DELAY_MS=2000
+
+# Places Cache (details: memory tier bounded in MB, shared tier in the places collection;
+# searches: answered from the places collection while their coverage is fresh)
+PLACES_CACHE_MAX_MB=32
+PLACES_CACHE_TTL_DAYS=7
+PLACES_NEGATIVE_TTL_HOURS=6
+PLACES_NEARBY_CACHE_MAX_TILES=2000
+PLACES_COVERAGE_TTL_HOURS=24
+
+# Place Photo Cache (photos proxied from Google, stored under uploads/place-photos)
+PLACE_PHOTO_CACHE_MAX_MB=512
+# Photos not yet cached that one IP may have downloaded per RATE_LIMIT_WINDOW
+PLACE_PHOTO_RATE_LIMIT_MAX=30
+
+# Background Trip Generation (POST /api/trips?async=true)
+# TRIP_JOB_QUEUE=memory runs jobs in-process, mongo persists them across restarts
+TRIP_JOB_QUEUE=memory
+TRIP_JOB_CONCURRENCY=2
+TRIP_JOB_MAX_QUEUED=50
+
+# Trip Lists (discover feed totals are cached per filter for this long)
+TRIP_COUNT_CACHE_TTL_SECONDS=60
+
 # Google APIs (Optional)
 GOOGLE_MAPS_API_KEY=your-google-maps-api-key-here
 GOOGLE_PLACES_API_KEY=your-google-places-api-key-here
@@ -30,11 +30,14 @@ if os.path.exists('travel-backend'):
         'Configuration': ['.env.example', '.gitignore', '.dockerignore', 'package.json', 'README.md'],
         'Core Files': ['server.js'],
         'Database Config': ['config/database.js'],
-        'Models': ['models/User.js', 'models/Trip.js'],
+        'Models': ['models/User.js', 'models/Trip.js', 'models/CacheEntry.js', 'models/Job.js', 'models/Place.js', 'models/PlaceCoverage.js', 'models/Comment.js'],
         'Middleware': ['middleware/auth.js', 'middleware/errorHandler.js'],
-        'Routes': ['routes/auth.js', 'routes/trips.js', 'routes/users.js', 'routes/itinerary.js', 'routes/places.js', 'routes/weather.js'],
-        'Services': ['services/aiService.js', 'services/weatherService.js', 'services/placesService.js'],
-        'Utils': ['utils/validation.js', 'utils/pdfGenerator.js'],
+        'Routes': ['routes/auth.js', 'routes/trips.js', 'routes/users.js', 'routes/itinerary.js', 'routes/places.js', 'routes/placePhotos.js', 'routes/weather.js'],
+        'Services': ['services/aiService.js', 'services/weatherService.js', 'services/placesService.js', 'services/itineraryCache.js', 'services/tripGenerationService.js', 'services/climatologyService.js', 'services/geocodingService.js', 'services/weatherPrefetchService.js', 'services/placeDetailsCache.js', 'services/placeIndex.js', 'services/placePhotoCache.js', 'services/itineraryService.js', 'services/tripCountCache.js'],
+        'Utils': ['utils/validation.js', 'utils/pdfGenerator.js', 'utils/lruCache.js', 'utils/tieredCache.js', 'utils/metrics.js', 'utils/jobQueue.js', 'utils/sse.js', 'utils/itineraryStreamParser.js', 'utils/concurrency.js', 'utils/providerRouter.js', 'utils/circuitBreaker.js', 'utils/adaptiveLimiter.js', 'utils/singleFlight.js', 'utils/httpClient.js', 'utils/swrCache.js', 'utils/weatherRuleTable.js', 'utils/geo.js', 'utils/cursor.js', 'utils/ndjson.js'],
+        'Data': ['data/climateNormals.js', 'data/weatherRules.js'],
+        'Benchmarks': ['benchmarks/weatherAggregation.js', 'benchmarks/weatherRecommendations.js', 'benchmarks/itineraryUpdates.js'],
+        'Migrations': ['migrations/backfillLikesCount.js', 'migrations/moveCommentsToCollection.js', 'migrations/backfillTripSummary.js', 'migrations/tripListIndexes.js'],
         'Uploads': ['uploads/.gitkeep']
     }
     
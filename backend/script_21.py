@@ -0,0 +1,405 @@
+# Create caching utilities and the itinerary cache service
+lru_cache = """// In-memory LRU cache with optional per-entry TTL. Bounded by entry count and,
+// when maxBytes is set, by the total of sizeOf(value) across entries. onEvict(key, value)
+// is called for entries pushed out by those bounds.
+class LRUCache {
+  constructor({ max = 500, ttl = 0, maxBytes = 0, sizeOf = null, onEvict = null } = {}) {
+    this.max = max;
+    this.ttl = ttl;
+    this.maxBytes = maxBytes;
+    this.sizeOf = sizeOf || ((value) => Buffer.byteLength(JSON.stringify(value) ?? ''));
+    this.onEvict = onEvict;
+    this.entries = new Map();
+    this.bytes = 0;
+  }
+
+  get size() {
+    return this.entries.size;
+  }
+
+  // Get a value and mark it as most recently used
+  get(key) {
+    const entry = this.entries.get(key);
+    if (!entry) return undefined;
+
+    if (entry.expiresAt && entry.expiresAt <= Date.now()) {
+      this.delete(key);
+      return undefined;
+    }
+
+    // Map keeps insertion order, so re-inserting moves the key to the end
+    this.entries.delete(key);
+    this.entries.set(key, entry);
+    return entry.value;
+  }
+
+  has(key) {
+    const entry = this.entries.get(key);
+    return !!entry && (!entry.expiresAt || entry.expiresAt > Date.now());
+  }
+
+  // Get a value without marking it as used
+  peek(key) {
+    return this.has(key) ? this.entries.get(key).value : undefined;
+  }
+
+  set(key, value, { ttl = this.ttl } = {}) {
+    this.delete(key);
+
+    const bytes = this.maxBytes > 0 ? this.sizeOf(value) : 0;
+    // A value larger than the whole cache would only evict everything else
+    if (this.maxBytes > 0 && bytes > this.maxBytes) return this;
+
+    this.entries.set(key, {
+      value,
+      bytes,
+      expiresAt: ttl > 0 ? Date.now() + ttl : 0
+    });
+    this.bytes += bytes;
+
+    // Evict least recently used entries
+    while (this.entries.size > this.max || (this.maxBytes > 0 && this.bytes > this.maxBytes)) {
+      const [oldestKey, oldest] = this.entries.entries().next().value;
+      this.delete(oldestKey);
+      this.onEvict?.(oldestKey, oldest.value);
+    }
+
+    return this;
+  }
+
+  delete(key) {
+    const entry = this.entries.get(key);
+    if (!entry) return false;
+
+    this.bytes -= entry.bytes;
+    return this.entries.delete(key);
+  }
+
+  clear() {
+    this.entries.clear();
+    this.bytes = 0;
+  }
+}
+
+export default LRUCache;
+"""
+
+metrics_utils = """// Lightweight in-process metrics helpers
+
+// Rolling window of latency samples (milliseconds) with percentile lookups
+export class LatencyTracker {
+  constructor(windowSize = 200) {
+    this.samples = new Float64Array(windowSize);
+    this.count = 0;
+  }
+
+  record(ms) {
+    this.samples[this.count % this.samples.length] = ms;
+    this.count++;
+  }
+
+  get size() {
+    return Math.min(this.count, this.samples.length);
+  }
+
+  percentile(p) {
+    const n = this.size;
+    if (n === 0) return 0;
+
+    const sorted = this.samples.slice(0, n).sort();
+    const index = Math.min(n - 1, Math.max(0, Math.ceil((p / 100) * n) - 1));
+    return sorted[index];
+  }
+
+  mean() {
+    const n = this.size;
+    if (n === 0) return 0;
+
+    let total = 0;
+    for (let i = 0; i < n; i++) total += this.samples[i];
+    return total / n;
+  }
+
+  toJSON() {
+    return {
+      count: this.count,
+      mean: Math.round(this.mean()),
+      p50: Math.round(this.percentile(50)),
+      p95: Math.round(this.percentile(95))
+    };
+  }
+}
+
+// Exponentially weighted moving average; the first sample seeds the value
+export class Ewma {
+  constructor(alpha = 0.2) {
+    this.alpha = alpha;
+    this.value = 0;
+    this.initialized = false;
+  }
+
+  update(sample) {
+    this.value = this.initialized
+      ? this.alpha * sample + (1 - this.alpha) * this.value
+      : sample;
+    this.initialized = true;
+    return this.value;
+  }
+}
+"""
+
+cache_entry_model = """import mongoose from 'mongoose';
+
+// Shared cache tier: entries are removed by MongoDB's TTL monitor once expiresAt passes
+const cacheEntrySchema = new mongoose.Schema({
+  namespace: {
+    type: String,
+    required: true
+  },
+  key: {
+    type: String,
+    required: true
+  },
+  value: mongoose.Schema.Types.Mixed,
+  expiresAt: {
+    type: Date,
+    required: true
+  }
+}, {
+  timestamps: true,
+  minimize: false
+});
+
+cacheEntrySchema.index({ namespace: 1, key: 1 }, { unique: true });
+cacheEntrySchema.index({ expiresAt: 1 }, { expireAfterSeconds: 0 });
+
+const CacheEntry = mongoose.model('CacheEntry', cacheEntrySchema);
+
+export default CacheEntry;
+"""
+
+tiered_cache = """import mongoose from 'mongoose';
+import LRUCache from './lruCache.js';
+import CacheEntry from '../models/CacheEntry.js';
+
+// Two-tier cache: per-process LRU in front of a MongoDB collection shared by all processes
+class TieredCache {
+  constructor({ namespace, max = 500, ttl = 60 * 60 * 1000, shared = true } = {}) {
+    this.namespace = namespace;
+    this.ttl = ttl;
+    this.shared = shared;
+    this.memory = new LRUCache({ max, ttl });
+    this.stats = {
+      memoryHits: 0,
+      sharedHits: 0,
+      misses: 0,
+      writes: 0,
+      errors: 0
+    };
+  }
+
+  // The shared tier is only used while mongoose has an open connection
+  isSharedAvailable() {
+    return this.shared && mongoose.connection.readyState === 1;
+  }
+
+  async get(key) {
+    const local = this.memory.get(key);
+    if (local !== undefined) {
+      this.stats.memoryHits++;
+      return local;
+    }
+
+    if (this.isSharedAvailable()) {
+      try {
+        const entry = await CacheEntry.findOne({
+          namespace: this.namespace,
+          key,
+          expiresAt: { $gt: new Date() }
+        }).lean();
+
+        if (entry) {
+          this.stats.sharedHits++;
+          this.memory.set(key, entry.value, { ttl: entry.expiresAt.getTime() - Date.now() });
+          return entry.value;
+        }
+      } catch (error) {
+        this.stats.errors++;
+        console.warn(`Shared cache read failed (${this.namespace}):`, error.message);
+      }
+    }
+
+    this.stats.misses++;
+    return undefined;
+  }
+
+  async set(key, value, ttl = this.ttl) {
+    this.memory.set(key, value, { ttl });
+    this.stats.writes++;
+
+    if (!this.isSharedAvailable()) return;
+
+    try {
+      await CacheEntry.updateOne(
+        { namespace: this.namespace, key },
+        { $set: { value, expiresAt: new Date(Date.now() + ttl) } },
+        { upsert: true }
+      );
+    } catch (error) {
+      this.stats.errors++;
+      console.warn(`Shared cache write failed (${this.namespace}):`, error.message);
+    }
+  }
+
+  async delete(key) {
+    this.memory.delete(key);
+
+    if (this.isSharedAvailable()) {
+      await CacheEntry.deleteOne({ namespace: this.namespace, key });
+    }
+  }
+
+  getStats() {
+    const hits = this.stats.memoryHits + this.stats.sharedHits;
+    const lookups = hits + this.stats.misses;
+
+    return {
+      namespace: this.namespace,
+      entries: this.memory.size,
+      ...this.stats,
+      hitRate: lookups > 0 ? Math.round((hits / lookups) * 1000) / 1000 : 0
+    };
+  }
+}
+
+export default TieredCache;
+"""
+
+itinerary_cache = """import crypto from 'crypto';
+import TieredCache from '../utils/tieredCache.js';
+import { LatencyTracker } from '../utils/metrics.js';
+
+// Daily budget per traveler (in the trip currency) mapped to coarse bands
+const BUDGET_BANDS = [
+  { max: 50, band: 'shoestring' },
+  { max: 120, band: 'budget' },
+  { max: 250, band: 'mid-range' },
+  { max: 500, band: 'comfort' }
+];
+
+const normalizeText = (value) => String(value || '').trim().toLowerCase();
+
+const normalizeList = (values) => [...new Set((values || []).map(normalizeText))].sort();
+
+// Content-addressed cache for AI generated itineraries
+class ItineraryCache {
+  constructor() {
+    this.enabled = process.env.AI_CACHE_ENABLED !== 'false';
+    this.store = new TieredCache({
+      namespace: 'itinerary',
+      max: parseInt(process.env.AI_CACHE_MAX_ENTRIES) || 200,
+      ttl: (parseInt(process.env.AI_CACHE_TTL_HOURS) || 24) * 60 * 60 * 1000
+    });
+
+    this.missLatency = new LatencyTracker();
+    this.hitLatency = new LatencyTracker();
+    this.tokensSpent = 0;
+    this.tokensSaved = 0;
+  }
+
+  getBudgetBand(tripData) {
+    const total = tripData.budget?.total;
+    if (!total) return 'unspecified';
+
+    const travelers = (tripData.travelers?.adults || 1) + (tripData.travelers?.children || 0);
+    const perTravelerPerDay = total / travelers / Math.max(tripData.duration || 1, 1);
+    const match = BUDGET_BANDS.find(({ max }) => perTravelerPerDay <= max);
+
+    return match ? match.band : 'luxury';
+  }
+
+  // Hash of every buildItineraryPrompt input. Absolute dates are reduced to the
+  // trip length (day offsets 0..duration-1) so a plan can be replayed for any start date.
+  buildKey(tripData) {
+    const { destination, travelers, preferences, budget } = tripData;
+
+    const canonical = {
+      city: normalizeText(destination?.city),
+      country: normalizeText(destination?.country),
+      duration: tripData.duration,
+      travelers: [
+        travelers?.adults || 1,
+        travelers?.children || 0,
+        travelers?.infants || 0
+      ],
+      pace: normalizeText(preferences?.pace || 'moderate'),
+      themes: normalizeList(preferences?.themes),
+      foodPreferences: normalizeList(preferences?.foodPreferences),
+      transport: normalizeText(preferences?.transportPreference || 'mixed'),
+      currency: normalizeText(budget?.currency || 'USD'),
+      budgetBand: this.getBudgetBand(tripData)
+    };
+
+    return crypto.createHash('sha256').update(JSON.stringify(canonical)).digest('hex');
+  }
+
+  async get(tripData) {
+    const key = this.buildKey(tripData);
+    if (!this.enabled) return { key, value: undefined };
+
+    const value = await this.store.get(key);
+    return { key, value };
+  }
+
+  async set(key, value, { latencyMs = 0, tokens = 0 } = {}) {
+    this.missLatency.record(latencyMs);
+    this.tokensSpent += tokens;
+
+    if (!this.enabled) return;
+
+    // Store a private copy so callers can keep mutating the returned itinerary
+    await this.store.set(key, { ...structuredClone(value), cacheMeta: { tokens, latencyMs } });
+  }
+
+  recordHit(value, latencyMs) {
+    this.hitLatency.record(latencyMs);
+    this.tokensSaved += value.cacheMeta?.tokens || 0;
+  }
+
+  getStats() {
+    const storeStats = this.store.getStats();
+    const hits = storeStats.memoryHits + storeStats.sharedHits;
+
+    return {
+      enabled: this.enabled,
+      ...storeStats,
+      tokensSpent: this.tokensSpent,
+      tokensSaved: this.tokensSaved,
+      latency: {
+        miss: this.missLatency.toJSON(),
+        hit: this.hitLatency.toJSON()
+      },
+      estimatedTimeSavedMs: Math.round(hits * this.missLatency.mean())
+    };
+  }
+}
+
+export default new ItineraryCache();
+"""
+
+with open("travel-backend/utils/lruCache.js", "w") as f:
+    f.write(lru_cache)
+
+with open("travel-backend/utils/metrics.js", "w") as f:
+    f.write(metrics_utils)
+
+with open("travel-backend/utils/tieredCache.js", "w") as f:
+    f.write(tiered_cache)
+
+with open("travel-backend/models/CacheEntry.js", "w") as f:
+    f.write(cache_entry_model)
+
+with open("travel-backend/services/itineraryCache.js", "w") as f:
+    f.write(itinerary_cache)
+
+print("Cache utilities and itinerary cache service created successfully!")
@@ -0,0 +1,433 @@
+# Create background job queue and trip generation service
+job_model = """import mongoose from 'mongoose';
+
+// Durable queue entry used by the 'mongo' job queue driver
+const jobSchema = new mongoose.Schema({
+  queue: {
+    type: String,
+    required: true
+  },
+  payload: mongoose.Schema.Types.Mixed,
+  status: {
+    type: String,
+    enum: ['queued', 'running', 'completed', 'failed'],
+    default: 'queued'
+  },
+  attempts: {
+    type: Number,
+    default: 0
+  },
+  lockedUntil: Date,
+  lastError: String,
+  finishedAt: Date
+}, {
+  timestamps: true
+});
+
+jobSchema.index({ queue: 1, status: 1, createdAt: 1 });
+// Finished jobs are kept for a week for debugging
+jobSchema.index({ finishedAt: 1 }, { expireAfterSeconds: 7 * 24 * 60 * 60 });
+
+const Job = mongoose.model('Job', jobSchema);
+
+export default Job;
+"""
+
+job_queue = """import mongoose from 'mongoose';
+import Job from '../models/Job.js';
+import { AppError } from '../middleware/errorHandler.js';
+
+// Bounded background job queue. The default 'memory' driver runs jobs in-process;
+// the 'mongo' driver stores them in the jobs collection so they survive restarts
+// and can be claimed by any API process.
+class JobQueue {
+  constructor({
+    name,
+    handler,
+    concurrency = 2,
+    maxQueued = 50,
+    driver = 'memory',
+    pollInterval = 1000,
+    lockTimeout = 10 * 60 * 1000,
+    maxAttempts = 3
+  }) {
+    this.name = name;
+    this.handler = handler;
+    this.concurrency = concurrency;
+    this.maxQueued = maxQueued;
+    this.driver = driver;
+    this.lockTimeout = lockTimeout;
+    this.maxAttempts = maxAttempts;
+
+    this.pending = [];
+    this.active = 0;
+    this.polling = false;
+    this.stats = {
+      enqueued: 0,
+      completed: 0,
+      failed: 0,
+      rejected: 0
+    };
+
+    if (this.driver === 'mongo') {
+      this.poller = setInterval(() => this.poll(), pollInterval);
+      this.poller.unref();
+    }
+  }
+
+  async add(payload, id = new mongoose.Types.ObjectId().toString()) {
+    const queued = this.driver === 'mongo'
+      ? await Job.countDocuments({ queue: this.name, status: 'queued' })
+      : this.pending.length;
+
+    if (queued >= this.maxQueued) {
+      this.stats.rejected++;
+      throw new AppError('Server is busy generating trips, please try again shortly', 503);
+    }
+
+    this.stats.enqueued++;
+
+    if (this.driver === 'mongo') {
+      await Job.create({ _id: id, queue: this.name, payload });
+      this.poll();
+    } else {
+      this.pending.push({ id: String(id), payload });
+      this.drain();
+    }
+
+    return String(id);
+  }
+
+  drain() {
+    while (this.active < this.concurrency && this.pending.length > 0) {
+      this.execute(this.pending.shift());
+    }
+  }
+
+  // Run a job through the handler; resolves with the error (if any) instead of throwing
+  async execute(job) {
+    this.active++;
+    try {
+      await this.handler(job.payload, job.id);
+      this.stats.completed++;
+      return null;
+    } catch (error) {
+      this.stats.failed++;
+      console.error(`Job ${job.id} on queue ${this.name} failed:`, error.message);
+      return error;
+    } finally {
+      this.active--;
+      if (this.driver === 'mongo') {
+        this.poll();
+      } else {
+        this.drain();
+      }
+    }
+  }
+
+  async poll() {
+    if (this.polling || mongoose.connection.readyState !== 1) return;
+
+    this.polling = true;
+    try {
+      while (this.active < this.concurrency) {
+        const job = await this.claim();
+        if (!job) break;
+        this.runDurable(job);
+      }
+    } catch (error) {
+      console.error(`Polling queue ${this.name} failed:`, error.message);
+    } finally {
+      this.polling = false;
+    }
+  }
+
+  // Atomically claim the oldest queued job, or one whose worker died mid-run
+  claim() {
+    const now = new Date();
+
+    return Job.findOneAndUpdate(
+      {
+        queue: this.name,
+        $or: [
+          { status: 'queued' },
+          { status: 'running', lockedUntil: { $lt: now }, attempts: { $lt: this.maxAttempts } }
+        ]
+      },
+      {
+        $set: { status: 'running', lockedUntil: new Date(now.getTime() + this.lockTimeout) },
+        $inc: { attempts: 1 }
+      },
+      { sort: { createdAt: 1 }, new: true }
+    ).lean();
+  }
+
+  async runDurable(job) {
+    const error = await this.execute({ id: job._id.toString(), payload: job.payload });
+
+    try {
+      await Job.updateOne({ _id: job._id }, {
+        $set: {
+          status: error ? 'failed' : 'completed',
+          lastError: error?.message,
+          finishedAt: new Date()
+        }
+      });
+    } catch (updateError) {
+      console.error(`Failed to record job ${job._id} result:`, updateError.message);
+    }
+  }
+
+  getStats() {
+    return {
+      name: this.name,
+      driver: this.driver,
+      concurrency: this.concurrency,
+      active: this.active,
+      queued: this.driver === 'memory' ? this.pending.length : undefined,
+      ...this.stats
+    };
+  }
+}
+
+export default JobQueue;
+"""
+
+sse_utils = """// Server-Sent Events helper: sets streaming headers and returns a small writer
+export const openEventStream = (req, res, { heartbeatMs = 15000 } = {}) => {
+  // no-transform keeps the compression middleware from buffering the stream
+  res.status(200).set({
+    'Content-Type': 'text/event-stream',
+    'Cache-Control': 'no-cache, no-transform',
+    'Connection': 'keep-alive',
+    'X-Accel-Buffering': 'no'
+  });
+  res.flushHeaders();
+
+  let closed = false;
+  const closeHandlers = [];
+
+  const heartbeat = setInterval(() => {
+    if (!closed) res.write(': ping\\n\\n');
+  }, heartbeatMs);
+
+  const cleanup = () => {
+    if (closed) return;
+    closed = true;
+    clearInterval(heartbeat);
+    closeHandlers.forEach(handler => handler());
+  };
+
+  // The request's 'close' fires once its body is read, so only the response reports
+  // a client that went away
+  res.on('close', cleanup);
+
+  return {
+    get closed() {
+      return closed;
+    },
+
+    send(event, data) {
+      if (closed) return;
+      res.write(`event: ${event}\\ndata: ${JSON.stringify(data)}\\n\\n`);
+    },
+
+    onClose(handler) {
+      closeHandlers.push(handler);
+    },
+
+    close() {
+      if (closed) return;
+      cleanup();
+      res.end();
+    }
+  };
+};
+"""
+
+trip_generation_service = """import { EventEmitter } from 'events';
+import Trip from '../models/Trip.js';
+import aiService from './aiService.js';
+import weatherService from './weatherService.js';
+import geocodingService from './geocodingService.js';
+import JobQueue from '../utils/jobQueue.js';
+
+// Runs the AI itinerary and weather steps for trips created in job mode
+class TripGenerationService {
+  constructor() {
+    this.events = new EventEmitter();
+    this.events.setMaxListeners(0);
+
+    this.queue = new JobQueue({
+      name: 'trip-generation',
+      handler: ({ tripId }) => this.generate(tripId),
+      concurrency: parseInt(process.env.TRIP_JOB_CONCURRENCY) || 2,
+      maxQueued: parseInt(process.env.TRIP_JOB_MAX_QUEUED) || 50,
+      driver: process.env.TRIP_JOB_QUEUE || 'memory'
+    });
+  }
+
+  // Queue generation for a trip stored with generation.status 'generating'
+  enqueue(trip) {
+    return this.queue.add({ tripId: trip._id.toString() }, trip.generation.jobId);
+  }
+
+  buildTripData(trip) {
+    const toDateString = (date) => new Date(date).toISOString().split('T')[0];
+
+    return {
+      title: trip.title,
+      description: trip.description,
+      destination: trip.destination,
+      startDate: toDateString(trip.startDate),
+      endDate: toDateString(trip.endDate),
+      duration: trip.duration,
+      travelers: trip.travelers,
+      preferences: trip.preferences,
+      budget: trip.budget
+    };
+  }
+
+  async getWeather(destination, startDate, endDate) {
+    try {
+      // Goes by OpenWeather city id or coordinates once the destination is geocoded
+      return await weatherService.getWeatherForTripAt(
+        weatherService.destinationLocation(destination),
+        startDate,
+        endDate
+      );
+    } catch (weatherError) {
+      console.warn('Weather service unavailable:', weatherError.message);
+      return null;
+    }
+  }
+
+  // Copy the per-day forecast onto the matching itinerary days
+  applyWeather(itinerary, weatherInfo) {
+    if (!weatherInfo?.forecast) return itinerary;
+
+    return itinerary.map((day, i) => {
+      const forecast = weatherInfo.forecast[i];
+      if (!forecast) return day;
+
+      return {
+        ...day,
+        weather: weatherService.toItineraryWeather(forecast)
+      };
+    });
+  }
+
+  getAiInfo(aiResult) {
+    return {
+      totalBudgetEstimate: aiResult.totalBudgetEstimate,
+      generalTips: aiResult.generalTips,
+      bestTimeToVisit: aiResult.bestTimeToVisit,
+      localCustoms: aiResult.localCustoms
+    };
+  }
+
+  // Public view of a trip's generation progress
+  formatStatus(trip) {
+    const generation = trip.generation || {};
+
+    return {
+      tripId: trip._id,
+      jobId: generation.jobId,
+      status: generation.status || 'completed',
+      step: generation.step,
+      progress: generation.progress ?? 100,
+      error: generation.error,
+      aiInfo: generation.aiInfo
+    };
+  }
+
+  async updateProgress(tripId, generation, extra = {}) {
+    const update = { ...extra };
+    Object.entries(generation).forEach(([field, value]) => {
+      update[`generation.${field}`] = value;
+    });
+
+    await Trip.updateOne({ _id: tripId }, { $set: update });
+    this.events.emit(tripId, generation);
+  }
+
+  // Subscribe to progress updates published by this process
+  subscribe(tripId, listener) {
+    const key = tripId.toString();
+    this.events.on(key, listener);
+    return () => this.events.off(key, listener);
+  }
+
+  async generate(tripId) {
+    const trip = await Trip.findById(tripId).lean();
+    if (!trip) return; // Deleted while queued
+
+    const tripData = this.buildTripData(trip);
+
+    // Geocode while the itinerary is generated; resolve() never rejects
+    const destinationPromise = geocodingService.resolve(trip.destination);
+
+    try {
+      await this.updateProgress(tripId, {
+        status: 'generating',
+        step: 'itinerary',
+        progress: 10,
+        startedAt: new Date()
+      });
+
+      const aiResult = await aiService.generateItinerary(tripData);
+
+      await this.updateProgress(tripId, { status: 'generating', step: 'weather', progress: 70 });
+
+      const destination = await destinationPromise;
+      const weatherInfo = await this.getWeather(destination, tripData.startDate, tripData.endDate);
+      const itinerary = this.applyWeather(aiResult.itinerary, weatherInfo);
+
+      await this.updateProgress(tripId, {
+        status: 'completed',
+        step: 'done',
+        progress: 100,
+        aiInfo: this.getAiInfo(aiResult),
+        completedAt: new Date()
+      }, {
+        destination,
+        itinerary,
+        summary: Trip.summarizeItinerary(itinerary),
+        aiGenerated: true
+      });
+    } catch (error) {
+      console.error('Trip generation error:', error);
+
+      await this.updateProgress(tripId, {
+        status: 'failed',
+        step: 'done',
+        progress: 100,
+        error: 'AI itinerary generation failed, but you can add activities manually.',
+        completedAt: new Date()
+      }, { destination: await destinationPromise, aiGenerated: false });
+
+      throw error;
+    }
+  }
+
+  getStats() {
+    return this.queue.getStats();
+  }
+}
+
+export default new TripGenerationService();
+"""
+
+with open("travel-backend/models/Job.js", "w") as f:
+    f.write(job_model)
+
+with open("travel-backend/utils/jobQueue.js", "w") as f:
+    f.write(job_queue)
+
+with open("travel-backend/utils/sse.js", "w") as f:
+    f.write(sse_utils)
+
+with open("travel-backend/services/tripGenerationService.js", "w") as f:
+    f.write(trip_generation_service)
+
+print("Job queue and trip generation service created successfully!")
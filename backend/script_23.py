@@ -0,0 +1,103 @@
+# Create incremental itinerary stream parser
+itinerary_stream_parser = """// Incremental JSON scanner for streamed itinerary responses.
+// Emits each object of the top-level "itinerary" array as soon as its closing
+// brace arrives, without waiting for the rest of the document.
+class ItineraryStreamParser {
+  constructor(onDay) {
+    this.onDay = onDay;
+    this.buffer = '';
+    this.position = 0;
+    this.depth = 0;
+    this.inString = false;
+    this.escaped = false;
+    this.stringStart = -1;
+    this.lastString = null;
+    this.currentKey = null;
+    this.itineraryDepth = -1;
+    this.dayStart = -1;
+    this.dayIndex = 0;
+  }
+
+  get text() {
+    return this.buffer;
+  }
+
+  write(chunk) {
+    this.buffer += chunk;
+
+    for (; this.position < this.buffer.length; this.position++) {
+      const char = this.buffer[this.position];
+
+      if (this.inString) {
+        if (this.escaped) {
+          this.escaped = false;
+        } else if (char === '\\\\') {
+          this.escaped = true;
+        } else if (char === '"') {
+          this.inString = false;
+          if (this.depth === 1) {
+            this.lastString = this.buffer.slice(this.stringStart + 1, this.position);
+          }
+        }
+        continue;
+      }
+
+      switch (char) {
+        case '"':
+          this.inString = true;
+          this.stringStart = this.position;
+          break;
+        case ':':
+          if (this.depth === 1) this.currentKey = this.lastString;
+          break;
+        case ',':
+          if (this.depth === 1) this.currentKey = null;
+          break;
+        case '[':
+          this.depth++;
+          if (this.depth === 2 && this.currentKey === 'itinerary') {
+            this.itineraryDepth = this.depth;
+          }
+          break;
+        case '{':
+          if (this.depth === this.itineraryDepth) this.dayStart = this.position;
+          this.depth++;
+          break;
+        case '}':
+          this.depth--;
+          if (this.depth === this.itineraryDepth && this.dayStart !== -1) {
+            this.emitDay(this.buffer.slice(this.dayStart, this.position + 1));
+            this.dayStart = -1;
+          }
+          break;
+        case ']':
+          if (this.depth === this.itineraryDepth) this.itineraryDepth = -1;
+          this.depth--;
+          break;
+        default:
+          break;
+      }
+    }
+  }
+
+  emitDay(json) {
+    let day;
+    try {
+      day = JSON.parse(json);
+    } catch (error) {
+      // A malformed day is left for the full-document parse to report
+      console.warn('Skipping unparseable streamed itinerary day:', error.message);
+      return;
+    }
+
+    this.onDay(day, this.dayIndex++);
+  }
+}
+
+export default ItineraryStreamParser;
+"""
+
+with open("travel-backend/utils/itineraryStreamParser.js", "w") as f:
+    f.write(itinerary_stream_parser)
+
+print("Itinerary stream parser created successfully!")
@@ -0,0 +1,24 @@
+# Create concurrency helpers
+concurrency_utils = """// Run fn over items with at most `limit` calls in flight; results keep input order
+export const mapWithConcurrency = async (items, limit, fn) => {
+  const results = new Array(items.length);
+  let next = 0;
+
+  const worker = async () => {
+    while (next < items.length) {
+      const index = next++;
+      results[index] = await fn(items[index], index);
+    }
+  };
+
+  const workers = Array.from({ length: Math.max(1, Math.min(limit, items.length)) }, worker);
+  await Promise.all(workers);
+
+  return results;
+};
+"""
+
+with open("travel-backend/utils/concurrency.js", "w") as f:
+    f.write(concurrency_utils)
+
+print("Concurrency helpers created successfully!")
@@ -0,0 +1,309 @@
+# Create AI provider router with latency-aware hedging
+provider_router = """import { Ewma, LatencyTracker } from './metrics.js';
+import CircuitBreaker from './circuitBreaker.js';
+import AdaptiveLimiter from './adaptiveLimiter.js';
+import { AppError } from '../middleware/errorHandler.js';
+
+// Routes a request across AI providers. Providers are ranked by EWMA latency and
+// error rate (scaled by weight). If the primary has not answered by its latency
+// percentile deadline, or fails, the next provider is started; the first valid
+// response wins and the remaining calls are aborted. Each provider sits behind a
+// circuit breaker and an AIMD concurrency limiter.
+class ProviderRouter {
+  constructor(providers, {
+    weights = {},
+    maxInFlight = 8,
+    hedgePercentile = 95,
+    minHedgeDelayMs = 1500,
+    defaultHedgeDelayMs = 15000,
+    breaker = {},
+    limiter = {}
+  } = {}) {
+    this.hedgePercentile = hedgePercentile;
+    this.minHedgeDelayMs = minHedgeDelayMs;
+    this.defaultHedgeDelayMs = defaultHedgeDelayMs;
+
+    this.providers = providers.map(provider => ({
+      ...provider,
+      weight: weights[provider.name] ?? 1,
+      breaker: new CircuitBreaker({ name: provider.name, ...breaker }),
+      limiter: new AdaptiveLimiter({ maxLimit: maxInFlight, ...limiter }),
+      latency: new Ewma(),
+      errorRate: new Ewma(),
+      latencies: new LatencyTracker(),
+      stats: {
+        requests: 0,
+        wins: 0,
+        failures: 0,
+        hedges: 0,
+        cancelled: 0
+      }
+    }));
+  }
+
+  // Lower is better: expected latency, inflated by recent errors, divided by weight
+  score(provider) {
+    const latency = provider.latency.initialized ? provider.latency.value : this.defaultHedgeDelayMs;
+    return (latency * (1 + 4 * provider.errorRate.value)) / provider.weight;
+  }
+
+  enabledProviders() {
+    return this.providers.filter(provider => provider.enabled() && provider.weight > 0);
+  }
+
+  // Providers whose breaker allows traffic, in preference order (ties keep configuration order)
+  rank() {
+    return this.enabledProviders()
+      .filter(provider => provider.breaker.canRequest())
+      .sort((a, b) => this.score(a) - this.score(b));
+  }
+
+  // How long to wait on a provider before hedging to the next one
+  hedgeDelay(provider) {
+    if (provider.latencies.size < 5) return this.defaultHedgeDelayMs;
+    return Math.max(this.minHedgeDelayMs, provider.latencies.percentile(this.hedgePercentile));
+  }
+
+  // Ranked providers, preferring those with a free slot; the others are queued on only as
+  // a last resort
+  candidates() {
+    const ranked = this.rank();
+    return [
+      ...ranked.filter(provider => provider.limiter.hasCapacity()),
+      ...ranked.filter(provider => !provider.limiter.hasCapacity())
+    ];
+  }
+
+  // Error for when every enabled provider's breaker is open
+  unavailableError(enabled) {
+    const retryAfter = Math.min(...enabled.map(provider => provider.breaker.retryAfterMs()));
+    enabled.forEach(provider => provider.breaker.stats.rejected++);
+
+    const error = new AppError('AI service is temporarily unavailable, please try again shortly', 503);
+    error.code = 'CIRCUIT_OPEN';
+    error.retryAfter = retryAfter;
+    return error;
+  }
+
+  // task(provider, signal) performs the call; validate(response) throws if the response is unusable
+  run(task, validate = () => {}) {
+    return new Promise((resolve, reject) => {
+      const enabled = this.enabledProviders();
+      if (enabled.length === 0) {
+        return reject(new Error('No AI API key configured'));
+      }
+
+      const candidates = this.candidates();
+      if (candidates.length === 0) {
+        return reject(this.unavailableError(enabled));
+      }
+
+      const controllers = new Map();
+      let settled = false;
+      let next = 0;
+      let running = 0;
+      let hedgeTimer = null;
+      let lastError = null;
+
+      const finish = (settle) => {
+        settled = true;
+        clearTimeout(hedgeTimer);
+        controllers.forEach((controller, provider) => {
+          provider.stats.cancelled++;
+          controller.abort();
+        });
+        controllers.clear();
+        settle();
+      };
+
+      const launch = () => {
+        if (settled || next >= candidates.length) return false;
+
+        const provider = candidates[next++];
+        const controller = new AbortController();
+        let startedAt = Date.now();
+        let release = null;
+        let sent = false;
+
+        controllers.set(provider, controller);
+        provider.stats.requests++;
+        running++;
+
+        clearTimeout(hedgeTimer);
+        if (next < candidates.length) {
+          hedgeTimer = setTimeout(() => {
+            provider.stats.hedges++;
+            launch();
+          }, this.hedgeDelay(provider));
+        }
+
+        provider.limiter.acquire(controller.signal)
+          .then(releaseSlot => {
+            release = releaseSlot;
+            startedAt = Date.now();
+            sent = true;
+            provider.breaker.onStart();
+            return task(provider, controller.signal);
+          })
+          .then(response => {
+            validate(response);
+            return response;
+          })
+          .then(response => {
+            const elapsed = Date.now() - startedAt;
+            running--;
+            controllers.delete(provider);
+            release({ latencyMs: elapsed, outcome: 'success' });
+            provider.breaker.onSuccess();
+            provider.latency.update(elapsed);
+            provider.latencies.record(elapsed);
+            provider.errorRate.update(0);
+
+            if (settled) return;
+            provider.stats.wins++;
+            finish(() => resolve(response));
+          })
+          .catch(error => {
+            const status = error.status || error.response?.status;
+            running--;
+            controllers.delete(provider);
+            release?.({
+              latencyMs: Date.now() - startedAt,
+              outcome: status === 429 ? 'overloaded' : 'dropped'
+            });
+
+            // Calls we cancelled ourselves are not provider failures
+            if (controller.signal.aborted) {
+              if (sent) provider.breaker.onCancel();
+              return;
+            }
+
+            // Shed by our own limiter: fail over without penalising the provider
+            if (sent) {
+              provider.breaker.onFailure(error);
+              provider.errorRate.update(1);
+              provider.stats.failures++;
+            }
+            lastError = error;
+
+            if (settled) return;
+            console.warn(`AI provider ${provider.name} failed:`, error.message);
+
+            // Fail over straight away instead of waiting for the hedge deadline
+            if (!launch() && running === 0) {
+              finish(() => reject(lastError));
+            }
+          });
+
+        return true;
+      };
+
+      launch();
+    });
+  }
+
+  // Run task on one provider at a time, without hedging, for calls whose output is used
+  // as it arrives (streams). Providers are still admitted by their breaker and limiter.
+  // After a failure the next provider is tried only while canRetry() allows it. Aborting
+  // signal cancels the running call.
+  async runSingle(task, { signal, canRetry = () => true } = {}) {
+    const enabled = this.enabledProviders();
+    if (enabled.length === 0) throw new Error('No AI API key configured');
+
+    const candidates = this.candidates();
+    if (candidates.length === 0) throw this.unavailableError(enabled);
+
+    let lastError = null;
+
+    for (const provider of candidates) {
+      const controller = new AbortController();
+      const abort = () => controller.abort();
+      let startedAt = Date.now();
+      let release = null;
+
+      signal?.addEventListener('abort', abort, { once: true });
+      provider.stats.requests++;
+
+      try {
+        release = await provider.limiter.acquire(controller.signal);
+        startedAt = Date.now();
+        provider.breaker.onStart();
+
+        const response = await task(provider, controller.signal);
+        const elapsed = Date.now() - startedAt;
+
+        release({ latencyMs: elapsed, outcome: 'success' });
+        provider.breaker.onSuccess();
+        provider.latency.update(elapsed);
+        provider.latencies.record(elapsed);
+        provider.errorRate.update(0);
+        provider.stats.wins++;
+        return response;
+      } catch (error) {
+        const status = error.status || error.response?.status;
+        release?.({
+          latencyMs: Date.now() - startedAt,
+          outcome: status === 429 ? 'overloaded' : 'dropped'
+        });
+
+        if (controller.signal.aborted) {
+          provider.stats.cancelled++;
+          if (release) provider.breaker.onCancel();
+          throw error;
+        }
+
+        // Shed by our own limiter: fail over without penalising the provider
+        if (release) {
+          provider.breaker.onFailure(error);
+          provider.errorRate.update(1);
+          provider.stats.failures++;
+        }
+        lastError = error;
+
+        console.warn(`AI provider ${provider.name} failed:`, error.message);
+        if (!canRetry()) break;
+      } finally {
+        signal?.removeEventListener('abort', abort);
+      }
+    }
+
+    throw lastError;
+  }
+
+  getStats() {
+    return this.providers.map(provider => ({
+      name: provider.name,
+      enabled: provider.enabled(),
+      weight: provider.weight,
+      breaker: provider.breaker.getStats(),
+      limiter: provider.limiter.getStats(),
+      latencyEwmaMs: Math.round(provider.latency.value),
+      errorRate: Math.round(provider.errorRate.value * 1000) / 1000,
+      hedgeDelayMs: Math.round(this.hedgeDelay(provider)),
+      latency: provider.latencies.toJSON(),
+      ...provider.stats
+    }));
+  }
+}
+
+// Parse "openai:1,groq:2" into { openai: 1, groq: 2 }
+export const parseProviderWeights = (value = '') => {
+  const weights = {};
+
+  value.split(',').forEach(pair => {
+    const [name, weight] = pair.split(':').map(part => part?.trim());
+    if (name && weight !== undefined && !isNaN(parseFloat(weight))) {
+      weights[name] = parseFloat(weight);
+    }
+  });
+
+  return weights;
+};
+
+export default ProviderRouter;
+"""
+
+with open("travel-backend/utils/providerRouter.js", "w") as f:
+    f.write(provider_router)
+
+print("AI provider router created successfully!")
@@ -0,0 +1,233 @@
+# Create circuit breaker and adaptive concurrency limiter
+circuit_breaker = """// Circuit breaker: closed -> open after repeated failures, half-open after a
+// cool-down to let a trial request through, closed again once one succeeds.
+class CircuitBreaker {
+  constructor({ name, failureThreshold = 5, resetTimeoutMs = 30000, halfOpenMaxCalls = 1 } = {}) {
+    this.name = name;
+    this.failureThreshold = failureThreshold;
+    this.resetTimeoutMs = resetTimeoutMs;
+    this.halfOpenMaxCalls = halfOpenMaxCalls;
+
+    this.state = 'closed';
+    this.failures = 0;
+    this.openedAt = 0;
+    this.openDurationMs = resetTimeoutMs;
+    this.halfOpenInFlight = 0;
+    this.stats = {
+      opened: 0,
+      rejected: 0
+    };
+  }
+
+  canRequest() {
+    if (this.state === 'open') {
+      if (Date.now() - this.openedAt < this.openDurationMs) return false;
+      this.state = 'half-open';
+      this.halfOpenInFlight = 0;
+    }
+
+    if (this.state === 'half-open') {
+      return this.halfOpenInFlight < this.halfOpenMaxCalls;
+    }
+
+    return true;
+  }
+
+  // Call when a request is actually sent
+  onStart() {
+    if (this.state === 'half-open') this.halfOpenInFlight++;
+  }
+
+  onSuccess() {
+    this.finish();
+    this.failures = 0;
+    this.state = 'closed';
+  }
+
+  onFailure(error) {
+    this.finish();
+    this.failures++;
+
+    // Honour the provider's Retry-After on rate limiting
+    const retryAfter = parseInt(error?.response?.headers?.['retry-after'] || error?.headers?.['retry-after']);
+    if (retryAfter > 0) {
+      this.open(retryAfter * 1000);
+    } else if (this.state === 'half-open' || this.failures >= this.failureThreshold) {
+      this.open(this.resetTimeoutMs);
+    }
+  }
+
+  // Call when a request was cancelled before an outcome was known
+  onCancel() {
+    this.finish();
+  }
+
+  finish() {
+    if (this.halfOpenInFlight > 0) this.halfOpenInFlight--;
+  }
+
+  open(durationMs) {
+    if (this.state !== 'open') this.stats.opened++;
+    this.state = 'open';
+    this.openedAt = Date.now();
+    this.openDurationMs = durationMs;
+  }
+
+  retryAfterMs() {
+    return this.state === 'open'
+      ? Math.max(0, this.openDurationMs - (Date.now() - this.openedAt))
+      : 0;
+  }
+
+  getStats() {
+    return {
+      state: this.state,
+      failures: this.failures,
+      retryAfterMs: this.retryAfterMs(),
+      ...this.stats
+    };
+  }
+}
+
+export default CircuitBreaker;
+"""
+
+adaptive_limiter = """import { AppError } from '../middleware/errorHandler.js';
+
+// AIMD concurrency limiter: the limit grows by about one per round trip while calls
+// succeed within the latency target, and is cut multiplicatively on overload (429)
+// or slow responses. Calls over the limit wait in a bounded queue with a deadline.
+class AdaptiveLimiter {
+  constructor({
+    initialLimit = 4,
+    minLimit = 1,
+    maxLimit = 16,
+    targetLatencyMs = 0,
+    backoffRatio = 0.5,
+    maxQueue = 20,
+    queueTimeoutMs = 10000
+  } = {}) {
+    this.limit = Math.min(Math.max(initialLimit, minLimit), maxLimit);
+    this.minLimit = minLimit;
+    this.maxLimit = maxLimit;
+    this.targetLatencyMs = targetLatencyMs;
+    this.backoffRatio = backoffRatio;
+    this.maxQueue = maxQueue;
+    this.queueTimeoutMs = queueTimeoutMs;
+
+    this.inFlight = 0;
+    this.queue = [];
+    this.stats = {
+      shed: 0,
+      timedOut: 0,
+      decreases: 0
+    };
+  }
+
+  hasCapacity() {
+    return this.inFlight < Math.floor(this.limit);
+  }
+
+  // Resolves with a release({ latencyMs, outcome }) function once a slot is free. outcome is
+  // 'success', 'overloaded' (the provider answered 429) or 'dropped' (any other failure or a
+  // cancelled call); only successes grow the limit and dropped calls leave it unchanged.
+  acquire(signal) {
+    if (this.hasCapacity() && this.queue.length === 0) {
+      this.inFlight++;
+      return Promise.resolve(this.createRelease());
+    }
+
+    if (this.queue.length >= this.maxQueue) {
+      this.stats.shed++;
+      return Promise.reject(this.overloadError('AI service is overloaded, please try again shortly'));
+    }
+
+    return new Promise((resolve, reject) => {
+      const waiter = { resolve, reject };
+
+      const remove = () => {
+        clearTimeout(waiter.timer);
+        const index = this.queue.indexOf(waiter);
+        if (index !== -1) this.queue.splice(index, 1);
+      };
+
+      waiter.grant = () => {
+        remove();
+        this.inFlight++;
+        resolve(this.createRelease());
+      };
+
+      waiter.timer = setTimeout(() => {
+        remove();
+        this.stats.timedOut++;
+        reject(this.overloadError('Timed out waiting for AI capacity, please try again shortly'));
+      }, this.queueTimeoutMs);
+
+      signal?.addEventListener('abort', () => {
+        remove();
+        reject(new Error('Request cancelled while queued'));
+      }, { once: true });
+
+      this.queue.push(waiter);
+    });
+  }
+
+  createRelease() {
+    let released = false;
+
+    return ({ latencyMs = 0, outcome = 'dropped' } = {}) => {
+      if (released) return;
+      released = true;
+      this.inFlight--;
+
+      if (outcome === 'overloaded') {
+        this.decrease(this.backoffRatio);
+      } else if (outcome === 'success') {
+        if (this.targetLatencyMs && latencyMs > this.targetLatencyMs) {
+          this.decrease(0.9);
+        } else {
+          this.limit = Math.min(this.maxLimit, this.limit + 1 / this.limit);
+        }
+      }
+
+      this.drain();
+    };
+  }
+
+  decrease(ratio) {
+    this.limit = Math.max(this.minLimit, this.limit * ratio);
+    this.stats.decreases++;
+  }
+
+  drain() {
+    while (this.queue.length > 0 && this.hasCapacity()) {
+      this.queue[0].grant();
+    }
+  }
+
+  overloadError(message) {
+    const error = new AppError(message, 503);
+    error.code = 'LOAD_SHED';
+    return error;
+  }
+
+  getStats() {
+    return {
+      limit: Math.round(this.limit * 100) / 100,
+      inFlight: this.inFlight,
+      queued: this.queue.length,
+      ...this.stats
+    };
+  }
+}
+
+export default AdaptiveLimiter;
+"""
+
+with open("travel-backend/utils/circuitBreaker.js", "w") as f:
+    f.write(circuit_breaker)
+
+with open("travel-backend/utils/adaptiveLimiter.js", "w") as f:
+    f.write(adaptive_limiter)
+
+print("Circuit breaker and adaptive limiter created successfully!")
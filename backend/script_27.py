@@ -0,0 +1,77 @@
+# Create single-flight request coalescing utility
+single_flight = """// Request coalescing: concurrent calls with the same key share one in-flight
+// promise instead of each hitting the upstream API.
+class SingleFlight {
+  constructor({ name, timeoutMs = 0, clone = false } = {}) {
+    this.name = name;
+    this.timeoutMs = timeoutMs;
+    // Give each caller its own copy when results are mutated downstream
+    this.clone = clone;
+    this.flights = new Map();
+    this.stats = {
+      calls: 0,
+      executions: 0,
+      coalesced: 0,
+      timeouts: 0
+    };
+  }
+
+  // Run fn() for key unless an identical call is already in flight
+  do(key, fn, { timeoutMs = this.timeoutMs } = {}) {
+    this.stats.calls++;
+
+    const existing = this.flights.get(key);
+    if (existing) {
+      this.stats.coalesced++;
+      return this.result(existing.promise);
+    }
+
+    this.stats.executions++;
+
+    const flight = { timer: null };
+    const call = Promise.resolve().then(fn);
+
+    // After the deadline the key is released so later callers start a fresh call
+    const timeout = timeoutMs > 0
+      ? new Promise((resolve, reject) => {
+        flight.timer = setTimeout(() => {
+          this.stats.timeouts++;
+          if (this.flights.get(key) === flight) this.flights.delete(key);
+          reject(new Error(`${this.name || 'Request'} timed out after ${timeoutMs}ms`));
+        }, timeoutMs);
+      })
+      : null;
+
+    flight.promise = (timeout ? Promise.race([call, timeout]) : call).finally(() => {
+      clearTimeout(flight.timer);
+      if (this.flights.get(key) === flight) this.flights.delete(key);
+    });
+
+    this.flights.set(key, flight);
+    return this.result(flight.promise);
+  }
+
+  result(promise) {
+    return this.clone ? promise.then(value => structuredClone(value)) : promise;
+  }
+
+  getStats() {
+    return {
+      name: this.name,
+      inFlight: this.flights.size,
+      ...this.stats
+    };
+  }
+}
+
+// Normalized key from request parameters (case and surrounding whitespace ignored)
+export const flightKey = (...parts) =>
+  parts.map(part => String(part ?? '').trim().toLowerCase()).join('|');
+
+export default SingleFlight;
+"""
+
+with open("travel-backend/utils/singleFlight.js", "w") as f:
+    f.write(single_flight)
+
+print("Single-flight utility created successfully!")
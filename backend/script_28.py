@@ -0,0 +1,184 @@
+# Create shared outbound HTTP client
+http_client = """import axios from 'axios';
+import http from 'http';
+import https from 'https';
+import dns from 'dns';
+import { LatencyTracker } from './metrics.js';
+
+const MAX_SOCKETS = parseInt(process.env.HTTP_MAX_SOCKETS) || 50;
+const MAX_FREE_SOCKETS = parseInt(process.env.HTTP_MAX_FREE_SOCKETS) || 10;
+const DNS_TTL_MS = parseInt(process.env.HTTP_DNS_TTL_MS) || 60000;
+
+const RETRYABLE_CODES = new Set(['ECONNRESET', 'ETIMEDOUT', 'ECONNABORTED', 'ECONNREFUSED', 'EAI_AGAIN', 'EPIPE']);
+const IDEMPOTENT_METHODS = new Set(['get', 'head', 'options']);
+
+const dnsCache = new Map();
+const agents = new Map();
+const hostStats = new Map();
+const clients = [];
+
+// dns.lookup with a short TTL cache so new sockets skip the resolver
+export const cachedLookup = (hostname, options, callback) => {
+  if (typeof options === 'function') {
+    callback = options;
+    options = {};
+  }
+
+  const key = `${hostname}|${options.family || 0}|${options.all ? 'all' : 'one'}`;
+  const cached = dnsCache.get(key);
+  if (cached && cached.expiresAt > Date.now()) {
+    process.nextTick(callback, null, ...cached.result);
+    return;
+  }
+
+  dns.lookup(hostname, options, (error, address, family) => {
+    if (!error) {
+      dnsCache.set(key, { result: [address, family], expiresAt: Date.now() + DNS_TTL_MS });
+    }
+    callback(error, address, family);
+  });
+};
+
+const getHostStats = (host) => {
+  if (!hostStats.has(host)) {
+    hostStats.set(host, {
+      requests: 0,
+      newSockets: 0,
+      reusedSockets: 0,
+      connectionWait: new LatencyTracker()
+    });
+  }
+  return hostStats.get(host);
+};
+
+// Keep-alive agent for one origin, instrumented for socket reuse and queueing time
+export const getAgent = (url) => {
+  const { protocol, host } = new URL(url);
+  const key = `${protocol}//${host}`;
+  if (agents.has(key)) return agents.get(key);
+
+  const Agent = protocol === 'http:' ? http.Agent : https.Agent;
+  const agent = new Agent({
+    keepAlive: true,
+    maxSockets: MAX_SOCKETS,
+    maxFreeSockets: MAX_FREE_SOCKETS,
+    lookup: cachedLookup
+  });
+
+  const stats = getHostStats(host);
+  const addRequest = agent.addRequest.bind(agent);
+  agent.addRequest = (req, options) => {
+    const queuedAt = Date.now();
+    stats.requests++;
+
+    req.once('socket', () => {
+      stats.connectionWait.record(Date.now() - queuedAt);
+      if (req.reusedSocket) {
+        stats.reusedSockets++;
+      } else {
+        stats.newSockets++;
+      }
+    });
+
+    addRequest(req, options);
+  };
+
+  agents.set(key, agent);
+  return agent;
+};
+
+const sleep = (ms, signal) => new Promise((resolve, reject) => {
+  if (signal?.aborted) return reject(new Error('Request cancelled'));
+
+  const timer = setTimeout(resolve, ms);
+  signal?.addEventListener('abort', () => {
+    clearTimeout(timer);
+    reject(new Error('Request cancelled'));
+  }, { once: true });
+});
+
+// Full jitter: a random delay up to the exponential backoff ceiling
+const backoffDelay = (attempt, baseMs, maxMs) =>
+  Math.round(Math.random() * Math.min(maxMs, baseMs * 2 ** (attempt - 1)));
+
+const isRetryable = (error) => {
+  if (axios.isCancel(error)) return false;
+
+  const status = error.response?.status;
+  if (status) return status === 429 || status >= 500;
+  return RETRYABLE_CODES.has(error.code);
+};
+
+// Axios instance for one upstream service. Requests use the shared per-host agents;
+// idempotent requests (or any request with retry: true) are retried on network
+// errors, 429 and 5xx responses.
+export const createHttpClient = ({
+  name,
+  timeout = 10000,
+  retries = 2,
+  retryBaseMs = 200,
+  retryMaxMs = 2000
+}) => {
+  const client = axios.create({ timeout });
+  const stats = { name, timeout, requests: 0, retries: 0, failures: 0 };
+
+  client.interceptors.request.use((config) => {
+    const url = new URL(config.url, config.baseURL);
+    const agent = getAgent(url.href);
+
+    if (url.protocol === 'http:') {
+      config.httpAgent = agent;
+    } else {
+      config.httpsAgent = agent;
+    }
+
+    if (!config.retryAttempt) stats.requests++;
+    return config;
+  });
+
+  client.interceptors.response.use(null, async (error) => {
+    const config = error.config;
+    const attempt = (config?.retryAttempt || 0) + 1;
+    const canRetry = config?.retry ?? IDEMPOTENT_METHODS.has((config?.method || 'get').toLowerCase());
+
+    // Honour Retry-After (seconds) when the upstream rate limits us. A wait longer than
+    // retryMaxMs is not retried here; the error carries it (in ms) to the caller instead.
+    const retryAfter = parseInt(error.response?.headers?.['retry-after']) * 1000;
+    if (retryAfter > 0) error.retryAfter = retryAfter;
+
+    if (!config || !canRetry || attempt > retries || config.signal?.aborted || !isRetryable(error) ||
+        retryAfter > retryMaxMs) {
+      stats.failures++;
+      throw error;
+    }
+
+    const delay = retryAfter > 0 ? retryAfter : backoffDelay(attempt, retryBaseMs, retryMaxMs);
+
+    stats.retries++;
+    config.retryAttempt = attempt;
+    await sleep(delay, config.signal);
+    return client(config);
+  });
+
+  clients.push(stats);
+  return client;
+};
+
+export const getHttpStats = () => ({
+  clients: clients.map(stats => ({ ...stats })),
+  hosts: [...hostStats.entries()].map(([host, stats]) => ({
+    host,
+    requests: stats.requests,
+    newSockets: stats.newSockets,
+    reusedSockets: stats.reusedSockets,
+    reuseRate: stats.requests > 0 ? Math.round((stats.reusedSockets / stats.requests) * 1000) / 1000 : 0,
+    connectionWaitMs: stats.connectionWait.toJSON()
+  })),
+  dnsCacheEntries: dnsCache.size
+});
+"""
+
+with open("travel-backend/utils/httpClient.js", "w") as f:
+    f.write(http_client)
+
+print("Shared HTTP client created successfully!")
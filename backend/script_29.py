@@ -0,0 +1,84 @@
+# Create stale-while-revalidate cache
+swr_cache = """import TieredCache from './tieredCache.js';
+
+// Stale-while-revalidate cache on top of TieredCache. An entry is fresh for ttl;
+// for a further staleTtl it is still served while one background refresh runs.
+class SwrCache {
+  constructor({ namespace, max = 500, shared = true } = {}) {
+    this.store = new TieredCache({ namespace, max, shared });
+    this.refreshing = new Set();
+    this.stats = {
+      fresh: 0,
+      stale: 0,
+      refreshes: 0,
+      refreshErrors: 0
+    };
+  }
+
+  // Return the cached value for key, calling fetcher() on a miss
+  async get(key, fetcher, { ttl, staleTtl = 0 }) {
+    const entry = await this.store.get(key);
+
+    if (entry) {
+      if (entry.freshUntil > Date.now()) {
+        this.stats.fresh++;
+      } else {
+        this.stats.stale++;
+        this.refresh(key, fetcher, { ttl, staleTtl });
+      }
+      return structuredClone(entry.value);
+    }
+
+    const value = await fetcher();
+    this.put(key, value, { ttl, staleTtl });
+    return value;
+  }
+
+  // Look at an entry without fetching or refreshing it
+  async peek(key) {
+    const entry = await this.store.get(key);
+    if (!entry) return undefined;
+
+    return {
+      value: structuredClone(entry.value),
+      fresh: entry.freshUntil > Date.now()
+    };
+  }
+
+  put(key, value, { ttl, staleTtl = 0 }) {
+    // Keep a private copy; callers are free to mutate what they get back
+    this.store.set(key, { value: structuredClone(value), freshUntil: Date.now() + ttl }, ttl + staleTtl)
+      .catch(error => console.warn(`Cache write failed (${this.store.namespace}):`, error.message));
+  }
+
+  refresh(key, fetcher, options) {
+    if (this.refreshing.has(key)) return;
+
+    this.refreshing.add(key);
+    this.stats.refreshes++;
+
+    Promise.resolve()
+      .then(fetcher)
+      .then(value => this.put(key, value, options))
+      .catch(error => {
+        this.stats.refreshErrors++;
+        console.warn(`Background refresh failed (${this.store.namespace}):`, error.message);
+      })
+      .finally(() => this.refreshing.delete(key));
+  }
+
+  getStats() {
+    return {
+      ...this.store.getStats(),
+      ...this.stats
+    };
+  }
+}
+
+export default SwrCache;
+"""
+
+with open("travel-backend/utils/swrCache.js", "w") as f:
+    f.write(swr_cache)
+
+print("Stale-while-revalidate cache created successfully!")
@@ -16,8 +16,19 @@ import tripRoutes from './routes/trips.js';
 import userRoutes from './routes/users.js';
 import itineraryRoutes from './routes/itinerary.js';
 import placesRoutes from './routes/places.js';
+import placePhotoRoutes from './routes/placePhotos.js';
 import weatherRoutes from './routes/weather.js';
 
+// Service imports
+import aiService from './services/aiService.js';
+import itineraryCache from './services/itineraryCache.js';
+import tripGenerationService from './services/tripGenerationService.js';
+import weatherService from './services/weatherService.js';
+import placesService from './services/placesService.js';
+import weatherPrefetchService from './services/weatherPrefetchService.js';
+import tripCountCache from './services/tripCountCache.js';
+import { getHttpStats } from './utils/httpClient.js';
+
 // Middleware imports
 import { errorHandler } from './middleware/errorHandler.js';
 import { authenticateToken } from './middleware/auth.js';
@@ -53,6 +64,8 @@ const limiter = rateLimit({
   },
   standardHeaders: true,
   legacyHeaders: false,
+  // Pages load many photos through <img> tags; the photo route limits its own downloads
+  skip: (req) => req.path.startsWith('/api/places/photo/'),
 });
 
 app.use(limiter);
@@ -83,6 +96,7 @@ mongoose.connect(process.env.MONGODB_URI || 'mongodb://localhost:27017/travel-as
 })
 .then(() => {
   console.log('✅ Connected to MongoDB');
+  weatherPrefetchService.start();
 })
 .catch((err) => {
   console.error('❌ MongoDB connection error:', err);
@@ -95,7 +109,25 @@ app.get('/api/health', (req, res) => {
     status: 'OK',
     message: 'Virtual Travel Assistant API is running',
     timestamp: new Date().toISOString(),
-    version: '1.0.0'
+    version: '1.0.0',
+    metrics: {
+      aiProviders: aiService.getProviderStats(),
+      itineraryCache: itineraryCache.getStats(),
+      weatherCache: weatherService.getCacheStats(),
+      weatherPrefetch: weatherPrefetchService.getStats(),
+      placesCache: placesService.getCacheStats(),
+      tripGeneration: tripGenerationService.getStats(),
+      tripCounts: tripCountCache.getStats(),
+      coalescing: [
+        aiService.getCoalescingStats(),
+        weatherService.getCoalescingStats(),
+        placesService.getCoalescingStats(),
+        placesService.getDetailsCoalescingStats(),
+        placesService.getTileCoalescingStats(),
+        tripCountCache.getCoalescingStats()
+      ],
+      outboundHttp: getHttpStats()
+    }
   });
 });
 
@@ -104,6 +136,8 @@ app.use('/api/auth', authRoutes);
 app.use('/api/users', authenticateToken, userRoutes);
 app.use('/api/trips', authenticateToken, tripRoutes);
 app.use('/api/itinerary', authenticateToken, itineraryRoutes);
+// Registered before the authenticated places routes; photos are loaded by <img> tags
+app.use('/api/places/photo', placePhotoRoutes);
 app.use('/api/places', authenticateToken, placesRoutes);
 app.use('/api/weather', authenticateToken, weatherRoutes);
 
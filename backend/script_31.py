@@ -0,0 +1,166 @@
+# Create weather aggregation benchmark
+import os
+
+os.makedirs("travel-backend/benchmarks", exist_ok=True)
+
+weather_aggregation_benchmark = """// Microbenchmark: WeatherService.groupForecastsByDay against the previous
+// array-and-reduce implementation. Run with: npm run bench:weather
+import { performance } from 'perf_hooks';
+import weatherService from '../services/weatherService.js';
+
+const WEATHER = [
+  { id: 800, main: 'Clear', description: 'clear sky', icon: '01d' },
+  { id: 802, main: 'Clouds', description: 'scattered clouds', icon: '03d' },
+  { id: 500, main: 'Rain', description: 'light rain', icon: '10d' },
+  { id: 600, main: 'Snow', description: 'light snow', icon: '13d' }
+];
+
+// Previous implementation, kept as the baseline
+const legacyGroupForecastsByDay = (forecasts) => {
+  const dailyData = {};
+
+  forecasts.forEach(forecast => {
+    const date = new Date(forecast.dt * 1000).toDateString();
+
+    if (!dailyData[date]) {
+      dailyData[date] = {
+        date: new Date(forecast.dt * 1000).toISOString().split('T')[0],
+        temperatures: [],
+        conditions: [],
+        humidity: [],
+        wind: [],
+        precipitation: 0,
+        forecasts: []
+      };
+    }
+
+    dailyData[date].temperatures.push(forecast.main.temp);
+    dailyData[date].conditions.push(forecast.weather[0]);
+    dailyData[date].humidity.push(forecast.main.humidity);
+    dailyData[date].wind.push(forecast.wind);
+
+    if (forecast.rain && forecast.rain['3h']) {
+      dailyData[date].precipitation += forecast.rain['3h'];
+    }
+    if (forecast.snow && forecast.snow['3h']) {
+      dailyData[date].precipitation += forecast.snow['3h'];
+    }
+
+    dailyData[date].forecasts.push({
+      time: new Date(forecast.dt * 1000).toLocaleTimeString('en-US', {
+        hour: '2-digit',
+        minute: '2-digit',
+        hour12: false
+      }),
+      temperature: Math.round(forecast.main.temp),
+      condition: forecast.weather[0].main,
+      description: forecast.weather[0].description,
+      icon: forecast.weather[0].icon
+    });
+  });
+
+  const mostFrequent = (conditions) => {
+    const counts = {};
+    let maxCount = 0;
+    let winner = conditions[0];
+
+    conditions.forEach(condition => {
+      counts[condition.main] = (counts[condition.main] || 0) + 1;
+      if (counts[condition.main] > maxCount) {
+        maxCount = counts[condition.main];
+        winner = condition;
+      }
+    });
+
+    return { main: winner.main, description: winner.description, icon: winner.icon };
+  };
+
+  return Object.values(dailyData).map(day => ({
+    date: day.date,
+    temperature: {
+      min: Math.round(Math.min(...day.temperatures)),
+      max: Math.round(Math.max(...day.temperatures)),
+      avg: Math.round(day.temperatures.reduce((a, b) => a + b, 0) / day.temperatures.length)
+    },
+    condition: mostFrequent(day.conditions),
+    humidity: Math.round(day.humidity.reduce((a, b) => a + b, 0) / day.humidity.length),
+    windSpeed: Math.round(day.wind.reduce((sum, w) => sum + (w.speed || 0), 0) / day.wind.length),
+    precipitation: Math.round(day.precipitation * 100) / 100,
+    hourlyForecasts: day.forecasts
+  }));
+};
+
+// Deterministic 5-day / 3-hour forecast list shaped like OpenWeather's /forecast response
+const buildForecastList = (seed, samples = 40) => {
+  const start = Date.UTC(2024, 5, 1) / 1000;
+
+  return Array.from({ length: samples }, (_, i) => {
+    const weather = WEATHER[(seed + i) % WEATHER.length];
+    return {
+      dt: start + i * 3 * 60 * 60,
+      main: {
+        temp: 15 + 10 * Math.sin((seed + i) / 4),
+        humidity: 40 + ((seed * 7 + i * 13) % 50)
+      },
+      weather: [weather],
+      wind: { speed: 1 + ((seed + i) % 9) },
+      ...(weather.main === 'Rain' && { rain: { '3h': 0.5 + (i % 4) } }),
+      ...(weather.main === 'Snow' && { snow: { '3h': 0.2 + (i % 3) } })
+    };
+  });
+};
+
+const measure = (fn, iterations) => {
+  // Warm up so both implementations are measured after JIT compilation
+  for (let i = 0; i < Math.min(iterations, 100); i++) fn();
+
+  const startedAt = performance.now();
+  for (let i = 0; i < iterations; i++) fn();
+  const elapsed = performance.now() - startedAt;
+
+  return {
+    msPerOp: elapsed / iterations,
+    opsPerSec: Math.round((iterations / elapsed) * 1000)
+  };
+};
+
+const compare = (name, iterations, legacy, current) => {
+  const before = measure(legacy, iterations);
+  const after = measure(current, iterations);
+
+  return {
+    case: name,
+    'legacy ops/s': before.opsPerSec,
+    'single-pass ops/s': after.opsPerSec,
+    speedup: `${(before.msPerOp / after.msPerOp).toFixed(1)}x`
+  };
+};
+
+const single = buildForecastList(1);
+const cities = Array.from({ length: 50 }, (_, i) => ({
+  list: buildForecastList(i),
+  timezone: ((i % 24) - 11) * 60 * 60
+}));
+
+const results = [
+  compare(
+    '1 city x 40 samples',
+    2000,
+    () => legacyGroupForecastsByDay(single),
+    () => weatherService.groupForecastsByDay(single, 0)
+  ),
+  compare(
+    '50 cities x 40 samples',
+    50,
+    () => cities.forEach(city => legacyGroupForecastsByDay(city.list)),
+    () => cities.forEach(city => weatherService.groupForecastsByDay(city.list, city.timezone))
+  )
+];
+
+console.table(results);
+"""
+
+with open("travel-backend/benchmarks/weatherAggregation.js", "w") as f:
+    f.write(weather_aggregation_benchmark)
+
+print("Weather aggregation benchmark created successfully!")
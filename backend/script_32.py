@@ -0,0 +1,93 @@
+# Create geocoding service
+geocoding_service = """import TieredCache from '../utils/tieredCache.js';
+import SingleFlight, { flightKey } from '../utils/singleFlight.js';
+import weatherService from './weatherService.js';
+import placesService from './placesService.js';
+
+// Resolves a free-text destination to coordinates, a Google place id and an OpenWeather
+// city id once, so later weather and places lookups can go by id instead of by name
+class GeocodingService {
+  constructor() {
+    this.cache = new TieredCache({
+      namespace: 'geocode',
+      max: 2000,
+      ttl: 30 * 24 * 60 * 60 * 1000
+    });
+    this.inflight = new SingleFlight({ name: 'geocode', timeoutMs: 15000, clone: true });
+  }
+
+  isResolved(destination) {
+    return destination.coordinates?.latitude !== undefined && !!destination.owmCityId;
+  }
+
+  // Destination with coordinates, placeId, owmCityId and countryCode filled in where they
+  // could be resolved. Never throws: an unresolvable destination is returned unchanged.
+  async resolve(destination) {
+    if (this.isResolved(destination)) return destination;
+
+    const key = flightKey(destination.city, destination.country);
+
+    try {
+      let resolved = await this.cache.get(key);
+
+      if (!resolved) {
+        resolved = await this.inflight.do(key, () => this.lookup(destination.city, destination.country));
+        if (!resolved) return destination;
+
+        this.cache.set(key, resolved)
+          .catch(error => console.warn('Geocode cache write failed:', error.message));
+      }
+
+      return this.merge(destination, resolved);
+    } catch (error) {
+      console.warn(`Geocoding ${destination.city}, ${destination.country} failed:`, error.message);
+      return destination;
+    }
+  }
+
+  // Fill in only what the destination does not already have
+  merge(destination, resolved) {
+    const merged = { ...destination };
+
+    if (merged.coordinates?.latitude === undefined) merged.coordinates = resolved.coordinates;
+    ['placeId', 'owmCityId', 'countryCode'].forEach(field => {
+      if (!merged[field] && resolved[field]) merged[field] = resolved[field];
+    });
+
+    return merged;
+  }
+
+  async lookup(city, country) {
+    const [weather, place] = await Promise.all([
+      weatherService.getCurrentWeather(city, country).catch(error => {
+        console.warn('OpenWeather geocoding failed:', error.message);
+        return null;
+      }),
+      placesService.findPlace(`${city}, ${country}`).catch(error => {
+        console.warn('Places geocoding failed:', error.message);
+        return null;
+      })
+    ]);
+
+    if (!weather && !place) return null;
+
+    const coordinates = place
+      ? { latitude: place.location.lat, longitude: place.location.lng }
+      : { latitude: weather.location.coordinates.lat, longitude: weather.location.coordinates.lon };
+
+    return {
+      coordinates,
+      placeId: place?.placeId,
+      owmCityId: weather?.location.id,
+      countryCode: weather?.location.country
+    };
+  }
+}
+
+export default new GeocodingService();
+"""
+
+with open("travel-backend/services/geocodingService.js", "w") as f:
+    f.write(geocoding_service)
+
+print("Geocoding service created successfully!")
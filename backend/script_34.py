@@ -0,0 +1,314 @@
+# Create weather recommendation rules, their lookup table compiler and benchmark
+import os
+
+os.makedirs("travel-backend/data", exist_ok=True)
+os.makedirs("travel-backend/benchmarks", exist_ok=True)
+
+weather_rules = """// Weather recommendation rules, compiled into a lookup table by WeatherService.
+// `when` holds the conditions a day must meet: numeric inputs take lt/lte/gt/gte
+// bounds (temperatures in Celsius, precipitation in mm), condition takes a list of
+// OpenWeather main conditions. Matching rules contribute their recommendations in
+// table order.
+export const WEATHER_RULES = [
+  // Temperature
+  {
+    when: { temperature: { lt: 0 } },
+    recommendations: [
+      {
+        type: 'clothing',
+        message: 'Very cold weather - wear heavy winter clothing, including warm layers, gloves, and waterproof boots.'
+      },
+      {
+        type: 'activity',
+        message: 'Consider indoor activities like museums, shopping centers, or cozy cafes.'
+      }
+    ]
+  },
+  {
+    when: { temperature: { gte: 0, lt: 10 } },
+    recommendations: [{
+      type: 'clothing',
+      message: 'Cold weather - dress in warm layers, bring a jacket and comfortable walking shoes.'
+    }]
+  },
+  {
+    when: { temperature: { gte: 10, lt: 20 } },
+    recommendations: [{
+      type: 'clothing',
+      message: 'Cool weather - light layers recommended, bring a light jacket for evening.'
+    }]
+  },
+  {
+    when: { temperature: { gte: 20, lt: 30 } },
+    recommendations: [{
+      type: 'clothing',
+      message: 'Pleasant weather - comfortable clothing, light layers for temperature changes.'
+    }]
+  },
+  {
+    when: { temperature: { gte: 30 } },
+    recommendations: [
+      {
+        type: 'clothing',
+        message: 'Hot weather - wear light, breathable clothing, hat, and sunscreen.'
+      },
+      {
+        type: 'activity',
+        message: 'Stay hydrated and consider indoor activities during peak heat hours (12-4 PM).'
+      }
+    ]
+  },
+
+  // Precipitation
+  {
+    when: { precipitation: { gt: 5 } },
+    recommendations: [{
+      type: 'weather',
+      message: 'Heavy rain expected - bring umbrella, waterproof clothing, and plan indoor activities.'
+    }]
+  },
+  {
+    when: { precipitation: { gt: 0, lte: 5 } },
+    recommendations: [{
+      type: 'weather',
+      message: 'Light rain possible - bring umbrella or light rain jacket.'
+    }]
+  },
+
+  // Conditions
+  {
+    when: { condition: ['Snow'] },
+    recommendations: [{
+      type: 'activity',
+      message: 'Snowy conditions - great for winter sports but be cautious of slippery surfaces.'
+    }]
+  },
+  {
+    when: { condition: ['Clear'] },
+    recommendations: [{
+      type: 'activity',
+      message: 'Perfect weather for outdoor activities, sightseeing, and photography.'
+    }]
+  },
+  {
+    when: { condition: ['Clouds'] },
+    recommendations: [{
+      type: 'activity',
+      message: 'Overcast but good for walking tours and outdoor activities.'
+    }]
+  },
+  {
+    when: { condition: ['Thunderstorm'] },
+    recommendations: [{
+      type: 'safety',
+      message: 'Thunderstorm conditions - avoid outdoor activities and seek shelter.'
+    }]
+  }
+];
+"""
+
+weather_rule_table = """// Compiles the weather recommendation rules into a lookup table. Temperature and
+// precipitation are reduced to buckets by the bounds the rules mention, the condition
+// by the values they list. Every rule is evaluated once per bucket combination at
+// startup, so a lookup costs a few comparisons however many rules there are.
+
+const COMPARATORS = {
+  lt: (value, bound) => value < bound,
+  lte: (value, bound) => value <= bound,
+  gt: (value, bound) => value > bound,
+  gte: (value, bound) => value >= bound
+};
+
+// Bounds split the number line into open intervals and the bound points themselves.
+// The last bucket is for a missing value, which no bound matches.
+const numericAxis = (rules, name) => {
+  const bounds = rules.flatMap(rule => Object.values(rule.when[name] || {}));
+  const points = [...new Set(bounds)].sort((a, b) => a - b);
+  const samples = [];
+
+  points.forEach((point, i) => {
+    samples.push(i === 0 ? point - 1 : (points[i - 1] + point) / 2, point);
+  });
+  samples.push(points.length > 0 ? points[points.length - 1] + 1 : 0, NaN);
+
+  const missing = samples.length - 1;
+
+  return {
+    samples,
+    bucket: (value) => {
+      if (typeof value !== 'number' || Number.isNaN(value)) return missing;
+
+      let i = 0;
+      while (i < points.length && value > points[i]) i++;
+      return i < points.length && value === points[i] ? 2 * i + 1 : 2 * i;
+    }
+  };
+};
+
+// Listed values get a bucket each; anything else falls into the last one
+const categoricalAxis = (rules, name) => {
+  const listed = [...new Set(rules.flatMap(rule => rule.when[name] || []))];
+  const index = new Map(listed.map((value, i) => [value, i]));
+  const other = listed.length;
+
+  return {
+    samples: [...listed, undefined],
+    bucket: (value) => index.get(value) ?? other
+  };
+};
+
+const matches = (rule, sample) => Object.entries(rule.when).every(([name, condition]) =>
+  Array.isArray(condition)
+    ? condition.includes(sample[name])
+    : Object.entries(condition).every(([operator, bound]) => COMPARATORS[operator](sample[name], bound)));
+
+// Returns recommend(temperature, precipitation, condition). The arrays it returns
+// are frozen and shared between calls.
+export const compileWeatherRules = (rules) => {
+  const temperatureAxis = numericAxis(rules, 'temperature');
+  const precipitationAxis = numericAxis(rules, 'precipitation');
+  const conditionAxis = categoricalAxis(rules, 'condition');
+
+  const precipitationSize = precipitationAxis.samples.length;
+  const conditionSize = conditionAxis.samples.length;
+
+  const frozenRules = rules.map(rule => rule.recommendations.map(item => Object.freeze({ ...item })));
+  const shared = new Map();
+  const table = [];
+
+  // Row-major over temperature, precipitation, condition
+  temperatureAxis.samples.forEach(temperature => {
+    precipitationAxis.samples.forEach(precipitation => {
+      conditionAxis.samples.forEach(condition => {
+        const sample = { temperature, precipitation, condition };
+        const matched = rules.flatMap((rule, i) => matches(rule, sample) ? [i] : []);
+
+        // Combinations that match the same rules share one array
+        const signature = matched.join(',');
+        if (!shared.has(signature)) {
+          shared.set(signature, Object.freeze(matched.flatMap(i => frozenRules[i])));
+        }
+        table.push(shared.get(signature));
+      });
+    });
+  });
+
+  return (temperature, precipitation, condition) => table[
+    (temperatureAxis.bucket(temperature) * precipitationSize + precipitationAxis.bucket(precipitation)) * conditionSize +
+    conditionAxis.bucket(condition)
+  ];
+};
+"""
+
+weather_recommendations_benchmark = """// Microbenchmark: WeatherService.getWeatherRecommendations against the previous
+// if-chain implementation. Run with: npm run bench:recommendations
+import { performance } from 'perf_hooks';
+import weatherService from '../services/weatherService.js';
+
+// Previous implementation, kept as the baseline
+const legacyGetWeatherRecommendations = (weatherData) => {
+  const recommendations = [];
+  const temp = weatherData.current?.temperature || weatherData.temperature?.avg;
+  const condition = weatherData.current?.condition || weatherData.condition?.main;
+  const precipitation = weatherData.precipitation || 0;
+
+  if (temp < 0) {
+    recommendations.push({ type: 'clothing', message: 'Very cold weather - wear heavy winter clothing, including warm layers, gloves, and waterproof boots.' });
+    recommendations.push({ type: 'activity', message: 'Consider indoor activities like museums, shopping centers, or cozy cafes.' });
+  } else if (temp < 10) {
+    recommendations.push({ type: 'clothing', message: 'Cold weather - dress in warm layers, bring a jacket and comfortable walking shoes.' });
+  } else if (temp < 20) {
+    recommendations.push({ type: 'clothing', message: 'Cool weather - light layers recommended, bring a light jacket for evening.' });
+  } else if (temp < 30) {
+    recommendations.push({ type: 'clothing', message: 'Pleasant weather - comfortable clothing, light layers for temperature changes.' });
+  } else {
+    recommendations.push({ type: 'clothing', message: 'Hot weather - wear light, breathable clothing, hat, and sunscreen.' });
+    recommendations.push({ type: 'activity', message: 'Stay hydrated and consider indoor activities during peak heat hours (12-4 PM).' });
+  }
+
+  if (precipitation > 5) {
+    recommendations.push({ type: 'weather', message: 'Heavy rain expected - bring umbrella, waterproof clothing, and plan indoor activities.' });
+  } else if (precipitation > 0) {
+    recommendations.push({ type: 'weather', message: 'Light rain possible - bring umbrella or light rain jacket.' });
+  }
+
+  switch (condition) {
+    case 'Snow':
+      recommendations.push({ type: 'activity', message: 'Snowy conditions - great for winter sports but be cautious of slippery surfaces.' });
+      break;
+    case 'Clear':
+      recommendations.push({ type: 'activity', message: 'Perfect weather for outdoor activities, sightseeing, and photography.' });
+      break;
+    case 'Clouds':
+      recommendations.push({ type: 'activity', message: 'Overcast but good for walking tours and outdoor activities.' });
+      break;
+    case 'Thunderstorm':
+      recommendations.push({ type: 'safety', message: 'Thunderstorm conditions - avoid outdoor activities and seek shelter.' });
+      break;
+  }
+
+  return recommendations;
+};
+
+const CONDITIONS = ['Clear', 'Clouds', 'Rain', 'Snow', 'Thunderstorm', 'Drizzle', 'Mist'];
+
+// Deterministic daily forecasts shaped like the /api/weather/trip response
+const buildDays = (count) => Array.from({ length: count }, (_, i) => ({
+  temperature: { avg: -10 + ((i * 7) % 45) + 0.5 },
+  condition: { main: CONDITIONS[i % CONDITIONS.length] },
+  precipitation: (i * 3) % 11
+}));
+
+const measure = (fn, iterations) => {
+  // Warm up so both implementations are measured after JIT compilation
+  for (let i = 0; i < Math.min(iterations, 1000); i++) fn();
+
+  const startedAt = performance.now();
+  for (let i = 0; i < iterations; i++) fn();
+  const elapsed = performance.now() - startedAt;
+
+  return {
+    msPerOp: elapsed / iterations,
+    opsPerSec: Math.round((iterations / elapsed) * 1000)
+  };
+};
+
+const compare = (name, iterations, days) => {
+  // Keep the results, as the trip route does, so allocations cannot be optimized away
+  const before = measure(() => days.map(day => legacyGetWeatherRecommendations(day)), iterations);
+  const after = measure(() => days.map(day => weatherService.getWeatherRecommendations(day)), iterations);
+
+  return {
+    case: name,
+    'if-chain ops/s': before.opsPerSec,
+    'compiled ops/s': after.opsPerSec,
+    speedup: `${(before.msPerOp / after.msPerOp).toFixed(1)}x`
+  };
+};
+
+// Both implementations must agree before their speed is worth comparing
+const sample = buildDays(500);
+const mismatch = sample.find(day =>
+  JSON.stringify(legacyGetWeatherRecommendations(day)) !== JSON.stringify(weatherService.getWeatherRecommendations(day)));
+if (mismatch) {
+  console.error('Implementations disagree for', mismatch);
+  process.exit(1);
+}
+
+console.table([
+  compare('1 day', 200000, buildDays(1)),
+  compare('30-day trip', 20000, buildDays(30)),
+  compare('50-city batch x 5 days', 5000, buildDays(250))
+]);
+"""
+
+with open("travel-backend/data/weatherRules.js", "w") as f:
+    f.write(weather_rules)
+
+with open("travel-backend/utils/weatherRuleTable.js", "w") as f:
+    f.write(weather_rule_table)
+
+with open("travel-backend/benchmarks/weatherRecommendations.js", "w") as f:
+    f.write(weather_recommendations_benchmark)
+
+print("Weather recommendation rules created successfully!")
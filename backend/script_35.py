@@ -0,0 +1,193 @@
+# Create Place model and the place details cache
+place_model = """import mongoose from 'mongoose';
+
+const PLACE_TTL_DAYS = parseInt(process.env.PLACES_CACHE_TTL_DAYS) || 7;
+
+// Google place data by placeId: search results for the local place index and full
+// details for the details cache. Documents expire PLACES_CACHE_TTL_DAYS after refreshedAt.
+const placeSchema = new mongoose.Schema({
+  placeId: {
+    type: String,
+    required: true
+  },
+  name: String,
+  location: {
+    type: {
+      type: String,
+      enum: ['Point']
+    },
+    // [longitude, latitude]. No default: an empty array would be inserted for places
+    // upserted without a location (details-only) and rejected by the 2dsphere index
+    coordinates: {
+      type: [Number],
+      default: undefined
+    }
+  },
+  types: [String],
+  rating: Number,
+  priceLevel: Number,
+  tags: [String], // Searches that returned the place, e.g. 'cuisine:italian'
+  summary: mongoose.Schema.Types.Mixed, // PlacesService.formatPlacesResponse entry
+  details: mongoose.Schema.Types.Mixed, // PlacesService.formatPlaceDetails output
+  notFound: {
+    type: Boolean,
+    default: false
+  },
+  detailsRefreshedAt: Date,
+  refreshedAt: {
+    type: Date,
+    required: true
+  }
+}, {
+  minimize: false
+});
+
+placeSchema.index({ placeId: 1 }, { unique: true });
+placeSchema.index({ location: '2dsphere' });
+placeSchema.index({ types: 1 });
+placeSchema.index({ rating: -1 });
+placeSchema.index({ priceLevel: 1 });
+placeSchema.index({ refreshedAt: 1 }, { expireAfterSeconds: PLACE_TTL_DAYS * 24 * 60 * 60 });
+
+const Place = mongoose.model('Place', placeSchema);
+
+export default Place;
+"""
+
+place_details_cache = """import mongoose from 'mongoose';
+import LRUCache from '../utils/lruCache.js';
+import Place from '../models/Place.js';
+
+const HOUR = 60 * 60 * 1000;
+const DAY = 24 * HOUR;
+
+// Place details by placeId: a byte-bounded LRU in front of the places collection.
+// Ids Google reports as invalid are remembered as null for a shorter period.
+class PlaceDetailsCache {
+  constructor() {
+    this.ttl = (parseInt(process.env.PLACES_CACHE_TTL_DAYS) || 7) * DAY;
+    this.negativeTtl = (parseInt(process.env.PLACES_NEGATIVE_TTL_HOURS) || 6) * HOUR;
+    this.memory = new LRUCache({
+      max: 50000,
+      maxBytes: (parseInt(process.env.PLACES_CACHE_MAX_MB) || 32) * 1024 * 1024,
+      ttl: this.ttl
+    });
+    this.stats = {
+      memoryHits: 0,
+      sharedHits: 0,
+      negativeHits: 0,
+      misses: 0,
+      writes: 0,
+      errors: 0
+    };
+  }
+
+  isSharedAvailable() {
+    return mongoose.connection.readyState === 1;
+  }
+
+  // Cached entries for placeIds in one query: a Map of placeId to details, or to null
+  // for a known invalid id. Ids that are not cached are absent from the Map.
+  async getMany(placeIds) {
+    const ids = [...new Set(placeIds)];
+    const found = new Map();
+    const missing = [];
+
+    for (const placeId of ids) {
+      const value = this.memory.get(placeId);
+      if (value === undefined) {
+        missing.push(placeId);
+        continue;
+      }
+
+      this.stats.memoryHits++;
+      if (value === null) this.stats.negativeHits++;
+      found.set(placeId, value && structuredClone(value));
+    }
+
+    if (missing.length > 0 && this.isSharedAvailable()) {
+      try {
+        const now = Date.now();
+        const places = await Place.find({
+          placeId: { $in: missing },
+          detailsRefreshedAt: { $gt: new Date(now - this.ttl) }
+        })
+          .select('placeId details notFound detailsRefreshedAt')
+          .lean();
+
+        places.forEach(place => {
+          const ttl = (place.notFound ? this.negativeTtl : this.ttl) - (now - place.detailsRefreshedAt.getTime());
+          if (ttl <= 0 || (!place.notFound && !place.details)) return;
+
+          this.stats.sharedHits++;
+          if (place.notFound) this.stats.negativeHits++;
+
+          const value = place.notFound ? null : place.details;
+          this.memory.set(place.placeId, value, { ttl });
+          found.set(place.placeId, value && structuredClone(value));
+        });
+      } catch (error) {
+        this.stats.errors++;
+        console.warn('Place cache read failed:', error.message);
+      }
+    }
+
+    this.stats.misses += ids.length - found.size;
+    return found;
+  }
+
+  async get(placeId) {
+    return (await this.getMany([placeId])).get(placeId);
+  }
+
+  set(placeId, details) {
+    return this.write(placeId, { details, notFound: false }, this.ttl);
+  }
+
+  setNotFound(placeId) {
+    return this.write(placeId, { details: null, notFound: true }, this.negativeTtl);
+  }
+
+  async write(placeId, fields, ttl) {
+    // Keep a private copy; callers are free to mutate the details they return
+    this.memory.set(placeId, fields.details && structuredClone(fields.details), { ttl });
+    this.stats.writes++;
+
+    if (!this.isSharedAvailable()) return;
+
+    try {
+      const now = new Date();
+      await Place.updateOne(
+        { placeId },
+        { $set: { ...fields, detailsRefreshedAt: now, refreshedAt: now } },
+        { upsert: true }
+      );
+    } catch (error) {
+      this.stats.errors++;
+      console.warn('Place cache write failed:', error.message);
+    }
+  }
+
+  getStats() {
+    const hits = this.stats.memoryHits + this.stats.sharedHits;
+    const lookups = hits + this.stats.misses;
+
+    return {
+      entries: this.memory.size,
+      bytes: this.memory.bytes,
+      ...this.stats,
+      hitRate: lookups > 0 ? Math.round((hits / lookups) * 1000) / 1000 : 0
+    };
+  }
+}
+
+export default new PlaceDetailsCache();
+"""
+
+with open("travel-backend/models/Place.js", "w") as f:
+    f.write(place_model)
+
+with open("travel-backend/services/placeDetailsCache.js", "w") as f:
+    f.write(place_details_cache)
+
+print("Place details cache created successfully!")
@@ -0,0 +1,118 @@
+# Create geohash and distance helpers
+geo_utils = """// Geohash tiles and great-circle distances for location-keyed caching
+
+const BASE32 = '0123456789bcdefghjkmnpqrstuvwxyz';
+const EARTH_RADIUS_METERS = 6371000;
+export const METERS_PER_DEGREE = 111320;
+
+const toRadians = (degrees) => degrees * Math.PI / 180;
+
+// Geohash of a point; each character adds 5 bits, alternating longitude and latitude
+export const encodeGeohash = (lat, lng, precision) => {
+  let minLat = -90;
+  let maxLat = 90;
+  let minLng = -180;
+  let maxLng = 180;
+  let hash = '';
+  let bits = 0;
+  let value = 0;
+  let isLng = true;
+
+  while (hash.length < precision) {
+    if (isLng) {
+      const mid = (minLng + maxLng) / 2;
+      value = value * 2 + (lng >= mid ? 1 : 0);
+      if (lng >= mid) minLng = mid; else maxLng = mid;
+    } else {
+      const mid = (minLat + maxLat) / 2;
+      value = value * 2 + (lat >= mid ? 1 : 0);
+      if (lat >= mid) minLat = mid; else maxLat = mid;
+    }
+
+    isLng = !isLng;
+    if (++bits === 5) {
+      hash += BASE32[value];
+      bits = 0;
+      value = 0;
+    }
+  }
+
+  return hash;
+};
+
+// Tile size in degrees at a precision
+export const geohashCellSize = (precision) => {
+  const bits = precision * 5;
+  return {
+    lat: 180 / 2 ** Math.floor(bits / 2),
+    lng: 360 / 2 ** Math.ceil(bits / 2)
+  };
+};
+
+export const decodeGeohashBounds = (hash) => {
+  let minLat = -90;
+  let maxLat = 90;
+  let minLng = -180;
+  let maxLng = 180;
+  let isLng = true;
+
+  for (const char of hash) {
+    const value = BASE32.indexOf(char);
+    for (let bit = 4; bit >= 0; bit--) {
+      const on = (value >> bit) & 1;
+      if (isLng) {
+        const mid = (minLng + maxLng) / 2;
+        if (on) minLng = mid; else maxLng = mid;
+      } else {
+        const mid = (minLat + maxLat) / 2;
+        if (on) minLat = mid; else maxLat = mid;
+      }
+      isLng = !isLng;
+    }
+  }
+
+  return { minLat, maxLat, minLng, maxLng };
+};
+
+export const haversineMeters = (from, to) => {
+  const dLat = toRadians(to.lat - from.lat);
+  const dLng = toRadians(to.lng - from.lng);
+  const a = Math.sin(dLat / 2) ** 2 +
+    Math.cos(toRadians(from.lat)) * Math.cos(toRadians(to.lat)) * Math.sin(dLng / 2) ** 2;
+
+  return 2 * EARTH_RADIUS_METERS * Math.asin(Math.min(1, Math.sqrt(a)));
+};
+
+// Every tile at a precision that intersects the bounding box of a circle
+export const coveringGeohashes = ({ lat, lng }, radiusMeters, precision) => {
+  const cell = geohashCellSize(precision);
+  const dLat = radiusMeters / METERS_PER_DEGREE;
+  const dLng = dLat / Math.max(Math.cos(toRadians(lat)), 0.01);
+
+  const minRow = Math.floor((Math.max(lat - dLat, -90) + 90) / cell.lat);
+  const maxRow = Math.floor((Math.min(lat + dLat, 90 - 1e-9) + 90) / cell.lat);
+  const minColumn = Math.floor((lng - dLng + 180) / cell.lng);
+  const maxColumn = Math.floor((lng + dLng + 180) / cell.lng);
+  const columns = Math.round(360 / cell.lng);
+
+  const tiles = new Set();
+  for (let row = minRow; row <= maxRow; row++) {
+    for (let column = minColumn; column <= maxColumn; column++) {
+      // Wrap around the antimeridian
+      const wrapped = ((column % columns) + columns) % columns;
+      tiles.add(encodeGeohash(
+        (row + 0.5) * cell.lat - 90,
+        (wrapped + 0.5) * cell.lng - 180,
+        precision
+      ));
+    }
+  }
+
+  return [...tiles];
+};
+"""
+
+with open("travel-backend/utils/geo.js", "w") as f:
+    f.write(geo_utils)
+
+print("Geo utilities created successfully!")
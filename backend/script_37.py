@@ -0,0 +1,199 @@
+# Create local place index and its coverage records
+place_coverage_model = """import mongoose from 'mongoose';
+
+const COVERAGE_TTL_HOURS = parseInt(process.env.PLACES_COVERAGE_TTL_HOURS) || 24;
+
+// A search whose results are in the places collection, keyed like the search itself
+// (e.g. 'nearby|u09tv|restaurant'), with the circle it covered. Records expire
+// PLACES_COVERAGE_TTL_HOURS after refreshedAt.
+const placeCoverageSchema = new mongoose.Schema({
+  key: {
+    type: String,
+    required: true
+  },
+  center: {
+    lat: Number,
+    lng: Number
+  },
+  radius: {
+    type: Number,
+    required: true
+  },
+  refreshedAt: {
+    type: Date,
+    required: true
+  }
+});
+
+placeCoverageSchema.index({ key: 1 }, { unique: true });
+placeCoverageSchema.index({ refreshedAt: 1 }, { expireAfterSeconds: COVERAGE_TTL_HOURS * 60 * 60 });
+
+const PlaceCoverage = mongoose.model('PlaceCoverage', placeCoverageSchema);
+
+export default PlaceCoverage;
+"""
+
+place_index = """import mongoose from 'mongoose';
+import Place from '../models/Place.js';
+import PlaceCoverage from '../models/PlaceCoverage.js';
+import { haversineMeters } from '../utils/geo.js';
+
+const EARTH_RADIUS_METERS = 6371000;
+const MIN_COVERAGE_RADIUS = 1000;
+const MAX_COVERAGE_RADIUS = 50000;
+
+const hasLocation = (place) => Number.isFinite(place.location?.lat) && Number.isFinite(place.location?.lng);
+
+// Every place Google has returned, in the places collection with a 2dsphere index, and a
+// coverage record for each search that put them there. While a search's coverage is
+// fresh it is answered from MongoDB instead of Google.
+class PlaceIndex {
+  constructor() {
+    this.coverageTtl = (parseInt(process.env.PLACES_COVERAGE_TTL_HOURS) || 24) * 60 * 60 * 1000;
+    this.stats = {
+      localHits: 0,
+      misses: 0,
+      upserts: 0,
+      errors: 0
+    };
+  }
+
+  isAvailable() {
+    return mongoose.connection.readyState === 1;
+  }
+
+  // Store search results; tag marks the search that found them (e.g. 'cuisine:italian').
+  // Resolves to whether the places were written.
+  async upsert(places, { tag } = {}) {
+    if (!this.isAvailable()) return false;
+
+    const located = places.filter(hasLocation);
+    if (located.length === 0) return true;
+
+    const now = new Date();
+    const operations = located.map(place => ({
+      updateOne: {
+        filter: { placeId: place.placeId },
+        update: {
+          $set: {
+            name: place.name,
+            location: { type: 'Point', coordinates: [place.location.lng, place.location.lat] },
+            types: place.types,
+            rating: place.rating,
+            priceLevel: place.priceLevel,
+            summary: place,
+            refreshedAt: now
+          },
+          ...(tag && { $addToSet: { tags: tag } })
+        },
+        upsert: true
+      }
+    }));
+
+    try {
+      await Place.bulkWrite(operations, { ordered: false });
+      this.stats.upserts += operations.length;
+      return true;
+    } catch (error) {
+      this.stats.errors++;
+      console.warn('Place index write failed:', error.message);
+      return false;
+    }
+  }
+
+  // Index a search's results and mark it covered. Text searches have no fixed area, so
+  // without a center the circle spanning their results is recorded.
+  async recordSearch(key, places, { tag, center, radius } = {}) {
+    if (!(await this.upsert(places, { tag }))) return;
+
+    const area = center ? { center, radius } : this.resultArea(places);
+    if (!area) return;
+
+    try {
+      await PlaceCoverage.updateOne(
+        { key },
+        { $set: { ...area, refreshedAt: new Date() } },
+        { upsert: true }
+      );
+    } catch (error) {
+      this.stats.errors++;
+      console.warn('Place coverage write failed:', error.message);
+    }
+  }
+
+  resultArea(places) {
+    const located = places.filter(hasLocation);
+    if (located.length === 0) return null;
+
+    const center = {
+      lat: located.reduce((sum, place) => sum + place.location.lat, 0) / located.length,
+      lng: located.reduce((sum, place) => sum + place.location.lng, 0) / located.length
+    };
+    const farthest = Math.max(...located.map(place => haversineMeters(center, place.location)));
+
+    return {
+      center,
+      radius: Math.min(Math.max(Math.ceil(farthest), MIN_COVERAGE_RADIUS), MAX_COVERAGE_RADIUS)
+    };
+  }
+
+  // Best rated indexed places in the area a fresh search covered, filtered like the
+  // search's own results; null when the search has to go to Google
+  async search(key, { types, tag = null, priceLevel = null, limit = 20 }) {
+    if (!this.isAvailable()) return null;
+
+    try {
+      const coverage = await PlaceCoverage.findOne({
+        key,
+        refreshedAt: { $gt: new Date(Date.now() - this.coverageTtl) }
+      }).lean();
+
+      if (!coverage) {
+        this.stats.misses++;
+        return null;
+      }
+
+      const { center, radius } = coverage;
+      const places = await Place.find({
+        location: {
+          $geoWithin: { $centerSphere: [[center.lng, center.lat], radius / EARTH_RADIUS_METERS] }
+        },
+        types: { $in: types },
+        summary: { $exists: true },
+        ...(tag && { tags: tag }),
+        ...(priceLevel && { priceLevel })
+      })
+        .sort({ rating: -1 })
+        .limit(limit)
+        .select('summary')
+        .lean();
+
+      this.stats.localHits++;
+      return places.map(place => place.summary);
+    } catch (error) {
+      this.stats.errors++;
+      console.warn('Place index read failed:', error.message);
+      return null;
+    }
+  }
+
+  getStats() {
+    const lookups = this.stats.localHits + this.stats.misses;
+
+    return {
+      ...this.stats,
+      hitRate: lookups > 0 ? Math.round((this.stats.localHits / lookups) * 1000) / 1000 : 0
+    };
+  }
+}
+
+export default new PlaceIndex();
+"""
+
+with open("travel-backend/models/PlaceCoverage.js", "w") as f:
+    f.write(place_coverage_model)
+
+with open("travel-backend/services/placeIndex.js", "w") as f:
+    f.write(place_index)
+
+print("Place index created successfully!")
@@ -0,0 +1,73 @@
+# Create opaque cursor and NDJSON streaming helpers
+cursor_utils = """// Opaque pagination cursors: JSON state encoded as base64url so clients pass it back
+// verbatim without depending on its contents
+
+export const encodeCursor = (state) =>
+  Buffer.from(JSON.stringify(state)).toString('base64url');
+
+// The decoded state, or null for anything that is not a cursor we issued
+export const decodeCursor = (cursor) => {
+  if (typeof cursor !== 'string' || cursor.length === 0) return null;
+
+  try {
+    const state = JSON.parse(Buffer.from(cursor, 'base64url').toString('utf8'));
+    return state && typeof state === 'object' && !Array.isArray(state) ? state : null;
+  } catch {
+    return null;
+  }
+};
+
+// Filter for the documents that come after the sort key values in after, for a
+// descending sort on fields such as ['createdAt', '_id']. The last field must be unique.
+export const afterKeyset = (fields, after) => ({
+  $or: fields.map((field, i) => ({
+    ...Object.fromEntries(fields.slice(0, i).map(previous => [previous, after[previous]])),
+    [field]: { $lt: after[field] }
+  }))
+});
+"""
+
+ndjson_utils = """// Newline-delimited JSON helper: sets streaming headers and returns a small writer.
+// Each send() is one complete JSON document on its own line, so clients can render
+// records as they arrive.
+export const openNdjsonStream = (req, res) => {
+  // no-transform keeps the compression middleware from buffering the stream
+  res.status(200).set({
+    'Content-Type': 'application/x-ndjson',
+    'Cache-Control': 'no-cache, no-transform',
+    'X-Accel-Buffering': 'no'
+  });
+  res.flushHeaders();
+
+  // As in openEventStream, only the response reliably reports a client that went away
+  let closed = false;
+  res.on('close', () => {
+    closed = true;
+  });
+
+  return {
+    get closed() {
+      return closed;
+    },
+
+    send(record) {
+      if (closed) return;
+      res.write(`${JSON.stringify(record)}\\n`);
+    },
+
+    close() {
+      if (closed) return;
+      closed = true;
+      res.end();
+    }
+  };
+};
+"""
+
+with open("travel-backend/utils/cursor.js", "w") as f:
+    f.write(cursor_utils)
+
+with open("travel-backend/utils/ndjson.js", "w") as f:
+    f.write(ndjson_utils)
+
+print("Cursor and NDJSON helpers created successfully!")
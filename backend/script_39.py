@@ -0,0 +1,308 @@
+# Create the place photo disk cache and its public route
+place_photo_cache = """import fs from 'fs';
+import fsp from 'fs/promises';
+import path from 'path';
+import crypto from 'crypto';
+import { Transform } from 'stream';
+import { pipeline } from 'stream/promises';
+import { fileURLToPath } from 'url';
+import LRUCache from '../utils/lruCache.js';
+import SingleFlight from '../utils/singleFlight.js';
+
+const __dirname = path.dirname(fileURLToPath(import.meta.url));
+
+const MB = 1024 * 1024;
+
+const sha256 = (value) => crypto.createHash('sha256').update(value).digest('hex');
+
+// Place photos on disk under uploads/place-photos, bounded in total size with least
+// recently served photos evicted first:
+//   blobs/<ab>/<sha256 of bytes>   photo bytes, shared by every request that returned them
+//   refs/<sha256 of key>.json      { key, hash, contentType } for one photo request
+// Photos are streamed from Google to a temporary file while being hashed, so neither
+// the download nor serving a photo holds the image in memory.
+class PlacePhotoCache {
+  constructor() {
+    this.dir = process.env.PLACE_PHOTO_CACHE_DIR || path.join(__dirname, '..', 'uploads', 'place-photos');
+    const maxBytes = (parseInt(process.env.PLACE_PHOTO_CACHE_MAX_MB) || 512) * MB;
+    this.maxPhotoBytes = Math.min(10 * MB, maxBytes);
+
+    // hash -> { size, keys }; evicting a blob removes it and every ref pointing at it
+    this.blobs = new LRUCache({
+      max: Number.MAX_SAFE_INTEGER,
+      maxBytes,
+      sizeOf: (blob) => blob.size,
+      onEvict: (hash, blob) => this.removeBlob(hash, blob)
+    });
+    this.refs = new Map();
+    this.flight = new SingleFlight({ name: 'place-photos', timeoutMs: 30000 });
+    this.ready = null;
+    this.stats = {
+      hits: 0,
+      misses: 0,
+      evictions: 0,
+      errors: 0
+    };
+  }
+
+  blobPath(hash) {
+    return path.join(this.dir, 'blobs', hash.slice(0, 2), hash);
+  }
+
+  refPath(key) {
+    return path.join(this.dir, 'refs', `${sha256(key)}.json`);
+  }
+
+  // Rebuild the index from disk once, oldest photos first so they are evicted first
+  init() {
+    this.ready ||= this.load().catch(error => {
+      this.stats.errors++;
+      console.warn('Place photo cache could not be loaded:', error.message);
+    });
+    return this.ready;
+  }
+
+  async load() {
+    await Promise.all(['blobs', 'refs', 'tmp'].map(name => fsp.mkdir(path.join(this.dir, name), { recursive: true })));
+
+    // Downloads interrupted by a restart
+    await fsp.rm(path.join(this.dir, 'tmp'), { recursive: true, force: true });
+    await fsp.mkdir(path.join(this.dir, 'tmp'));
+
+    const blobs = [];
+    for (const prefix of await fsp.readdir(path.join(this.dir, 'blobs'))) {
+      for (const hash of await fsp.readdir(path.join(this.dir, 'blobs', prefix))) {
+        const stat = await fsp.stat(this.blobPath(hash));
+        blobs.push({ hash, size: stat.size, mtimeMs: stat.mtimeMs });
+      }
+    }
+
+    blobs
+      .sort((a, b) => a.mtimeMs - b.mtimeMs)
+      .forEach(({ hash, size }) => this.blobs.set(hash, { size, keys: new Set() }));
+
+    for (const file of await fsp.readdir(path.join(this.dir, 'refs'))) {
+      const refFile = path.join(this.dir, 'refs', file);
+      try {
+        const ref = JSON.parse(await fsp.readFile(refFile, 'utf8'));
+        const blob = this.blobs.peek(ref.hash);
+        if (!blob) throw new Error('Photo missing');
+
+        blob.keys.add(ref.key);
+        this.refs.set(ref.key, ref);
+      } catch {
+        await fsp.rm(refFile, { force: true });
+      }
+    }
+  }
+
+  // An open photo for key: { stream, hash, size, contentType }. download() is called on a
+  // miss and must resolve to { stream, contentType } for the photo's bytes.
+  async open(key, download) {
+    await this.init();
+
+    const cached = await this.openCached(key);
+    if (cached) {
+      this.stats.hits++;
+      return cached;
+    }
+
+    this.stats.misses++;
+    await this.flight.do(key, () => this.store(key, download));
+
+    const stored = await this.openCached(key);
+    if (!stored) throw new Error('Place photo was evicted before it could be served');
+    return stored;
+  }
+
+  // Whether key is on disk, without opening it
+  async has(key) {
+    await this.init();
+    const ref = this.refs.get(key);
+    return !!ref && this.blobs.has(ref.hash);
+  }
+
+  async openCached(key) {
+    const ref = this.refs.get(key);
+    const blob = ref && this.blobs.get(ref.hash);
+    if (!blob) return null;
+
+    try {
+      // Holding the descriptor keeps the bytes readable even if the photo is evicted now
+      const handle = await fsp.open(this.blobPath(ref.hash), 'r');
+      fsp.utimes(this.blobPath(ref.hash), new Date(), new Date()).catch(() => {});
+
+      return {
+        stream: handle.createReadStream(),
+        hash: ref.hash,
+        size: blob.size,
+        contentType: ref.contentType
+      };
+    } catch (error) {
+      this.stats.errors++;
+      this.blobs.delete(ref.hash);
+      this.removeBlob(ref.hash, blob);
+      return null;
+    }
+  }
+
+  async store(key, download) {
+    const { stream, contentType } = await download();
+    const tmpFile = path.join(this.dir, 'tmp', crypto.randomUUID());
+    const digest = crypto.createHash('sha256');
+    const maxBytes = this.maxPhotoBytes;
+    let size = 0;
+
+    const hasher = new Transform({
+      transform(chunk, encoding, callback) {
+        size += chunk.length;
+        if (size > maxBytes) return callback(new Error('Place photo is too large to cache'));
+
+        digest.update(chunk);
+        callback(null, chunk);
+      }
+    });
+
+    try {
+      await pipeline(stream, hasher, fs.createWriteStream(tmpFile));
+
+      const hash = digest.digest('hex');
+      const blobFile = this.blobPath(hash);
+      await fsp.mkdir(path.dirname(blobFile), { recursive: true });
+      // Identical bytes are already stored under their hash; renaming over them is harmless
+      await fsp.rename(tmpFile, blobFile);
+
+      const ref = { key, hash, contentType };
+      await fsp.writeFile(this.refPath(key), JSON.stringify(ref));
+
+      const previous = this.refs.get(key);
+      if (previous && previous.hash !== hash) this.blobs.peek(previous.hash)?.keys.delete(key);
+
+      const blob = this.blobs.get(hash) || { size, keys: new Set() };
+      blob.keys.add(key);
+      this.refs.set(key, ref);
+      this.blobs.set(hash, blob);
+    } catch (error) {
+      this.stats.errors++;
+      await fsp.rm(tmpFile, { force: true });
+      throw error;
+    }
+  }
+
+  removeBlob(hash, blob) {
+    this.stats.evictions++;
+
+    blob.keys.forEach(key => {
+      if (this.refs.get(key)?.hash !== hash) return;
+      this.refs.delete(key);
+      fsp.rm(this.refPath(key), { force: true }).catch(() => {});
+    });
+    fsp.rm(this.blobPath(hash), { force: true }).catch(() => {});
+  }
+
+  getStats() {
+    return {
+      photos: this.refs.size,
+      blobs: this.blobs.size,
+      bytes: this.blobs.bytes,
+      maxBytes: this.blobs.maxBytes,
+      ...this.stats
+    };
+  }
+}
+
+export default new PlacePhotoCache();
+"""
+
+place_photo_routes = """import express from 'express';
+import rateLimit from 'express-rate-limit';
+import { pipeline } from 'stream/promises';
+import placesService from '../services/placesService.js';
+import { asyncHandler } from '../middleware/errorHandler.js';
+
+const router = express.Router();
+
+// Google serves photos at most 1600px wide
+const MAX_PHOTO_WIDTH = 1600;
+const PHOTO_REFERENCE_PATTERN = /^[\\w-]{10,2048}$/;
+
+const photoWidth = (req) => parseInt(req.query.maxwidth) || 400;
+
+// Photos already on disk are served without counting against any limit (the global
+// limiter skips this route). Downloads spend Google quota, so they get a stricter limit.
+const downloadLimiter = rateLimit({
+  windowMs: (process.env.RATE_LIMIT_WINDOW || 15) * 60 * 1000,
+  max: parseInt(process.env.PLACE_PHOTO_RATE_LIMIT_MAX) || 30,
+  skip: (req) => placesService.hasCachedPhoto(req.params.ref, photoWidth(req)),
+  message: {
+    success: false,
+    message: 'Too many new photos requested from this IP, please try again later.'
+  },
+  standardHeaders: true,
+  legacyHeaders: false
+});
+
+// @desc    Get a place photo, cached on disk after the first request
+// @route   GET /api/places/photo/:ref?maxwidth=400
+// @access  Public (requested by <img> tags, which cannot send a bearer token)
+router.get('/:ref', downloadLimiter, asyncHandler(async (req, res) => {
+  const { ref } = req.params;
+  const maxWidth = photoWidth(req);
+
+  if (!PHOTO_REFERENCE_PATTERN.test(ref)) {
+    return res.status(400).json({
+      success: false,
+      message: 'Invalid photo reference'
+    });
+  }
+
+  if (maxWidth < 1 || maxWidth > MAX_PHOTO_WIDTH) {
+    return res.status(400).json({
+      success: false,
+      message: `maxwidth must be between 1 and ${MAX_PHOTO_WIDTH}`
+    });
+  }
+
+  let photo;
+  try {
+    photo = await placesService.openPhoto(ref, maxWidth);
+  } catch (error) {
+    return res.status(error.statusCode || 502).json({
+      success: false,
+      message: error.message
+    });
+  }
+
+  // The ETag is the hash of the bytes, so a photo never changes under its ETag
+  res.set({
+    'Content-Type': photo.contentType,
+    'Cache-Control': 'public, max-age=31536000, immutable',
+    'Cross-Origin-Resource-Policy': 'cross-origin',
+    ETag: `"${photo.hash}"`
+  });
+
+  if (req.fresh) {
+    photo.stream.destroy();
+    return res.status(304).end();
+  }
+
+  res.set('Content-Length', photo.size);
+
+  try {
+    await pipeline(photo.stream, res);
+  } catch (error) {
+    // Client went away mid-photo; nothing left to send
+    if (error.code !== 'ERR_STREAM_PREMATURE_CLOSE') console.warn('Place photo stream failed:', error.message);
+  }
+}));
+
+export default router;
+"""
+
+with open("travel-backend/services/placePhotoCache.js", "w") as f:
+    f.write(place_photo_cache)
+
+with open("travel-backend/routes/placePhotos.js", "w") as f:
+    f.write(place_photo_routes)
+
+print("Place photo cache created successfully!")
@@ -0,0 +1,149 @@
+# Create Comment model and the migration moving embedded trip comments into it
+comment_model = """import mongoose from 'mongoose';
+import User from './User.js';
+
+const commentSchema = new mongoose.Schema({
+  trip: {
+    type: mongoose.Schema.Types.ObjectId,
+    ref: 'Trip',
+    required: true
+  },
+  user: {
+    type: mongoose.Schema.Types.ObjectId,
+    ref: 'User',
+    required: true
+  },
+  text: {
+    type: String,
+    required: [true, 'Comment text is required'],
+    trim: true
+  },
+  createdAt: {
+    type: Date,
+    default: Date.now
+  }
+});
+
+// Newest-first pages of one trip's comments; _id breaks ties between equal timestamps
+commentSchema.index({ trip: 1, createdAt: -1, _id: -1 });
+
+// Static method to get one page of a trip's comments, newest first, with each author's
+// name and avatar resolved in the same query. after is the { createdAt, _id } of the last
+// comment on the previous page.
+commentSchema.statics.findPage = async function(tripId, { after = null, limit = 20 } = {}) {
+  const match = { trip: new mongoose.Types.ObjectId(tripId) };
+  if (after) {
+    match.$or = [
+      { createdAt: { $lt: after.createdAt } },
+      { createdAt: after.createdAt, _id: { $lt: after._id } }
+    ];
+  }
+
+  const comments = await this.aggregate([
+    { $match: match },
+    { $sort: { createdAt: -1, _id: -1 } },
+    { $limit: limit + 1 },
+    {
+      $lookup: {
+        from: User.collection.collectionName,
+        let: { userId: '$user' },
+        pipeline: [
+          { $match: { $expr: { $eq: ['$_id', '$$userId'] } } },
+          { $project: { name: 1, avatar: 1 } }
+        ],
+        as: 'user'
+      }
+    },
+    // Authors who deleted their account come back as null
+    { $set: { user: { $ifNull: [{ $arrayElemAt: ['$user', 0] }, null] } } },
+    { $project: { trip: 0, __v: 0 } }
+  ]);
+
+  return {
+    comments: comments.slice(0, limit),
+    hasMore: comments.length > limit
+  };
+};
+
+const Comment = mongoose.model('Comment', commentSchema);
+
+export default Comment;
+"""
+
+move_comments_migration = """// Move comments embedded in trips into the comments collection and set each trip's
+// commentsCount. Comments keep their _id, so the migration is safe to run more than once.
+// Run with: npm run migrate:comments
+import mongoose from 'mongoose';
+import dotenv from 'dotenv';
+import Trip from '../models/Trip.js';
+import Comment from '../models/Comment.js';
+
+dotenv.config();
+
+const run = async () => {
+  await mongoose.connect(process.env.MONGODB_URI || 'mongodb://localhost:27017/travel-assistant');
+  await Comment.createIndexes();
+
+  // The embedded array is no longer in the Trip schema, so read it from the raw collection
+  const cursor = Trip.collection.find(
+    { 'comments.0': { $exists: true } },
+    { projection: { comments: 1 } }
+  );
+
+  let trips = 0;
+  let moved = 0;
+
+  for await (const trip of cursor) {
+    const comments = trip.comments
+      .filter(comment => comment.user && comment.text)
+      .map(comment => ({
+        _id: comment._id,
+        trip: trip._id,
+        user: comment.user,
+        text: comment.text,
+        createdAt: comment.createdAt || trip._id.getTimestamp()
+      }));
+
+    try {
+      const inserted = await Comment.collection.insertMany(comments, { ordered: false });
+      moved += inserted.insertedCount;
+    } catch (error) {
+      // Comments copied by an earlier, interrupted run
+      const writeErrors = [].concat(error.writeErrors || []);
+      if (writeErrors.length === 0 || !writeErrors.every(writeError => writeError.code === 11000)) throw error;
+      moved += error.result?.insertedCount ?? 0;
+    }
+
+    await Trip.collection.updateOne(
+      { _id: trip._id },
+      {
+        $set: { commentsCount: await Comment.countDocuments({ trip: trip._id }) },
+        $unset: { comments: '' }
+      }
+    );
+    trips++;
+  }
+
+  const { modifiedCount } = await Trip.collection.updateMany(
+    { commentsCount: { $exists: false } },
+    { $set: { commentsCount: 0 } }
+  );
+
+  console.log(`Moved ${moved} comments from ${trips} trips; set commentsCount on ${modifiedCount} trips without comments`);
+};
+
+run()
+  .catch(error => {
+    console.error('Migration failed:', error);
+    process.exitCode = 1;
+  })
+  .finally(() => mongoose.disconnect());
+"""
+
+with open("travel-backend/models/Comment.js", "w") as f:
+    f.write(comment_model)
+
+with open("travel-backend/migrations/moveCommentsToCollection.js", "w") as f:
+    f.write(move_comments_migration)
+
+print("Comment model created successfully!")
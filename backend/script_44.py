@@ -0,0 +1,92 @@
+# Create the cached trip count service and the trip list index migration
+trip_count_cache = """import LRUCache from '../utils/lruCache.js';
+import SingleFlight from '../utils/singleFlight.js';
+import Trip from '../models/Trip.js';
+
+// Totals for trip list filters. Counting visits every matching trip, so each filter's
+// total is cached briefly and concurrent requests for the same filter share one count.
+class TripCountCache {
+  constructor() {
+    this.memory = new LRUCache({
+      max: 5000,
+      ttl: (parseInt(process.env.TRIP_COUNT_CACHE_TTL_SECONDS) || 60) * 1000
+    });
+    this.inflight = new SingleFlight({ name: 'trip-count' });
+    this.stats = {
+      hits: 0,
+      misses: 0
+    };
+  }
+
+  async count(query) {
+    const key = JSON.stringify(query);
+    const cached = this.memory.get(key);
+
+    if (cached !== undefined) {
+      this.stats.hits++;
+      return cached;
+    }
+
+    this.stats.misses++;
+    return this.inflight.do(key, async () => {
+      const total = await Trip.countDocuments(query);
+      this.memory.set(key, total);
+      return total;
+    });
+  }
+
+  getStats() {
+    return {
+      ...this.stats,
+      entries: this.memory.size
+    };
+  }
+
+  getCoalescingStats() {
+    return this.inflight.getStats();
+  }
+}
+
+export default new TripCountCache();
+"""
+
+trip_list_indexes_migration = """// Replace the discover feed index with one that ends in _id, so keyset pages can seek
+// straight to their first trip. Safe to run more than once.
+// Run with: npm run migrate:trip-indexes
+import mongoose from 'mongoose';
+import dotenv from 'dotenv';
+import Trip from '../models/Trip.js';
+
+dotenv.config();
+
+const OLD_INDEX = 'isPublic_1_likesCount_-1_createdAt_-1';
+
+const run = async () => {
+  await mongoose.connect(process.env.MONGODB_URI || 'mongodb://localhost:27017/travel-assistant');
+
+  try {
+    await Trip.collection.dropIndex(OLD_INDEX);
+    console.log(`Dropped index ${OLD_INDEX}`);
+  } catch (error) {
+    if (error.codeName !== 'IndexNotFound') throw error;
+  }
+
+  await Trip.createIndexes();
+  console.log('Trip indexes are up to date');
+};
+
+run()
+  .catch(error => {
+    console.error('Migration failed:', error);
+    process.exitCode = 1;
+  })
+  .finally(() => mongoose.disconnect());
+"""
+
+with open("travel-backend/services/tripCountCache.js", "w") as f:
+    f.write(trip_count_cache)
+
+with open("travel-backend/migrations/tripListIndexes.js", "w") as f:
+    f.write(trip_list_indexes_migration)
+
+print("Trip count cache created successfully!")
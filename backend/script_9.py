@@ -1,6 +1,12 @@
 # Create AI Service for itinerary generation
 ai_service = """import OpenAI from 'openai';
-import axios from 'axios';
+import { createHttpClient, getAgent } from '../utils/httpClient.js';
+import itineraryCache from './itineraryCache.js';
+import ItineraryStreamParser from '../utils/itineraryStreamParser.js';
+import { mapWithConcurrency } from '../utils/concurrency.js';
+import ProviderRouter, { parseProviderWeights } from '../utils/providerRouter.js';
+import SingleFlight, { flightKey } from '../utils/singleFlight.js';
+import { AppError } from '../middleware/errorHandler.js';
 
 class AIService {
   constructor() {
@@ -8,41 +14,358 @@ class AIService {
     if (process.env.OPENAI_API_KEY) {
       this.openai = new OpenAI({
         apiKey: process.env.OPENAI_API_KEY,
+        httpAgent: getAgent('https://api.openai.com')
       });
     }
 
+    // Completions are not retried here; the provider router fails over instead
+    this.http = createHttpClient({ name: 'ai', timeout: 60000, retries: 0 });
+
     // Initialize Groq client (free alternative)
     this.groqApiKey = process.env.GROQ_API_KEY;
     this.huggingfaceApiKey = process.env.HUGGINGFACE_API_KEY;
+
+    // Chunked planning for long trips
+    this.chunkThresholdDays = parseInt(process.env.AI_CHUNK_THRESHOLD_DAYS) || 7;
+    this.chunkSize = parseInt(process.env.AI_CHUNK_DAYS) || 3;
+    this.chunkConcurrency = parseInt(process.env.AI_CHUNK_CONCURRENCY) || 3;
+
+    // Identical concurrent itinerary requests share one generation
+    this.inflight = new SingleFlight({
+      name: 'itinerary',
+      timeoutMs: parseInt(process.env.AI_COALESCE_TIMEOUT_MS) || 120000,
+      clone: true
+    });
+
+    // Providers in default order of preference; the router re-ranks them by observed latency and errors
+    this.router = new ProviderRouter([
+      {
+        name: 'openai',
+        enabled: () => !!this.openai,
+        generate: (prompt, options) => this.generateWithOpenAI(prompt, options),
+        stream: (prompt, options) => this.streamWithOpenAI(prompt, options)
+      },
+      {
+        name: 'groq',
+        enabled: () => !!this.groqApiKey,
+        generate: (prompt, options) => this.generateWithGroq(prompt, options),
+        stream: (prompt, options) => this.streamWithGroq(prompt, options)
+      },
+      {
+        name: 'huggingface',
+        enabled: () => !!this.huggingfaceApiKey,
+        generate: (prompt, options) => this.generateWithHuggingFace(prompt, options),
+        stream: (prompt, options) => this.streamWithHuggingFace(prompt, options)
+      }
+    ], {
+      weights: parseProviderWeights(process.env.AI_PROVIDER_WEIGHTS),
+      maxInFlight: parseInt(process.env.AI_MAX_IN_FLIGHT) || 8,
+      hedgePercentile: parseInt(process.env.AI_HEDGE_PERCENTILE) || 95,
+      minHedgeDelayMs: parseInt(process.env.AI_HEDGE_MIN_MS) || 1500,
+      defaultHedgeDelayMs: parseInt(process.env.AI_HEDGE_DEFAULT_MS) || 15000,
+      breaker: {
+        failureThreshold: parseInt(process.env.AI_BREAKER_FAILURE_THRESHOLD) || 5,
+        resetTimeoutMs: parseInt(process.env.AI_BREAKER_RESET_MS) || 30000
+      },
+      limiter: {
+        targetLatencyMs: parseInt(process.env.AI_TARGET_LATENCY_MS) || 0,
+        maxQueue: parseInt(process.env.AI_QUEUE_MAX) || 20,
+        queueTimeoutMs: parseInt(process.env.AI_QUEUE_TIMEOUT_MS) || 10000
+      }
+    });
   }
 
   // Main method to generate travel itinerary
-  async generateItinerary(tripData) {
+  generateItinerary(tripData) {
+    const key = flightKey(itineraryCache.buildKey(tripData), tripData.startDate);
+    return this.inflight.do(key, () => this.createItinerary(tripData));
+  }
+
+  async createItinerary(tripData) {
     try {
+      const startedAt = Date.now();
+
+      // Serve identical trip requests from the itinerary cache
+      const cached = await itineraryCache.get(tripData);
+      if (cached.value) {
+        const result = this.redateCachedItinerary(cached.value, tripData);
+        itineraryCache.recordHit(cached.value, Date.now() - startedAt);
+        return result;
+      }
+
+      // Long trips do not fit in one response, so plan them in concurrent day blocks
+      if (tripData.duration > this.chunkThresholdDays) {
+        const { result, tokens } = await this.generateChunkedItinerary(tripData);
+
+        itineraryCache.set(cached.key, result, {
+          latencyMs: Date.now() - startedAt,
+          tokens
+        }).catch(error => console.warn('Itinerary cache write failed:', error.message));
+
+        return result;
+      }
+
       const prompt = this.buildItineraryPrompt(tripData);
-      
-      // Try different AI providers in order of preference
-      let response;
-      
-      if (this.openai) {
-        response = await this.generateWithOpenAI(prompt);
-      } else if (this.groqApiKey) {
-        response = await this.generateWithGroq(prompt);
-      } else if (this.huggingfaceApiKey) {
-        response = await this.generateWithHuggingFace(prompt);
-      } else {
-        throw new Error('No AI API key configured');
+      const response = await this.generateCompletion(prompt);
+      const result = this.parseItineraryResponse(response, tripData);
+
+      itineraryCache.set(cached.key, result, {
+        latencyMs: Date.now() - startedAt,
+        tokens: this.estimateTokens(prompt, response)
+      }).catch(error => console.warn('Itinerary cache write failed:', error.message));
+
+      return result;
+    } catch (error) {
+      console.error('AI Service Error:', error);
+      throw this.toGenerationError(error);
+    }
+  }
+
+  // Stream an itinerary, calling onDay with each formatted day as soon as the model finishes it
+  async generateItineraryStream(tripData, onDay) {
+    try {
+      const startedAt = Date.now();
+
+      const cached = await itineraryCache.get(tripData);
+      if (cached.value) {
+        const result = this.redateCachedItinerary(cached.value, tripData);
+        itineraryCache.recordHit(cached.value, Date.now() - startedAt);
+        result.itinerary.forEach(day => onDay(day));
+        return result;
+      }
+
+      if (tripData.duration > this.chunkThresholdDays) {
+        const { result, tokens } = await this.generateChunkedItinerary(tripData, onDay);
+
+        itineraryCache.set(cached.key, result, {
+          latencyMs: Date.now() - startedAt,
+          tokens
+        }).catch(error => console.warn('Itinerary cache write failed:', error.message));
+
+        return result;
       }
 
-      return this.parseItineraryResponse(response, tripData);
+      const prompt = this.buildItineraryPrompt(tripData);
+
+      const parser = new ItineraryStreamParser((day, index) => {
+        this.formatItineraryDay(day, index, tripData);
+        onDay(day);
+      });
+
+      // Streamed days are sent on as they arrive, so a stream is not hedged, and it only
+      // fails over to another provider if nothing had been received yet
+      await this.router.runSingle(async (provider, signal) => {
+        for await (const chunk of provider.stream(prompt, { signal })) {
+          parser.write(chunk);
+        }
+      }, { canRetry: () => parser.text.length === 0 });
+
+      const result = this.parseItineraryResponse(parser.text, tripData);
+
+      itineraryCache.set(cached.key, result, {
+        latencyMs: Date.now() - startedAt,
+        tokens: this.estimateTokens(prompt, parser.text)
+      }).catch(error => console.warn('Itinerary cache write failed:', error.message));
+
+      return result;
     } catch (error) {
       console.error('AI Service Error:', error);
-      throw new Error(`Failed to generate itinerary: ${error.message}`);
+      throw this.toGenerationError(error);
     }
   }
 
-  // Build the prompt for itinerary generation
-  buildItineraryPrompt(tripData) {
+  // Errors from the router or limiter (503 with retryAfter) reach the client unchanged
+  toGenerationError(error) {
+    if (error instanceof AppError) return error;
+    return new Error(`Failed to generate itinerary: ${error.message}`);
+  }
+
+  // Send a prompt through the provider router. A response only wins the race
+  // if it parses as JSON; slower or failed providers are hedged and cancelled.
+  async generateCompletion(prompt, options = {}) {
+    return this.router.run(
+      (provider, signal) => provider.generate(prompt, { ...options, signal }),
+      (response) => this.parseJsonResponse(response)
+    );
+  }
+
+  getProviderStats() {
+    return this.router.getStats();
+  }
+
+  getCoalescingStats() {
+    return this.inflight.getStats();
+  }
+
+  // Plan a long trip as a compact day-theme skeleton, then generate day blocks
+  // concurrently. Days are formatted (and passed to onDay) in order as blocks finish.
+  async generateChunkedItinerary(tripData, onDay = null) {
+    let tokens = 0;
+    const complete = async (prompt, maxTokens) => {
+      const response = await this.generateCompletion(prompt, { maxTokens });
+      tokens += this.estimateTokens(prompt, response);
+      return this.parseJsonResponse(response);
+    };
+
+    const skeleton = await complete(this.buildSkeletonPrompt(tripData), 2000);
+    const themes = Array.isArray(skeleton.days) ? skeleton.days : [];
+
+    const chunks = [];
+    for (let start = 0; start < tripData.duration; start += this.chunkSize) {
+      chunks.push({ start, end: Math.min(start + this.chunkSize, tripData.duration) });
+    }
+
+    const blocks = new Array(chunks.length);
+    const seenActivities = new Set();
+    const itinerary = [];
+    let flushed = 0;
+
+    // Emit finished blocks in day order so de-duplication always favours earlier days
+    const flush = () => {
+      while (flushed < chunks.length && blocks[flushed]) {
+        const { start, end } = chunks[flushed];
+
+        for (let i = start; i < end; i++) {
+          const day = blocks[flushed][i - start] || { theme: themes[i]?.theme || '', activities: [] };
+          day.activities = this.dedupeActivities(day.activities || [], seenActivities);
+          this.formatItineraryDay(day, i, tripData);
+          itinerary.push(day);
+          if (onDay) onDay(day);
+        }
+
+        flushed++;
+      }
+    };
+
+    await mapWithConcurrency(chunks, this.chunkConcurrency, async ({ start, end }, index) => {
+      const block = await complete(this.buildDayBlockPrompt(tripData, themes, start, end), 4000);
+      blocks[index] = Array.isArray(block.itinerary) ? block.itinerary : [];
+      flush();
+    });
+
+    return {
+      result: this.buildItineraryResult({ ...skeleton, itinerary }, tripData),
+      tokens
+    };
+  }
+
+  // Drop sights already planned on an earlier day; meals and transport may repeat
+  dedupeActivities(activities, seen) {
+    const repeatable = ['food', 'transport', 'accommodation'];
+
+    return activities.filter(activity => {
+      if (repeatable.includes(activity.category)) return true;
+
+      const key = String(activity.name || '').toLowerCase().replace(/[^a-z0-9]+/g, ' ').trim();
+      if (!key) return true;
+      if (seen.has(key)) return false;
+
+      seen.add(key);
+      return true;
+    });
+  }
+
+  // Prompt for the compact day-theme outline of a long trip
+  buildSkeletonPrompt(tripData) {
+    const { destination, duration, budget } = tripData;
+    const currency = budget?.currency || 'USD';
+
+    const prompt = `
+You are an expert travel planner. Outline a ${duration}-day trip to ${destination.city}, ${destination.country}.
+
+${this.buildTripDetails(tripData)}
+
+Give every day a distinct theme and area so that no two days repeat each other.
+
+RESPONSE FORMAT - Return a valid JSON object with this structure:
+{
+  "days": [
+    { "day": 1, "theme": "Day theme description", "area": "Neighbourhood or area to focus on" }
+  ],
+  "totalBudgetEstimate": {
+    "amount": 1000,
+    "currency": "${currency}",
+    "breakdown": {
+      "accommodation": 400,
+      "food": 300,
+      "activities": 200,
+      "transportation": 100
+    }
+  },
+  "generalTips": [
+    "Important travel tip 1",
+    "Important travel tip 2"
+  ],
+  "bestTimeToVisit": "Information about weather and seasons",
+  "localCustoms": "Brief cultural notes and etiquette tips"
+}
+    `;
+
+    return prompt.trim();
+  }
+
+  // Prompt for one block of days (start inclusive, end exclusive) of a long trip
+  buildDayBlockPrompt(tripData, themes, start, end) {
+    const { destination, duration, budget } = tripData;
+    const currency = budget?.currency || 'USD';
+    const describeDay = (i) => `- Day ${i + 1}: ${themes[i]?.theme || 'Free exploration'}${themes[i]?.area ? ` (${themes[i].area})` : ''}`;
+
+    const blockDays = [];
+    const otherDays = [];
+    for (let i = 0; i < duration; i++) {
+      (i >= start && i < end ? blockDays : otherDays).push(describeDay(i));
+    }
+
+    const prompt = `
+You are an expert travel planner. Plan days ${start + 1} to ${end} of a ${duration}-day trip to ${destination.city}, ${destination.country}.
+
+${this.buildTripDetails(tripData)}
+
+DAYS TO PLAN:
+${blockDays.join('\\n')}
+
+OTHER DAYS OF THE TRIP (planned separately - do not repeat their sights):
+${otherDays.join('\\n') || '- None'}
+
+REQUIREMENTS:
+1. Plan exactly ${end - start} days with 3-4 activities per day, following each day's theme
+2. Include realistic time slots (format: "HH:MM")
+3. Provide estimated costs in ${currency}
+4. Include local cuisine recommendations
+5. Suggest appropriate transportation between activities
+
+RESPONSE FORMAT - Return a valid JSON object with this structure:
+{
+  "itinerary": [
+    {
+      "day": ${start + 1},
+      "theme": "Day theme description",
+      "activities": [
+        {
+          "name": "Activity name",
+          "description": "Brief description",
+          "category": "sightseeing|food|activity|transport|accommodation|shopping|entertainment|other",
+          "location": { "name": "Location name", "address": "Full address if known" },
+          "duration": { "hours": 2, "minutes": 30 },
+          "estimatedCost": { "min": 10, "max": 25, "currency": "${currency}" },
+          "timeSlot": { "startTime": "09:00", "endTime": "11:30" },
+          "priority": "low|medium|high",
+          "bookingInfo": { "isBookingRequired": false, "contactInfo": "Contact details if needed" },
+          "notes": "Additional notes or tips"
+        }
+      ],
+      "totalEstimatedCost": { "amount": 150, "currency": "${currency}" },
+      "notes": "Daily summary or special notes"
+    }
+  ]
+}
+    `;
+
+    return prompt.trim();
+  }
+
+  // Trip details block shared by the itinerary prompts
+  buildTripDetails(tripData) {
     const {
       destination,
       startDate,
@@ -53,10 +376,7 @@ class AIService {
       budget
     } = tripData;
 
-    const prompt = `
-You are an expert travel planner. Create a detailed ${duration}-day itinerary for a trip to ${destination.city}, ${destination.country}.
-
-TRIP DETAILS:
+    return `TRIP DETAILS:
 - Destination: ${destination.city}, ${destination.country}
 - Start Date: ${startDate}
 - End Date: ${endDate}
@@ -66,7 +386,21 @@ TRIP DETAILS:
 - Travel Pace: ${preferences?.pace || 'moderate'}
 - Themes: ${preferences?.themes?.join(', ') || 'General sightseeing'}
 - Food Preferences: ${preferences?.foodPreferences?.join(', ') || 'No restrictions'}
-- Transport Preference: ${preferences?.transportPreference || 'mixed'}
+- Transport Preference: ${preferences?.transportPreference || 'mixed'}`;
+  }
+
+  // Build the prompt for itinerary generation
+  buildItineraryPrompt(tripData) {
+    const {
+      destination,
+      duration,
+      budget
+    } = tripData;
+
+    const prompt = `
+You are an expert travel planner. Create a detailed ${duration}-day itinerary for a trip to ${destination.city}, ${destination.country}.
+
+${this.buildTripDetails(tripData)}
 
 REQUIREMENTS:
 1. Create a day-by-day itinerary with 3-4 activities per day
@@ -146,77 +480,137 @@ Ensure all JSON is properly formatted and all dates are in YYYY-MM-DD format. Ma
     return prompt.trim();
   }
 
+  // Chat messages shared by the OpenAI-compatible providers
+  buildChatMessages(prompt) {
+    return [
+      {
+        role: 'system',
+        content: 'You are an expert travel planner who creates detailed, practical, and personalized travel itineraries. Always respond with valid JSON format.'
+      },
+      {
+        role: 'user',
+        content: prompt
+      }
+    ];
+  }
+
   // Generate with OpenAI
-  async generateWithOpenAI(prompt) {
+  async generateWithOpenAI(prompt, { maxTokens = 4000, signal } = {}) {
     try {
       const response = await this.openai.chat.completions.create({
         model: 'gpt-3.5-turbo',
-        messages: [
-          {
-            role: 'system',
-            content: 'You are an expert travel planner who creates detailed, practical, and personalized travel itineraries. Always respond with valid JSON format.'
-          },
-          {
-            role: 'user',
-            content: prompt
-          }
-        ],
-        max_tokens: 4000,
+        messages: this.buildChatMessages(prompt),
+        max_tokens: maxTokens,
         temperature: 0.7,
         response_format: { type: "json_object" }
-      });
+      }, { signal });
 
       return response.choices[0].message.content;
     } catch (error) {
-      console.error('OpenAI Error:', error);
+      if (!signal?.aborted) console.error('OpenAI Error:', error);
       throw error;
     }
   }
 
   // Generate with Groq (free alternative)
-  async generateWithGroq(prompt) {
+  async generateWithGroq(prompt, { maxTokens = 4000, signal } = {}) {
     try {
-      const response = await axios.post(
+      const response = await this.http.post(
         'https://api.groq.com/openai/v1/chat/completions',
         {
           model: 'llama3-70b-8192',
-          messages: [
-            {
-              role: 'system',
-              content: 'You are an expert travel planner who creates detailed, practical, and personalized travel itineraries. Always respond with valid JSON format.'
-            },
-            {
-              role: 'user',
-              content: prompt
-            }
-          ],
-          max_tokens: 4000,
+          messages: this.buildChatMessages(prompt),
+          max_tokens: maxTokens,
           temperature: 0.7
         },
         {
           headers: {
             'Authorization': `Bearer ${this.groqApiKey}`,
             'Content-Type': 'application/json'
-          }
+          },
+          signal
         }
       );
 
       return response.data.choices[0].message.content;
     } catch (error) {
-      console.error('Groq Error:', error);
+      if (!signal?.aborted) console.error('Groq Error:', error);
       throw error;
     }
   }
 
+  // Stream completion tokens from OpenAI
+  async *streamWithOpenAI(prompt, { maxTokens = 4000, signal } = {}) {
+    const stream = await this.openai.chat.completions.create({
+      model: 'gpt-3.5-turbo',
+      messages: this.buildChatMessages(prompt),
+      max_tokens: maxTokens,
+      temperature: 0.7,
+      response_format: { type: "json_object" },
+      stream: true
+    }, { signal });
+
+    for await (const part of stream) {
+      const content = part.choices[0]?.delta?.content;
+      if (content) yield content;
+    }
+  }
+
+  // Stream completion tokens from Groq's OpenAI-compatible event stream
+  async *streamWithGroq(prompt, { maxTokens = 4000, signal } = {}) {
+    const response = await this.http.post(
+      'https://api.groq.com/openai/v1/chat/completions',
+      {
+        model: 'llama3-70b-8192',
+        messages: this.buildChatMessages(prompt),
+        max_tokens: maxTokens,
+        temperature: 0.7,
+        stream: true
+      },
+      {
+        headers: {
+          'Authorization': `Bearer ${this.groqApiKey}`,
+          'Content-Type': 'application/json'
+        },
+        responseType: 'stream',
+        signal
+      }
+    );
+
+    response.data.setEncoding('utf8');
+
+    let pending = '';
+    for await (const chunk of response.data) {
+      pending += chunk;
+      const lines = pending.split('\\n');
+      pending = lines.pop();
+
+      for (const line of lines) {
+        if (!line.startsWith('data: ')) continue;
+
+        const data = line.slice(6).trim();
+        if (data === '[DONE]') return;
+
+        const content = JSON.parse(data).choices[0]?.delta?.content;
+        if (content) yield content;
+      }
+    }
+  }
+
+  // HuggingFace inference has no token stream, so days arrive with the full response
+  async *streamWithHuggingFace(prompt, options = {}) {
+    yield await this.generateWithHuggingFace(prompt, options);
+  }
+
   // Generate with HuggingFace (another free alternative)
-  async generateWithHuggingFace(prompt) {
+  async generateWithHuggingFace(prompt, { maxTokens = 4000, signal } = {}) {
     try {
-      const response = await axios.post(
+      const response = await this.http.post(
         'https://api-inference.huggingface.co/models/microsoft/DialoGPT-large',
         {
           inputs: prompt,
           parameters: {
-            max_length: 4000,
+            max_length: maxTokens,
             temperature: 0.7,
             return_full_text: false
           }
@@ -225,13 +619,14 @@ Ensure all JSON is properly formatted and all dates are in YYYY-MM-DD format. Ma
           headers: {
             'Authorization': `Bearer ${this.huggingfaceApiKey}`,
             'Content-Type': 'application/json'
-          }
+          },
+          signal
         }
       );
 
       return response.data[0].generated_text;
     } catch (error) {
-      console.error('HuggingFace Error:', error);
+      if (!signal?.aborted) console.error('HuggingFace Error:', error);
       throw error;
     }
   }
@@ -239,78 +634,8 @@ Ensure all JSON is properly formatted and all dates are in YYYY-MM-DD format. Ma
   // Parse the AI response and format for database
   parseItineraryResponse(response, tripData) {
     try {
-      // Clean the response to ensure it's valid JSON
-      let cleanResponse = response.trim();
-      
-      // Remove any markdown code blocks if present
-      cleanResponse = cleanResponse.replace(/```json\\n?|```/g, '');
-      
-      // Remove any leading/trailing whitespace
-      cleanResponse = cleanResponse.trim();
-
-      const parsed = JSON.parse(cleanResponse);
-
-      // Validate the parsed response has required structure
-      if (!parsed.itinerary || !Array.isArray(parsed.itinerary)) {
-        throw new Error('Invalid itinerary structure in AI response');
-      }
-
-      // Format dates and add missing fields
-      parsed.itinerary.forEach((day, index) => {
-        // Ensure proper date format
-        const dayDate = new Date(tripData.startDate);
-        dayDate.setDate(dayDate.getDate() + index);
-        day.date = dayDate.toISOString().split('T')[0];
-        day.day = index + 1;
-
-        // Validate and format activities
-        day.activities = day.activities.map(activity => ({
-          name: activity.name || 'Unnamed Activity',
-          description: activity.description || '',
-          category: activity.category || 'other',
-          location: {
-            name: activity.location?.name || '',
-            address: activity.location?.address || '',
-            coordinates: activity.location?.coordinates || {}
-          },
-          duration: {
-            hours: activity.duration?.hours || 2,
-            minutes: activity.duration?.minutes || 0
-          },
-          estimatedCost: {
-            min: activity.estimatedCost?.min || 0,
-            max: activity.estimatedCost?.max || 0,
-            currency: activity.estimatedCost?.currency || tripData.budget?.currency || 'USD'
-          },
-          timeSlot: {
-            startTime: activity.timeSlot?.startTime || '09:00',
-            endTime: activity.timeSlot?.endTime || '11:00'
-          },
-          priority: activity.priority || 'medium',
-          bookingInfo: {
-            isBookingRequired: activity.bookingInfo?.isBookingRequired || false,
-            bookingUrl: activity.bookingInfo?.bookingUrl || '',
-            contactInfo: activity.bookingInfo?.contactInfo || ''
-          },
-          notes: activity.notes || '',
-          completed: false
-        }));
-      });
-
-      return {
-        itinerary: parsed.itinerary,
-        totalBudgetEstimate: parsed.totalBudgetEstimate || {
-          amount: 0,
-          currency: tripData.budget?.currency || 'USD',
-          breakdown: {}
-        },
-        generalTips: parsed.generalTips || [],
-        bestTimeToVisit: parsed.bestTimeToVisit || '',
-        localCustoms: parsed.localCustoms || '',
-        aiGenerated: true,
-        generatedAt: new Date()
-      };
-
+      const parsed = this.parseJsonResponse(response);
+      return this.buildItineraryResult(parsed, tripData);
     } catch (error) {
       console.error('Error parsing AI response:', error);
       console.error('Raw response:', response);
@@ -318,6 +643,107 @@ Ensure all JSON is properly formatted and all dates are in YYYY-MM-DD format. Ma
     }
   }
 
+  // Clean a model response and parse it as JSON
+  parseJsonResponse(response) {
+    // Clean the response to ensure it's valid JSON
+    let cleanResponse = response.trim();
+    
+    // Remove any markdown code blocks if present
+    cleanResponse = cleanResponse.replace(/```json\\n?|```/g, '');
+    
+    // Remove any leading/trailing whitespace
+    cleanResponse = cleanResponse.trim();
+
+    return JSON.parse(cleanResponse);
+  }
+
+  // Validate a parsed itinerary document and shape it for the database
+  buildItineraryResult(parsed, tripData) {
+    // Validate the parsed response has required structure
+    if (!parsed.itinerary || !Array.isArray(parsed.itinerary)) {
+      throw new Error('Invalid itinerary structure in AI response');
+    }
+
+    // Format dates and add missing fields
+    this.formatItineraryDays(parsed.itinerary, tripData);
+
+    return {
+      itinerary: parsed.itinerary,
+      totalBudgetEstimate: parsed.totalBudgetEstimate || {
+        amount: 0,
+        currency: tripData.budget?.currency || 'USD',
+        breakdown: {}
+      },
+      generalTips: parsed.generalTips || [],
+      bestTimeToVisit: parsed.bestTimeToVisit || '',
+      localCustoms: parsed.localCustoms || '',
+      aiGenerated: true,
+      generatedAt: new Date()
+    };
+  }
+
+  // Re-date itinerary days from the trip start date and fill in missing activity fields
+  formatItineraryDays(itinerary, tripData) {
+    itinerary.forEach((day, index) => this.formatItineraryDay(day, index, tripData));
+  }
+
+  formatItineraryDay(day, index, tripData) {
+    // Ensure proper date format
+    const dayDate = new Date(tripData.startDate);
+    dayDate.setDate(dayDate.getDate() + index);
+    day.date = dayDate.toISOString().split('T')[0];
+    day.day = index + 1;
+
+    // Validate and format activities
+    day.activities = day.activities.map(activity => ({
+      name: activity.name || 'Unnamed Activity',
+      description: activity.description || '',
+      category: activity.category || 'other',
+      location: {
+        name: activity.location?.name || '',
+        address: activity.location?.address || '',
+        coordinates: activity.location?.coordinates || {}
+      },
+      duration: {
+        hours: activity.duration?.hours || 2,
+        minutes: activity.duration?.minutes || 0
+      },
+      estimatedCost: {
+        min: activity.estimatedCost?.min || 0,
+        max: activity.estimatedCost?.max || 0,
+        currency: activity.estimatedCost?.currency || tripData.budget?.currency || 'USD'
+      },
+      timeSlot: {
+        startTime: activity.timeSlot?.startTime || '09:00',
+        endTime: activity.timeSlot?.endTime || '11:00'
+      },
+      priority: activity.priority || 'medium',
+      bookingInfo: {
+        isBookingRequired: activity.bookingInfo?.isBookingRequired || false,
+        bookingUrl: activity.bookingInfo?.bookingUrl || '',
+        contactInfo: activity.bookingInfo?.contactInfo || ''
+      },
+      notes: activity.notes || '',
+      completed: false
+    }));
+  }
+
+  // Re-date a cached itinerary for the requested trip without calling a provider
+  redateCachedItinerary(cached, tripData) {
+    const { cacheMeta, ...stored } = structuredClone(cached);
+    this.formatItineraryDays(stored.itinerary, tripData);
+
+    return {
+      ...stored,
+      fromCache: true
+    };
+  }
+
+  // Rough token count (about 4 characters per token) for cache spend reporting
+  estimateTokens(prompt, response) {
+    return Math.ceil(((prompt?.length || 0) + (response?.length || 0)) / 4);
+  }
+
   // Generate activity suggestions for a specific day
   async generateActivitySuggestions(destination, preferences, existingActivities = []) {
     try {
@@ -342,14 +768,11 @@ Return a JSON array of activity suggestions with this format:
 ]
       `;
 
-      let response;
-      if (this.openai) {
-        response = await this.generateWithOpenAI(prompt);
-      } else if (this.groqApiKey) {
-        response = await this.generateWithGroq(prompt);
-      } else {
-        throw new Error('No AI API key configured');
-      }
+      // Through the router, so suggestions respect provider breakers and limits too
+      const response = await this.router.run(
+        (provider, signal) => provider.generate(prompt, { signal }),
+        (response) => JSON.parse(response)
+      );
 
       return JSON.parse(response);
     } catch (error) {
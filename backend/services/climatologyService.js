@@ -0,0 +1,175 @@
+import { CLIMATE_NORMALS, CITY_ALIASES } from '../data/climateNormals.js';
+
+// Field order within each month of the normals table
+const HIGH = 0;
+const LOW = 1;
+const PRECIPITATION = 2;
+const RAIN_DAYS = 3;
+const HUMIDITY = 4;
+const FIELDS = 5;
+
+// Destinations without their own entry may borrow one this close by
+const NEARBY_KM = 150;
+
+const CONDITIONS = {
+  clear: { main: 'Clear', description: 'clear sky', icon: '01d' },
+  clouds: { main: 'Clouds', description: 'scattered clouds', icon: '03d' },
+  lightRain: { main: 'Rain', description: 'light rain', icon: '10d' },
+  rain: { main: 'Rain', description: 'moderate rain', icon: '10d' },
+  snow: { main: 'Snow', description: 'snow', icon: '13d' }
+};
+
+const normalize = (value) => String(value || '').trim().toLowerCase();
+
+// FNV-1a hash scaled to [0, 1): a repeatable "dice roll" per city and day
+const unitHash = (text) => {
+  let hash = 0x811c9dc5;
+  for (let i = 0; i < text.length; i++) {
+    hash ^= text.charCodeAt(i);
+    hash = Math.imul(hash, 0x01000193);
+  }
+  return (hash >>> 0) / 4294967296;
+};
+
+const distanceKm = (lat1, lon1, lat2, lon2) => {
+  const toRad = (deg) => (deg * Math.PI) / 180;
+  const dLat = toRad(lat2 - lat1);
+  const dLon = toRad(lon2 - lon1);
+  const a = Math.sin(dLat / 2) ** 2 +
+    Math.cos(toRad(lat1)) * Math.cos(toRad(lat2)) * Math.sin(dLon / 2) ** 2;
+  return 6371 * 2 * Math.asin(Math.sqrt(a));
+};
+
+// Offline per-day weather estimates from monthly climate normals. The table is
+// packed into typed arrays once at startup; lookups never touch the network.
+class ClimatologyService {
+  constructor() {
+    const count = CLIMATE_NORMALS.length;
+
+    this.locations = new Array(count);
+    this.coordinates = new Float32Array(count * 2);
+    this.wind = new Float32Array(count);
+    this.normals = new Float32Array(count * 12 * FIELDS);
+    this.index = new Map();
+
+    CLIMATE_NORMALS.forEach(([city, country, code, lat, lon, wind, monthly], row) => {
+      this.locations[row] = { name: city, country: code, coordinates: { lat, lon } };
+      this.coordinates[row * 2] = lat;
+      this.coordinates[row * 2 + 1] = lon;
+      this.wind[row] = wind;
+
+      for (let month = 0; month < 12; month++) {
+        for (let field = 0; field < FIELDS; field++) {
+          this.normals[(row * 12 + month) * FIELDS + field] = monthly[field][month];
+        }
+      }
+
+      const name = normalize(city);
+      this.index.set(`${name}|${normalize(country)}`, row);
+      this.index.set(`${name}|${normalize(code)}`, row);
+      if (!this.index.has(name)) this.index.set(name, row);
+    });
+  }
+
+  // Table row for a destination, or -1 when there is no entry nearby. A name alone only
+  // matches when no country is given, and with coordinates a row must lie within NEARBY_KM.
+  findRow(city, country, coordinates = null) {
+    const name = CITY_ALIASES[normalize(city)] || normalize(city);
+    const located = coordinates?.lat !== undefined && coordinates?.lon !== undefined;
+
+    const row = normalize(country)
+      ? this.index.get(`${name}|${normalize(country)}`)
+      : this.index.get(name);
+    if (row !== undefined) {
+      if (!located) return row;
+      const km = distanceKm(coordinates.lat, coordinates.lon, this.coordinates[row * 2], this.coordinates[row * 2 + 1]);
+      return km <= NEARBY_KM ? row : -1;
+    }
+
+    if (!located) return -1;
+
+    let nearest = -1;
+    let nearestKm = NEARBY_KM;
+    for (let i = 0; i < this.wind.length; i++) {
+      const km = distanceKm(coordinates.lat, coordinates.lon, this.coordinates[i * 2], this.coordinates[i * 2 + 1]);
+      if (km < nearestKm) {
+        nearest = i;
+        nearestKm = km;
+      }
+    }
+    return nearest;
+  }
+
+  has(city, country, coordinates = null) {
+    return this.findRow(city, country, coordinates) !== -1;
+  }
+
+  value(row, month, field) {
+    return this.normals[(row * 12 + month) * FIELDS + field];
+  }
+
+  // Normals describe the middle of each month; blend toward the neighbouring month
+  interpolate(row, date, field) {
+    const month = date.getUTCMonth();
+    const daysInMonth = new Date(Date.UTC(date.getUTCFullYear(), month + 1, 0)).getUTCDate();
+    const offset = (date.getUTCDate() - 0.5) / daysInMonth - 0.5;
+    const neighbour = (month + (offset < 0 ? 11 : 1)) % 12;
+    const weight = Math.abs(offset);
+
+    return this.value(row, month, field) * (1 - weight) + this.value(row, neighbour, field) * weight;
+  }
+
+  estimateDay(row, date, units = 'metric') {
+    const dateKey = date.toISOString().split('T')[0];
+    const seed = `${this.locations[row].name}|${dateKey}`;
+
+    const high = this.interpolate(row, date, HIGH);
+    const low = this.interpolate(row, date, LOW);
+    const avg = (high + low) / 2;
+    const rainDays = this.interpolate(row, date, RAIN_DAYS);
+    const humidity = Math.round(this.interpolate(row, date, HUMIDITY));
+
+    // A day is wet with the month's share of rainy days and gets the average wet-day total
+    const wet = rainDays > 0 && unitHash(seed) < rainDays / 30.4;
+    const precipitation = wet
+      ? Math.round((this.interpolate(row, date, PRECIPITATION) / rainDays) * 10) / 10
+      : 0;
+
+    let condition;
+    if (wet) {
+      condition = avg <= 1 ? CONDITIONS.snow : precipitation >= 10 ? CONDITIONS.rain : CONDITIONS.lightRain;
+    } else {
+      condition = unitHash(`${seed}|sky`) < humidity / 150 ? CONDITIONS.clouds : CONDITIONS.clear;
+    }
+
+    const imperial = units === 'imperial';
+    const temperature = (celsius) => Math.round(imperial ? celsius * 9 / 5 + 32 : celsius);
+
+    return {
+      date: dateKey,
+      temperature: {
+        min: temperature(low),
+        max: temperature(high),
+        avg: temperature(avg)
+      },
+      condition: { ...condition },
+      humidity,
+      windSpeed: Math.round(imperial ? this.wind[row] * 2.237 : this.wind[row]),
+      precipitation,
+      source: 'climatology'
+    };
+  }
+
+  // Estimated weather for each date (YYYY-MM-DD strings or Dates), or null for unknown destinations
+  getDailyNormals(city, country, dates, { units = 'metric', coordinates = null } = {}) {
+    const row = this.findRow(city, country, coordinates);
+    if (row === -1) return null;
+
+    return {
+      location: structuredClone(this.locations[row]),
+      forecast: dates.map(date => this.estimateDay(row, new Date(date), units))
+    };
+  }
+}
+
+export default new ClimatologyService();
@@ -0,0 +1,110 @@
+import crypto from 'crypto';
+import TieredCache from '../utils/tieredCache.js';
+import { LatencyTracker } from '../utils/metrics.js';
+
+// Daily budget per traveler (in the trip currency) mapped to coarse bands
+const BUDGET_BANDS = [
+  { max: 50, band: 'shoestring' },
+  { max: 120, band: 'budget' },
+  { max: 250, band: 'mid-range' },
+  { max: 500, band: 'comfort' }
+];
+
+const normalizeText = (value) => String(value || '').trim().toLowerCase();
+
+const normalizeList = (values) => [...new Set((values || []).map(normalizeText))].sort();
+
+// Content-addressed cache for AI generated itineraries
+class ItineraryCache {
+  constructor() {
+    this.enabled = process.env.AI_CACHE_ENABLED !== 'false';
+    this.store = new TieredCache({
+      namespace: 'itinerary',
+      max: parseInt(process.env.AI_CACHE_MAX_ENTRIES) || 200,
+      ttl: (parseInt(process.env.AI_CACHE_TTL_HOURS) || 24) * 60 * 60 * 1000
+    });
+
+    this.missLatency = new LatencyTracker();
+    this.hitLatency = new LatencyTracker();
+    this.tokensSpent = 0;
+    this.tokensSaved = 0;
+  }
+
+  getBudgetBand(tripData) {
+    const total = tripData.budget?.total;
+    if (!total) return 'unspecified';
+
+    const travelers = (tripData.travelers?.adults || 1) + (tripData.travelers?.children || 0);
+    const perTravelerPerDay = total / travelers / Math.max(tripData.duration || 1, 1);
+    const match = BUDGET_BANDS.find(({ max }) => perTravelerPerDay <= max);
+
+    return match ? match.band : 'luxury';
+  }
+
+  // Hash of every buildItineraryPrompt input. Absolute dates are reduced to the
+  // trip length (day offsets 0..duration-1) so a plan can be replayed for any start date.
+  buildKey(tripData) {
+    const { destination, travelers, preferences, budget } = tripData;
+
+    const canonical = {
+      city: normalizeText(destination?.city),
+      country: normalizeText(destination?.country),
+      duration: tripData.duration,
+      travelers: [
+        travelers?.adults || 1,
+        travelers?.children || 0,
+        travelers?.infants || 0
+      ],
+      pace: normalizeText(preferences?.pace || 'moderate'),
+      themes: normalizeList(preferences?.themes),
+      foodPreferences: normalizeList(preferences?.foodPreferences),
+      transport: normalizeText(preferences?.transportPreference || 'mixed'),
+      currency: normalizeText(budget?.currency || 'USD'),
+      budgetBand: this.getBudgetBand(tripData)
+    };
+
+    return crypto.createHash('sha256').update(JSON.stringify(canonical)).digest('hex');
+  }
+
+  async get(tripData) {
+    const key = this.buildKey(tripData);
+    if (!this.enabled) return { key, value: undefined };
+
+    const value = await this.store.get(key);
+    return { key, value };
+  }
+
+  async set(key, value, { latencyMs = 0, tokens = 0 } = {}) {
+    this.missLatency.record(latencyMs);
+    this.tokensSpent += tokens;
+
+    if (!this.enabled) return;
+
+    // Store a private copy so callers can keep mutating the returned itinerary
+    await this.store.set(key, { ...structuredClone(value), cacheMeta: { tokens, latencyMs } });
+  }
+
+  recordHit(value, latencyMs) {
+    this.hitLatency.record(latencyMs);
+    this.tokensSaved += value.cacheMeta?.tokens || 0;
+  }
+
+  getStats() {
+    const storeStats = this.store.getStats();
+    const hits = storeStats.memoryHits + storeStats.sharedHits;
+
+    return {
+      enabled: this.enabled,
+      ...storeStats,
+      tokensSpent: this.tokensSpent,
+      tokensSaved: this.tokensSaved,
+      latency: {
+        miss: this.missLatency.toJSON(),
+        hit: this.hitLatency.toJSON()
+      },
+      estimatedTimeSavedMs: Math.round(hits * this.missLatency.mean())
+    };
+  }
+}
+
+export default new ItineraryCache();
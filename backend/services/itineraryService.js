@@ -0,0 +1,210 @@
+import mongoose from 'mongoose';
+import Trip from '../models/Trip.js';
+import { AppError } from '../middleware/errorHandler.js';
+
+// Activity fields a client may set
+export const ACTIVITY_FIELDS = [
+  'name', 'description', 'category', 'location', 'duration',
+  'estimatedCost', 'timeSlot', 'priority', 'bookingInfo', 'notes', 'completed'
+];
+
+// Attempts at an edit whose activity keeps changing underneath it
+const EDIT_ATTEMPTS = 3;
+
+// Contribution of one activity to trip.summary
+const summarize = (activity) => Trip.summarizeItinerary([{ activities: [activity] }]);
+
+// $inc moving trip.summary from one activity state to another (either may be null)
+const summaryChange = (before, after) => {
+  const from = before ? summarize(before) : { totalCost: 0, activityCount: 0, completedCount: 0 };
+  const to = after ? summarize(after) : { totalCost: 0, activityCount: 0, completedCount: 0 };
+
+  return {
+    'summary.totalCost': to.totalCost - from.totalCost,
+    'summary.activityCount': to.activityCount - from.activityCount,
+    'summary.completedCount': to.completedCount - from.completedCount
+  };
+};
+
+// Matches the day's activities only while activity still has the cost and completion
+// its summary contribution was computed from
+const unchanged = (activity) => ({
+  $elemMatch: {
+    _id: activity._id,
+    'estimatedCost.max': activity.estimatedCost?.max ?? null,
+    completed: activity.completed ?? null
+  }
+});
+
+// Edits to one day of a trip's itinerary. Each edit is a single update scoped by trip,
+// owner and day position, so the trip, with all its days and likes, is never
+// loaded, re-validated and rewritten; only the changed day or activity is returned.
+// trip.summary is adjusted with $inc in that same update. Edits that change an existing
+// activity's cost or completion first read the activity, and the update only applies
+// while it is unchanged, so the summary cannot drift under concurrent edits.
+// Days are addressed by position (day number - 1), as clients number them.
+class ItineraryService {
+  async addActivity(tripId, userId, dayIndex, activity) {
+    const newActivity = { _id: new mongoose.Types.ObjectId(), ...activity };
+
+    const result = await Trip.updateOne(
+      { _id: tripId, user: userId, [`itinerary.${dayIndex}`]: { $exists: true } },
+      {
+        $push: { [`itinerary.${dayIndex}.activities`]: newActivity },
+        $set: { lastModified: new Date() },
+        $inc: summaryChange(null, newActivity)
+      },
+      { runValidators: true }
+    );
+
+    if (result.matchedCount === 0) await this.throwNotFound(tripId, userId, dayIndex);
+    return newActivity;
+  }
+
+  async updateActivity(tripId, userId, dayIndex, activityId, updates) {
+    const $set = { lastModified: new Date() };
+    const changes = {};
+    ACTIVITY_FIELDS.forEach(field => {
+      if (updates[field] !== undefined) {
+        $set[`itinerary.${dayIndex}.activities.$[activity].${field}`] = updates[field];
+        changes[field] = updates[field];
+      }
+    });
+
+    const filter = { _id: tripId, user: userId, [`itinerary.${dayIndex}.activities._id`]: activityId };
+    const options = { arrayFilters: [{ 'activity._id': activityId }] };
+    const findUpdated = (day) => day.activities.find(activity => activity._id.toString() === String(activityId));
+
+    // Other fields leave the summary alone
+    if (changes.estimatedCost === undefined && changes.completed === undefined) {
+      const day = await this.updateDay(filter, dayIndex, { $set }, options);
+      if (!day) await this.throwNotFound(tripId, userId, dayIndex, activityId);
+      return findUpdated(day);
+    }
+
+    for (let attempt = 0; attempt < EDIT_ATTEMPTS; attempt++) {
+      const current = await this.findActivity(tripId, userId, dayIndex, activityId);
+
+      const day = await this.updateDay(
+        { ...filter, [`itinerary.${dayIndex}.activities`]: unchanged(current) },
+        dayIndex,
+        { $set, $inc: summaryChange(current, { ...current, ...changes }) },
+        options
+      );
+
+      if (day) return findUpdated(day);
+    }
+
+    throw new AppError('Activity changed while updating, please try again', 409);
+  }
+
+  async deleteActivity(tripId, userId, dayIndex, activityId) {
+    for (let attempt = 0; attempt < EDIT_ATTEMPTS; attempt++) {
+      const current = await this.findActivity(tripId, userId, dayIndex, activityId);
+
+      const result = await Trip.updateOne(
+        { _id: tripId, user: userId, [`itinerary.${dayIndex}.activities`]: unchanged(current) },
+        {
+          $pull: { [`itinerary.${dayIndex}.activities`]: { _id: activityId } },
+          $set: { lastModified: new Date() },
+          $inc: summaryChange(current, null)
+        }
+      );
+
+      if (result.matchedCount > 0) return;
+    }
+
+    throw new AppError('Activity changed while deleting, please try again', 409);
+  }
+
+  // activityIds must list every activity of the day exactly once. The write only applies
+  // if the day still holds exactly those activities, so a concurrent add or delete is
+  // reported rather than lost.
+  async reorderActivities(tripId, userId, dayIndex, activityIds) {
+    const trip = await Trip.findOne({ _id: tripId, user: userId })
+      .select({ _id: 1, itinerary: { $slice: [dayIndex, 1] } })
+      .lean();
+
+    if (!trip) throw new AppError('Trip not found', 404);
+    if (trip.itinerary.length === 0) throw new AppError('Invalid day number', 400);
+
+    const currentActivities = trip.itinerary[0].activities;
+    const byId = new Map(currentActivities.map(activity => [activity._id.toString(), activity]));
+    const ids = new Set(activityIds.map(String));
+
+    if (ids.size !== activityIds.length || ids.size !== byId.size || ![...ids].every(id => byId.has(id))) {
+      throw new AppError('Invalid activity IDs or missing activities', 400);
+    }
+
+    if (byId.size === 0) return [];
+
+    const reorderedActivities = activityIds.map(id => byId.get(String(id)));
+
+    const day = await this.updateDay(
+      {
+        _id: tripId,
+        user: userId,
+        [`itinerary.${dayIndex}.activities`]: { $size: byId.size },
+        [`itinerary.${dayIndex}.activities._id`]: { $all: currentActivities.map(activity => activity._id) }
+      },
+      dayIndex,
+      { $set: { [`itinerary.${dayIndex}.activities`]: reorderedActivities, lastModified: new Date() } }
+    );
+
+    if (!day) throw new AppError('Activities changed while reordering, please try again', 409);
+    return day.activities;
+  }
+
+  async updateDayInfo(tripId, userId, dayIndex, { theme, notes }) {
+    const $set = { lastModified: new Date() };
+    if (theme !== undefined) $set[`itinerary.${dayIndex}.theme`] = theme;
+    if (notes !== undefined) $set[`itinerary.${dayIndex}.notes`] = notes;
+
+    const day = await this.updateDay(
+      { _id: tripId, user: userId, [`itinerary.${dayIndex}`]: { $exists: true } },
+      dayIndex,
+      { $set }
+    );
+
+    if (!day) await this.throwNotFound(tripId, userId, dayIndex);
+    return day;
+  }
+
+  // Apply an update and return the updated day alone, or null if filter matched nothing
+  async updateDay(filter, dayIndex, update, options = {}) {
+    const trip = await Trip.findOneAndUpdate(filter, update, {
+      ...options,
+      new: true,
+      runValidators: true,
+      projection: { _id: 1, itinerary: { $slice: [dayIndex, 1] } }
+    }).lean();
+
+    return trip ? trip.itinerary[0] : null;
+  }
+
+  // An activity as stored; throws like throwNotFound if it does not exist
+  async findActivity(tripId, userId, dayIndex, activityId) {
+    const trip = await Trip.findOne({ _id: tripId, user: userId })
+      .select({ _id: 1, itinerary: { $slice: [dayIndex, 1] } })
+      .lean();
+
+    const activity = trip?.itinerary[0]?.activities.find(item => item._id.toString() === String(activityId));
+    if (!activity) await this.throwNotFound(tripId, userId, dayIndex, activityId);
+    return activity;
+  }
+
+  // Work out which part of a scoped update's filter failed to match. Only runs after a
+  // miss, so successful edits stay at one query.
+  async throwNotFound(tripId, userId, dayIndex, activityId = null) {
+    const [trip, day] = await Promise.all([
+      Trip.exists({ _id: tripId, user: userId }),
+      Trip.exists({ _id: tripId, user: userId, [`itinerary.${dayIndex}`]: { $exists: true } })
+    ]);
+
+    if (!trip) throw new AppError('Trip not found', 404);
+    if (!day) throw new AppError('Invalid day number', 400);
+    throw new AppError(activityId ? 'Activity not found' : 'Trip not found', 404);
+  }
+}
+
+export default new ItineraryService();
@@ -0,0 +1,128 @@
+import mongoose from 'mongoose';
+import LRUCache from '../utils/lruCache.js';
+import Place from '../models/Place.js';
+
+const HOUR = 60 * 60 * 1000;
+const DAY = 24 * HOUR;
+
+// Place details by placeId: a byte-bounded LRU in front of the places collection.
+// Ids Google reports as invalid are remembered as null for a shorter period.
+class PlaceDetailsCache {
+  constructor() {
+    this.ttl = (parseInt(process.env.PLACES_CACHE_TTL_DAYS) || 7) * DAY;
+    this.negativeTtl = (parseInt(process.env.PLACES_NEGATIVE_TTL_HOURS) || 6) * HOUR;
+    this.memory = new LRUCache({
+      max: 50000,
+      maxBytes: (parseInt(process.env.PLACES_CACHE_MAX_MB) || 32) * 1024 * 1024,
+      ttl: this.ttl
+    });
+    this.stats = {
+      memoryHits: 0,
+      sharedHits: 0,
+      negativeHits: 0,
+      misses: 0,
+      writes: 0,
+      errors: 0
+    };
+  }
+
+  isSharedAvailable() {
+    return mongoose.connection.readyState === 1;
+  }
+
+  // Cached entries for placeIds in one query: a Map of placeId to details, or to null
+  // for a known invalid id. Ids that are not cached are absent from the Map.
+  async getMany(placeIds) {
+    const ids = [...new Set(placeIds)];
+    const found = new Map();
+    const missing = [];
+
+    for (const placeId of ids) {
+      const value = this.memory.get(placeId);
+      if (value === undefined) {
+        missing.push(placeId);
+        continue;
+      }
+
+      this.stats.memoryHits++;
+      if (value === null) this.stats.negativeHits++;
+      found.set(placeId, value && structuredClone(value));
+    }
+
+    if (missing.length > 0 && this.isSharedAvailable()) {
+      try {
+        const now = Date.now();
+        const places = await Place.find({
+          placeId: { $in: missing },
+          detailsRefreshedAt: { $gt: new Date(now - this.ttl) }
+        })
+          .select('placeId details notFound detailsRefreshedAt')
+          .lean();
+
+        places.forEach(place => {
+          const ttl = (place.notFound ? this.negativeTtl : this.ttl) - (now - place.detailsRefreshedAt.getTime());
+          if (ttl <= 0 || (!place.notFound && !place.details)) return;
+
+          this.stats.sharedHits++;
+          if (place.notFound) this.stats.negativeHits++;
+
+          const value = place.notFound ? null : place.details;
+          this.memory.set(place.placeId, value, { ttl });
+          found.set(place.placeId, value && structuredClone(value));
+        });
+      } catch (error) {
+        this.stats.errors++;
+        console.warn('Place cache read failed:', error.message);
+      }
+    }
+
+    this.stats.misses += ids.length - found.size;
+    return found;
+  }
+
+  async get(placeId) {
+    return (await this.getMany([placeId])).get(placeId);
+  }
+
+  set(placeId, details) {
+    return this.write(placeId, { details, notFound: false }, this.ttl);
+  }
+
+  setNotFound(placeId) {
+    return this.write(placeId, { details: null, notFound: true }, this.negativeTtl);
+  }
+
+  async write(placeId, fields, ttl) {
+    // Keep a private copy; callers are free to mutate the details they return
+    this.memory.set(placeId, fields.details && structuredClone(fields.details), { ttl });
+    this.stats.writes++;
+
+    if (!this.isSharedAvailable()) return;
+
+    try {
+      const now = new Date();
+      await Place.updateOne(
+        { placeId },
+        { $set: { ...fields, detailsRefreshedAt: now, refreshedAt: now } },
+        { upsert: true }
+      );
+    } catch (error) {
+      this.stats.errors++;
+      console.warn('Place cache write failed:', error.message);
+    }
+  }
+
+  getStats() {
+    const hits = this.stats.memoryHits + this.stats.sharedHits;
+    const lookups = hits + this.stats.misses;
+
+    return {
+      entries: this.memory.size,
+      bytes: this.memory.bytes,
+      ...this.stats,
+      hitRate: lookups > 0 ? Math.round((hits / lookups) * 1000) / 1000 : 0
+    };
+  }
+}
+
+export default new PlaceDetailsCache();
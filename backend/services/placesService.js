@@ -1,20 +1,112 @@
-import axios from 'axios';
+import { createHttpClient } from '../utils/httpClient.js';
+import SingleFlight, { flightKey } from '../utils/singleFlight.js';
+import SwrCache from '../utils/swrCache.js';
+import {
+  METERS_PER_DEGREE,
+  coveringGeohashes,
+  decodeGeohashBounds,
+  encodeGeohash,
+  geohashCellSize,
+  haversineMeters
+} from '../utils/geo.js';
+import { mapWithConcurrency } from '../utils/concurrency.js';
+import { encodeCursor } from '../utils/cursor.js';
+import { AppError } from '../middleware/errorHandler.js';
+import placeDetailsCache from './placeDetailsCache.js';
+import placeIndex from './placeIndex.js';
+import placePhotoCache from './placePhotoCache.js';
+
+const HOUR = 60 * 60 * 1000;
+
+// Google's Nearby Search accepts a radius of at most 50 km
+const MAX_NEARBY_RADIUS = 50000;
+const NEARBY_RESULT_LIMIT = 20;
+
+// Requested radii are rounded up to a bucket so that nearby searches share tiles
+const RADIUS_BUCKETS = [500, 1000, 2000, 5000, 10000, 20000, MAX_NEARBY_RADIUS];
+
+// Cells (about 150 m) that exact-circle searches are snapped to, so that users close
+// together still share them
+const CIRCLE_PRECISION = 7;
+
+// Places rarely move; the stale window lets busy tiles refresh in the background
+const NEARBY_TILE_POLICY = { ttl: 6 * HOUR, staleTtl: 48 * HOUR };
+
+// A next_page_token is rejected with INVALID_REQUEST until shortly after it is issued
+const PAGE_TOKEN_DELAY_MS = 2000;
+const PAGE_TOKEN_RETRIES = 3;
+
+const sleep = (ms) => new Promise(resolve => setTimeout(resolve, ms));
+
+const ATTRACTION_TYPES = ['tourist_attraction', 'museum', 'park', 'monument', 'place_of_worship'];
+const RESTAURANT_TYPES = ['restaurant', 'food', 'meal_takeaway'];
+const LODGING_TYPES = ['lodging', 'hotel', 'hostel', 'guest_house'];
 
 class PlacesService {
   constructor() {
     this.googleApiKey = process.env.GOOGLE_PLACES_API_KEY;
     this.mapsApiKey = process.env.GOOGLE_MAPS_API_KEY;
     this.baseUrl = 'https://maps.googleapis.com/maps/api/place';
+    this.http = createHttpClient({ name: 'google-places', timeout: 10000 });
+    this.photoHttp = createHttpClient({ name: 'google-place-photos', timeout: 15000 });
+    this.inflight = new SingleFlight({ name: 'popular-attractions', timeoutMs: 15000, clone: true });
+    this.detailsFlight = new SingleFlight({ name: 'place-details', timeoutMs: 15000, clone: true });
+    this.tileFlight = new SingleFlight({ name: 'nearby-tiles', timeoutMs: 15000, clone: true });
+    this.nearbyTiles = new SwrCache({
+      namespace: 'places-nearby',
+      max: parseInt(process.env.PLACES_NEARBY_CACHE_MAX_TILES) || 2000
+    });
   }
 
   // Search for places by text query
   async searchPlaces(query, location = null, radius = 10000, type = null) {
-    try {
-      if (!this.googleApiKey) {
-        // Return mock data if API key not available (for hackathon)
-        return this.getMockPlaces(query);
-      }
+    if (!this.googleApiKey) {
+      // Return mock data if API key not available (for hackathon)
+      return this.getMockPlaces(query);
+    }
+
+    const places = await this.textSearch(query, location, radius, type);
+    placeIndex.upsert(places);
+    return places;
+  }
+
+  // Text search for a city-level listing. Results are indexed with the area they span,
+  // so the listing is answered locally until that coverage goes stale.
+  async searchCity(key, query, { tag, location = null } = {}) {
+    if (!this.googleApiKey) return this.getMockPlaces(query);
+
+    const places = await this.textSearch(query, location, 20000);
+    placeIndex.recordSearch(key, places, { tag });
+    return places;
+  }
+
+  // Indexed places for a city-level listing; null without an API key, as the mock data
+  // is never indexed
+  findIndexed(key, filters) {
+    return this.googleApiKey ? placeIndex.search(key, filters) : null;
+  }
+
+  // One page of a text search. Without a cursor the first page is fetched; otherwise the
+  // page the cursor points at. cursor in the result is null on the last page.
+  async searchPlacesPage(query, { location = null, radius = 10000, type = null, cursor = null } = {}) {
+    if (!this.googleApiKey) {
+      return { places: this.getMockPlaces(query), cursor: null };
+    }
 
+    const page = cursor
+      ? await this.fetchNextPage(cursor)
+      : await this.textSearchPage(query, location, radius, type);
+
+    placeIndex.upsert(page.places);
+    return page;
+  }
+
+  async textSearch(query, location = null, radius = 10000, type = null) {
+    return (await this.textSearchPage(query, location, radius, type)).places;
+  }
+
+  async textSearchPage(query, location = null, radius = 10000, type = null) {
+    try {
       const params = {
         query: query,
         key: this.googleApiKey,
@@ -30,44 +122,237 @@ class PlacesService {
         params.type = type;
       }
 
-      const response = await axios.get(`${this.baseUrl}/textsearch/json`, { params });
+      const response = await this.http.get(`${this.baseUrl}/textsearch/json`, { params });
 
-      return this.formatPlacesResponse(response.data.results);
+      return this.toSearchPage(response.data);
     } catch (error) {
       console.error('Places Search Error:', error);
       throw new Error(`Failed to search places: ${error.message}`);
     }
   }
 
-  // Get detailed information about a specific place
+  // Follow a cursor's next_page_token, waiting until Google will accept it. readyAt
+  // comes from the client, so the first wait is capped at PAGE_TOKEN_DELAY_MS.
+  async fetchNextPage({ token, readyAt }) {
+    let data;
+
+    for (let attempt = 0; attempt <= PAGE_TOKEN_RETRIES; attempt++) {
+      await sleep(attempt === 0
+        ? Math.min(PAGE_TOKEN_DELAY_MS, Math.max(0, readyAt - Date.now()))
+        : PAGE_TOKEN_DELAY_MS / 2);
+
+      try {
+        const response = await this.http.get(`${this.baseUrl}/textsearch/json`, {
+          params: { pagetoken: token, key: this.googleApiKey }
+        });
+        data = response.data;
+      } catch (error) {
+        console.error('Places Search Error:', error);
+        throw new Error(`Failed to search places: ${error.message}`);
+      }
+
+      if (data.status !== 'INVALID_REQUEST') return this.toSearchPage(data);
+    }
+
+    throw new AppError('Search cursor is invalid or has expired', 400);
+  }
+
+  toSearchPage({ results = [], next_page_token: nextPageToken }) {
+    return {
+      places: this.formatPlacesResponse(results),
+      cursor: nextPageToken
+        ? encodeCursor({ token: nextPageToken, readyAt: Date.now() + PAGE_TOKEN_DELAY_MS })
+        : null
+    };
+  }
+
+  // Resolve free text (e.g. "Paris, France") to one place; null without an API key or a match
+  async findPlace(input) {
+    if (!this.googleApiKey) return null;
+
+    const response = await this.http.get(`${this.baseUrl}/findplacefromtext/json`, {
+      params: {
+        input,
+        inputtype: 'textquery',
+        fields: 'place_id,name,geometry',
+        key: this.googleApiKey
+      }
+    });
+
+    const candidate = response.data.candidates?.[0];
+    if (!candidate) return null;
+
+    return {
+      placeId: candidate.place_id,
+      name: candidate.name,
+      location: candidate.geometry.location
+    };
+  }
+
+  // Get detailed information about a specific place. Details are cached for days,
+  // unknown ids for hours; concurrent lookups of one id share a request.
   async getPlaceDetails(placeId) {
-    try {
-      if (!this.googleApiKey || !placeId) {
-        return this.getMockPlaceDetails();
+    if (!this.googleApiKey || !placeId) {
+      return this.getMockPlaceDetails();
+    }
+
+    const cached = await placeDetailsCache.get(placeId);
+    if (cached === null) throw new AppError('Place not found', 404);
+    if (cached) return cached;
+
+    return this.detailsFlight.do(placeId, () => this.fetchPlaceDetails(placeId));
+  }
+
+  // Details for many places with one cache query; Google is only called for ids that are
+  // not cached. Returns a Map of placeId to details, or to null for ids that do not exist.
+  // Ids whose lookup failed are left out.
+  async getPlaceDetailsBulk(placeIds, { concurrency = 5 } = {}) {
+    if (!this.googleApiKey) {
+      return new Map(placeIds.map(placeId => [placeId, this.getMockPlaceDetails()]));
+    }
+
+    const results = await placeDetailsCache.getMany(placeIds);
+    const missing = [...new Set(placeIds)].filter(placeId => !results.has(placeId));
+
+    await mapWithConcurrency(missing, concurrency, async (placeId) => {
+      try {
+        results.set(placeId, await this.detailsFlight.do(placeId, () => this.fetchPlaceDetails(placeId)));
+      } catch (error) {
+        if (error.statusCode === 404) {
+          results.set(placeId, null);
+        } else {
+          console.warn(`Place details for ${placeId} unavailable:`, error.message);
+        }
       }
+    });
 
+    return results;
+  }
+
+  async fetchPlaceDetails(placeId) {
+    try {
       const params = {
         place_id: placeId,
         key: this.googleApiKey,
         fields: 'place_id,name,formatted_address,geometry,rating,price_level,photos,reviews,opening_hours,formatted_phone_number,website,types,vicinity'
       };
 
-      const response = await axios.get(`${this.baseUrl}/details/json`, { params });
+      const response = await this.http.get(`${this.baseUrl}/details/json`, { params });
+      const { status, result } = response.data;
 
-      return this.formatPlaceDetails(response.data.result);
+      // Unknown and malformed ids are remembered so they do not cost a request each time
+      if (status === 'NOT_FOUND' || status === 'INVALID_REQUEST') {
+        placeDetailsCache.setNotFound(placeId);
+        throw new AppError('Place not found', 404);
+      }
+      if (status && status !== 'OK') {
+        throw new Error(`Google Places returned ${status}`);
+      }
+
+      const details = this.formatPlaceDetails(result);
+      placeDetailsCache.set(placeId, details);
+      return details;
     } catch (error) {
+      if (error instanceof AppError) throw error;
+
       console.error('Place Details Error:', error);
       throw new Error(`Failed to get place details: ${error.message}`);
     }
   }
 
-  // Find nearby places by type
+  // Find nearby places by type. Results are assembled from geohash tiles cached per
+  // (tile, type, radius bucket): the tiles covering the search circle are merged and
+  // filtered to the exact radius locally, so nearby users share Google requests.
+  // A full tile holds only Google's top 20 for an area wider than the circle, so the
+  // circle itself is then searched too.
   async findNearbyPlaces(location, radius = 1500, type = 'tourist_attraction') {
-    try {
-      if (!this.googleApiKey) {
-        return this.getMockNearbyPlaces(type);
-      }
+    if (!this.googleApiKey) {
+      return this.getMockNearbyPlaces(type);
+    }
 
+    const searchRadius = Math.min(radius, MAX_NEARBY_RADIUS);
+    const radiusBucket = RADIUS_BUCKETS.find(bucket => bucket >= searchRadius);
+    const tiles = coveringGeohashes(location, searchRadius, this.tilePrecision(radiusBucket));
+
+    const tilePlaces = await Promise.all(tiles.map(tile => this.getNearbyTile(tile, type, radiusBucket)));
+
+    if (tilePlaces.some(places => places.length >= NEARBY_RESULT_LIMIT)) {
+      tilePlaces.push(await this.getNearbyCircle(location, type, radiusBucket));
+    }
+
+    const seen = new Set();
+    return tilePlaces.flat()
+      .filter(place => {
+        if (seen.has(place.placeId)) return false;
+        seen.add(place.placeId);
+        return haversineMeters(location, place.location) <= searchRadius;
+      })
+      .sort((a, b) => (b.rating || 0) - (a.rating || 0))
+      .slice(0, NEARBY_RESULT_LIMIT);
+  }
+
+  // Finest geohash precision whose tiles are at least radiusBucket on each side, so a
+  // search circle overlaps only a handful of tiles
+  tilePrecision(radiusBucket) {
+    for (let precision = 7; precision > 1; precision--) {
+      const cell = geohashCellSize(precision);
+      if (Math.min(cell.lat, cell.lng) * METERS_PER_DEGREE >= radiusBucket) return precision;
+    }
+    return 1;
+  }
+
+  getNearbyTile(tile, type, radiusBucket) {
+    const key = flightKey(tile, type, radiusBucket);
+    return this.nearbyTiles.get(
+      key,
+      () => this.tileFlight.do(key, () => this.fetchNearbyTile(tile, type)),
+      NEARBY_TILE_POLICY
+    );
+  }
+
+  // Nearby places for a search circle, snapped to the CIRCLE_PRECISION cell around its
+  // centre and widened to cover any circle of radiusBucket centred in that cell
+  getNearbyCircle(location, type, radiusBucket) {
+    const cell = encodeGeohash(location.lat, location.lng, CIRCLE_PRECISION);
+    const key = flightKey('circle', cell, type, radiusBucket);
+    return this.nearbyTiles.get(
+      key,
+      () => this.tileFlight.do(key, () => this.fetchNearbyCircle(cell, type, radiusBucket)),
+      NEARBY_TILE_POLICY
+    );
+  }
+
+  // One Nearby Search from the tile centre, wide enough to reach its corners
+  fetchNearbyTile(tile, type) {
+    const { minLat, maxLat, minLng, maxLng } = decodeGeohashBounds(tile);
+    const center = { lat: (minLat + maxLat) / 2, lng: (minLng + maxLng) / 2 };
+    const radius = Math.min(Math.ceil(haversineMeters(center, { lat: maxLat, lng: maxLng })), MAX_NEARBY_RADIUS);
+
+    return this.fetchNearbyArea(flightKey('nearby', tile, type), center, radius, type);
+  }
+
+  fetchNearbyCircle(cell, type, radiusBucket) {
+    const { minLat, maxLat, minLng, maxLng } = decodeGeohashBounds(cell);
+    const center = { lat: (minLat + maxLat) / 2, lng: (minLng + maxLng) / 2 };
+    const reach = Math.ceil(haversineMeters(center, { lat: maxLat, lng: maxLng }));
+    const radius = Math.min(radiusBucket + reach, MAX_NEARBY_RADIUS);
+
+    return this.fetchNearbyArea(flightKey('nearby-circle', cell, type, radiusBucket), center, radius, type);
+  }
+
+  // One Nearby Search of an area. An area searched recently, e.g. before a restart, is
+  // read back from the place index.
+  async fetchNearbyArea(key, center, radius, type) {
+    const indexed = await placeIndex.search(key, { types: [type], limit: NEARBY_RESULT_LIMIT });
+    if (indexed) return indexed;
+
+    const places = await this.fetchNearbyPlaces(center, radius, type);
+    placeIndex.recordSearch(key, places, { center, radius });
+    return places;
+  }
+
+  async fetchNearbyPlaces(location, radius, type) {
+    try {
       const params = {
         location: `${location.lat},${location.lng}`,
         radius: radius,
@@ -75,7 +360,7 @@ class PlacesService {
         key: this.googleApiKey
       };
 
-      const response = await axios.get(`${this.baseUrl}/nearbysearch/json`, { params });
+      const response = await this.http.get(`${this.baseUrl}/nearbysearch/json`, { params });
 
       return this.formatPlacesResponse(response.data.results);
     } catch (error) {
@@ -84,18 +369,42 @@ class PlacesService {
     }
   }
 
-  // Get popular attractions for a city
-  async getPopularAttractions(city, country, limit = 20) {
+  // Get popular attractions for a city; concurrent identical lookups share one search
+  getPopularAttractions(city, country, limit = 20) {
+    return this.inflight.do(
+      flightKey(city, country, limit),
+      () => this.fetchPopularAttractions(city, country, limit)
+    );
+  }
+
+  // Popular attractions for a stored trip destination. Once the destination has been
+  // geocoded the search is biased to, and cached by, its coordinates.
+  getPopularAttractionsFor(destination, limit = 20) {
+    const { latitude, longitude } = destination.coordinates || {};
+    if (latitude === undefined || longitude === undefined) {
+      return this.getPopularAttractions(destination.city, destination.country, limit);
+    }
+
+    const location = { lat: latitude, lng: longitude };
+    return this.inflight.do(
+      flightKey(latitude.toFixed(3), longitude.toFixed(3), limit),
+      () => this.fetchPopularAttractions(destination.city, destination.country, limit, location)
+    );
+  }
+
+  async fetchPopularAttractions(city, country, limit = 20, location = null) {
     try {
+      const key = flightKey('attractions', city, country);
+      const indexed = await this.findIndexed(key, { types: ATTRACTION_TYPES, limit });
+      if (indexed) return indexed;
+
       const query = `popular attractions in ${city} ${country}`;
-      const places = await this.searchPlaces(query);
+      const places = await this.searchCity(key, query, { location });
 
       // Filter and sort by rating
       const attractions = places
         .filter(place => 
-          place.types.some(type => 
-            ['tourist_attraction', 'museum', 'park', 'monument', 'place_of_worship'].includes(type)
-          )
+          place.types.some(type => ATTRACTION_TYPES.includes(type))
         )
         .sort((a, b) => (b.rating || 0) - (a.rating || 0))
         .slice(0, limit);
@@ -110,17 +419,20 @@ class PlacesService {
   // Get restaurants for a location
   async getRestaurants(city, country, cuisine = null, priceLevel = null, limit = 15) {
     try {
+      const key = flightKey('restaurants', city, country, cuisine);
+      const tag = cuisine && `cuisine:${cuisine.trim().toLowerCase()}`;
+      const indexed = await this.findIndexed(key, { types: RESTAURANT_TYPES, tag, priceLevel, limit });
+      if (indexed) return indexed;
+
       let query = `restaurants in ${city} ${country}`;
       if (cuisine) {
         query = `${cuisine} restaurants in ${city} ${country}`;
       }
 
-      const places = await this.searchPlaces(query);
+      const places = await this.searchCity(key, query, { tag });
 
       let restaurants = places.filter(place => 
-        place.types.includes('restaurant') || 
-        place.types.includes('food') ||
-        place.types.includes('meal_takeaway')
+        place.types.some(type => RESTAURANT_TYPES.includes(type))
       );
 
       if (priceLevel) {
@@ -139,12 +451,17 @@ class PlacesService {
   // Get accommodation options
   async getAccommodations(city, country, type = 'lodging', limit = 10) {
     try {
+      const key = flightKey('lodging', city, country, type);
+      const tag = type !== 'lodging' ? `lodging:${type.trim().toLowerCase()}` : null;
+      const indexed = await this.findIndexed(key, { types: LODGING_TYPES, tag, limit });
+      if (indexed) return indexed;
+
       const query = `${type} in ${city} ${country}`;
-      const places = await this.searchPlaces(query);
+      const places = await this.searchCity(key, query, { tag });
 
       const accommodations = places
         .filter(place => 
-          place.types.some(t => ['lodging', 'hotel', 'hostel', 'guest_house'].includes(t))
+          place.types.some(t => LODGING_TYPES.includes(t))
         )
         .sort((a, b) => (b.rating || 0) - (a.rating || 0))
         .slice(0, limit);
@@ -218,12 +535,67 @@ class PlacesService {
     };
   }
 
-  // Get photo URL from photo reference
+  // Get photo URL from photo reference. Photos go through our own photo route, which
+  // keeps the API key server side and caches each photo after its first download.
   getPhotoUrl(photoReference, maxWidth = 400) {
     if (!this.googleApiKey) {
       return 'https://via.placeholder.com/400x300?text=No+Image';
     }
-    return `https://maps.googleapis.com/maps/api/place/photo?maxwidth=${maxWidth}&photo_reference=${photoReference}&key=${this.googleApiKey}`;
+    return `/api/places/photo/${encodeURIComponent(photoReference)}?maxwidth=${maxWidth}`;
+  }
+
+  // Open a photo for streaming: { stream, hash, size, contentType }
+  async openPhoto(photoReference, maxWidth = 400) {
+    if (!this.googleApiKey) {
+      throw new AppError('Place photos are not available', 404);
+    }
+
+    return placePhotoCache.open(
+      this.photoKey(photoReference, maxWidth),
+      () => this.downloadPhoto(photoReference, maxWidth)
+    );
+  }
+
+  // Whether a photo can be served from disk, without a Google request
+  hasCachedPhoto(photoReference, maxWidth = 400) {
+    return placePhotoCache.has(this.photoKey(photoReference, maxWidth));
+  }
+
+  // Photo references are case sensitive, so flightKey's normalization does not apply
+  photoKey(photoReference, maxWidth) {
+    return `${photoReference}|${maxWidth}`;
+  }
+
+  async downloadPhoto(photoReference, maxWidth) {
+    try {
+      const response = await this.photoHttp.get(`${this.baseUrl}/photo`, {
+        params: {
+          maxwidth: maxWidth,
+          photo_reference: photoReference,
+          key: this.googleApiKey
+        },
+        responseType: 'stream'
+      });
+
+      const contentType = response.headers['content-type'] || '';
+      if (!contentType.startsWith('image/')) {
+        response.data.destroy();
+        throw new AppError('Place photo not found', 404);
+      }
+
+      return { stream: response.data, contentType };
+    } catch (error) {
+      if (error instanceof AppError) throw error;
+
+      // Release the socket held by the unread error body
+      error.response?.data?.destroy?.();
+      if (error.response?.status === 400 || error.response?.status === 404) {
+        throw new AppError('Place photo not found', 404);
+      }
+
+      console.error('Place Photo Error:', error.message);
+      throw new Error(`Failed to get place photo: ${error.message}`);
+    }
   }
 
   // Mock data for when API key is not available (hackathon fallback)
@@ -322,6 +694,27 @@ class PlacesService {
       }
     ];
   }
+
+  getCoalescingStats() {
+    return this.inflight.getStats();
+  }
+
+  getDetailsCoalescingStats() {
+    return this.detailsFlight.getStats();
+  }
+
+  getTileCoalescingStats() {
+    return this.tileFlight.getStats();
+  }
+
+  getCacheStats() {
+    return {
+      details: placeDetailsCache.getStats(),
+      nearbyTiles: this.nearbyTiles.getStats(),
+      index: placeIndex.getStats(),
+      photos: placePhotoCache.getStats()
+    };
+  }
 }
 
 export default new PlacesService();
@@ -0,0 +1,49 @@
+import LRUCache from '../utils/lruCache.js';
+import SingleFlight from '../utils/singleFlight.js';
+import Trip from '../models/Trip.js';
+
+// Totals for trip list filters. Counting visits every matching trip, so each filter's
+// total is cached briefly and concurrent requests for the same filter share one count.
+class TripCountCache {
+  constructor() {
+    this.memory = new LRUCache({
+      max: 5000,
+      ttl: (parseInt(process.env.TRIP_COUNT_CACHE_TTL_SECONDS) || 60) * 1000
+    });
+    this.inflight = new SingleFlight({ name: 'trip-count' });
+    this.stats = {
+      hits: 0,
+      misses: 0
+    };
+  }
+
+  async count(query) {
+    const key = JSON.stringify(query);
+    const cached = this.memory.get(key);
+
+    if (cached !== undefined) {
+      this.stats.hits++;
+      return cached;
+    }
+
+    this.stats.misses++;
+    return this.inflight.do(key, async () => {
+      const total = await Trip.countDocuments(query);
+      this.memory.set(key, total);
+      return total;
+    });
+  }
+
+  getStats() {
+    return {
+      ...this.stats,
+      entries: this.memory.size
+    };
+  }
+
+  getCoalescingStats() {
+    return this.inflight.getStats();
+  }
+}
+
+export default new TripCountCache();
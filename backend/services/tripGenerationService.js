@@ -0,0 +1,171 @@
+import { EventEmitter } from 'events';
+import Trip from '../models/Trip.js';
+import aiService from './aiService.js';
+import weatherService from './weatherService.js';
+import geocodingService from './geocodingService.js';
+import JobQueue from '../utils/jobQueue.js';
+
+// Runs the AI itinerary and weather steps for trips created in job mode
+class TripGenerationService {
+  constructor() {
+    this.events = new EventEmitter();
+    this.events.setMaxListeners(0);
+
+    this.queue = new JobQueue({
+      name: 'trip-generation',
+      handler: ({ tripId }) => this.generate(tripId),
+      concurrency: parseInt(process.env.TRIP_JOB_CONCURRENCY) || 2,
+      maxQueued: parseInt(process.env.TRIP_JOB_MAX_QUEUED) || 50,
+      driver: process.env.TRIP_JOB_QUEUE || 'memory'
+    });
+  }
+
+  // Queue generation for a trip stored with generation.status 'generating'
+  enqueue(trip) {
+    return this.queue.add({ tripId: trip._id.toString() }, trip.generation.jobId);
+  }
+
+  buildTripData(trip) {
+    const toDateString = (date) => new Date(date).toISOString().split('T')[0];
+
+    return {
+      title: trip.title,
+      description: trip.description,
+      destination: trip.destination,
+      startDate: toDateString(trip.startDate),
+      endDate: toDateString(trip.endDate),
+      duration: trip.duration,
+      travelers: trip.travelers,
+      preferences: trip.preferences,
+      budget: trip.budget
+    };
+  }
+
+  async getWeather(destination, startDate, endDate) {
+    try {
+      // Goes by OpenWeather city id or coordinates once the destination is geocoded
+      return await weatherService.getWeatherForTripAt(
+        weatherService.destinationLocation(destination),
+        startDate,
+        endDate
+      );
+    } catch (weatherError) {
+      console.warn('Weather service unavailable:', weatherError.message);
+      return null;
+    }
+  }
+
+  // Copy the per-day forecast onto the matching itinerary days
+  applyWeather(itinerary, weatherInfo) {
+    if (!weatherInfo?.forecast) return itinerary;
+
+    return itinerary.map((day, i) => {
+      const forecast = weatherInfo.forecast[i];
+      if (!forecast) return day;
+
+      return {
+        ...day,
+        weather: weatherService.toItineraryWeather(forecast)
+      };
+    });
+  }
+
+  getAiInfo(aiResult) {
+    return {
+      totalBudgetEstimate: aiResult.totalBudgetEstimate,
+      generalTips: aiResult.generalTips,
+      bestTimeToVisit: aiResult.bestTimeToVisit,
+      localCustoms: aiResult.localCustoms
+    };
+  }
+
+  // Public view of a trip's generation progress
+  formatStatus(trip) {
+    const generation = trip.generation || {};
+
+    return {
+      tripId: trip._id,
+      jobId: generation.jobId,
+      status: generation.status || 'completed',
+      step: generation.step,
+      progress: generation.progress ?? 100,
+      error: generation.error,
+      aiInfo: generation.aiInfo
+    };
+  }
+
+  async updateProgress(tripId, generation, extra = {}) {
+    const update = { ...extra };
+    Object.entries(generation).forEach(([field, value]) => {
+      update[`generation.${field}`] = value;
+    });
+
+    await Trip.updateOne({ _id: tripId }, { $set: update });
+    this.events.emit(tripId, generation);
+  }
+
+  // Subscribe to progress updates published by this process
+  subscribe(tripId, listener) {
+    const key = tripId.toString();
+    this.events.on(key, listener);
+    return () => this.events.off(key, listener);
+  }
+
+  async generate(tripId) {
+    const trip = await Trip.findById(tripId).lean();
+    if (!trip) return; // Deleted while queued
+
+    const tripData = this.buildTripData(trip);
+
+    // Geocode while the itinerary is generated; resolve() never rejects
+    const destinationPromise = geocodingService.resolve(trip.destination);
+
+    try {
+      await this.updateProgress(tripId, {
+        status: 'generating',
+        step: 'itinerary',
+        progress: 10,
+        startedAt: new Date()
+      });
+
+      const aiResult = await aiService.generateItinerary(tripData);
+
+      await this.updateProgress(tripId, { status: 'generating', step: 'weather', progress: 70 });
+
+      const destination = await destinationPromise;
+      const weatherInfo = await this.getWeather(destination, tripData.startDate, tripData.endDate);
+      const itinerary = this.applyWeather(aiResult.itinerary, weatherInfo);
+
+      await this.updateProgress(tripId, {
+        status: 'completed',
+        step: 'done',
+        progress: 100,
+        aiInfo: this.getAiInfo(aiResult),
+        completedAt: new Date()
+      }, {
+        destination,
+        itinerary,
+        summary: Trip.summarizeItinerary(itinerary),
+        aiGenerated: true
+      });
+    } catch (error) {
+      console.error('Trip generation error:', error);
+
+      await this.updateProgress(tripId, {
+        status: 'failed',
+        step: 'done',
+        progress: 100,
+        error: 'AI itinerary generation failed, but you can add activities manually.',
+        completedAt: new Date()
+      }, { destination: await destinationPromise, aiGenerated: false });
+
+      throw error;
+    }
+  }
+
+  getStats() {
+    return this.queue.getStats();
+  }
+}
+
+export default new TripGenerationService();
@@ -0,0 +1,170 @@
+import cron from 'node-cron';
+import mongoose from 'mongoose';
+import Trip from '../models/Trip.js';
+import weatherService from './weatherService.js';
+
+const DAY = 24 * 60 * 60 * 1000;
+
+// OpenWeather's free forecast covers today plus the next four days
+const FORECAST_DAYS = 5;
+
+const sleep = (ms) => new Promise(resolve => setTimeout(resolve, ms));
+
+const toDateString = (date) => new Date(date).toISOString().split('T')[0];
+
+// Periodically refreshes the forecast for trips inside the forecast window and writes
+// each day's weather onto the stored itinerary, so reading a trip never waits on
+// OpenWeather. Locations are fetched in small batches spaced out over the run.
+class WeatherPrefetchService {
+  constructor() {
+    this.schedule = process.env.WEATHER_PREFETCH_CRON || '*/30 * * * *';
+    this.batchSize = parseInt(process.env.WEATHER_PREFETCH_BATCH_SIZE) || 10;
+    this.batchDelayMs = parseInt(process.env.WEATHER_PREFETCH_BATCH_DELAY_MS) || 2000;
+    this.task = null;
+    this.running = false;
+    this.stats = {
+      runs: 0,
+      skippedRuns: 0,
+      trips: 0,
+      locations: 0,
+      fetchErrors: 0,
+      tripsUpdated: 0,
+      lastRunAt: null,
+      lastRunMs: null
+    };
+  }
+
+  start() {
+    if (this.task || process.env.WEATHER_PREFETCH_ENABLED === 'false') return;
+
+    if (!cron.validate(this.schedule)) {
+      console.warn(`Invalid WEATHER_PREFETCH_CRON "${this.schedule}"; weather prefetch disabled`);
+      return;
+    }
+
+    this.task = cron.schedule(this.schedule, () => {
+      this.run().catch(error => console.error('Weather prefetch failed:', error));
+    });
+  }
+
+  stop() {
+    this.task?.stop();
+    this.task = null;
+  }
+
+  async run() {
+    // Overlapping runs would only repeat the same requests
+    if (this.running || mongoose.connection.readyState !== 1) {
+      this.stats.skippedRuns++;
+      return;
+    }
+
+    this.running = true;
+    const startedAt = Date.now();
+
+    try {
+      const trips = await this.findUpcomingTrips();
+      const groups = this.groupByLocation(trips);
+
+      this.stats.runs++;
+      this.stats.trips += trips.length;
+      this.stats.locations += groups.length;
+
+      for (let i = 0; i < groups.length; i += this.batchSize) {
+        if (i > 0) await sleep(this.batchDelayMs);
+
+        const batch = groups.slice(i, i + this.batchSize);
+        const operations = (await Promise.all(batch.map(group => this.prefetchGroup(group)))).flat();
+
+        if (operations.length > 0) {
+          const result = await Trip.bulkWrite(operations, { ordered: false });
+          this.stats.tripsUpdated += result.modifiedCount || 0;
+        }
+      }
+    } finally {
+      this.running = false;
+      this.stats.lastRunAt = new Date(startedAt).toISOString();
+      this.stats.lastRunMs = Date.now() - startedAt;
+    }
+  }
+
+  // Active trips with at least one itinerary day inside the forecast window
+  findUpcomingTrips() {
+    const today = new Date(toDateString(Date.now()));
+    const windowEnd = new Date(today.getTime() + FORECAST_DAYS * DAY);
+
+    return Trip.find({
+      startDate: { $lt: windowEnd },
+      endDate: { $gte: today },
+      status: { $in: ['planning', 'confirmed', 'ongoing'] },
+      'itinerary.0': { $exists: true }
+    })
+      .select('destination itinerary._id itinerary.date')
+      .lean();
+  }
+
+  // Trips to the same place share one forecast request
+  groupByLocation(trips) {
+    const groups = new Map();
+
+    trips.forEach(trip => {
+      const location = weatherService.destinationLocation(trip.destination);
+      const { key } = weatherService.locationRequest(location, 'forecast');
+
+      if (!groups.has(key)) groups.set(key, { location, trips: [] });
+      groups.get(key).trips.push(trip);
+    });
+
+    return [...groups.values()];
+  }
+
+  // bulkWrite operations setting the forecast on each matching itinerary day
+  async prefetchGroup({ location, trips }) {
+    let forecast;
+    try {
+      forecast = await weatherService.prefetchForecast(location);
+    } catch (error) {
+      this.stats.fetchErrors++;
+      console.warn(`Weather prefetch for ${location.city}, ${location.country} failed:`, error.message);
+      return [];
+    }
+
+    const weatherByDate = new Map(
+      forecast.forecast.map(day => [day.date, weatherService.toItineraryWeather(day)])
+    );
+
+    return trips.flatMap(trip => {
+      const update = {};
+      const arrayFilters = [];
+
+      // Days are matched by _id so concurrent itinerary edits cannot shift the target
+      trip.itinerary.forEach((day, i) => {
+        const weather = weatherByDate.get(toDateString(day.date));
+        if (!weather) return;
+
+        update[`itinerary.$[day${i}].weather`] = weather;
+        arrayFilters.push({ [`day${i}._id`]: day._id });
+      });
+
+      if (arrayFilters.length === 0) return [];
+
+      return [{
+        updateOne: {
+          filter: { _id: trip._id },
+          update: { $set: update },
+          arrayFilters
+        }
+      }];
+    });
+  }
+
+  getStats() {
+    return {
+      schedule: this.task ? this.schedule : null,
+      running: this.running,
+      ...this.stats
+    };
+  }
+}
+
+export default new WeatherPrefetchService();
@@ -1,84 +1,311 @@
-import axios from 'axios';
+import { createHttpClient } from '../utils/httpClient.js';
+import SingleFlight, { flightKey } from '../utils/singleFlight.js';
+import SwrCache from '../utils/swrCache.js';
+import climatologyService from './climatologyService.js';
+import { mapWithConcurrency } from '../utils/concurrency.js';
+import { compileWeatherRules } from '../utils/weatherRuleTable.js';
+import { WEATHER_RULES } from '../data/weatherRules.js';
+
+const MINUTE = 60 * 1000;
+const DAY = 24 * 60 * MINUTE;
+const SECONDS_PER_DAY = 24 * 60 * 60;
+
+// OpenWeather's /group endpoint accepts at most 20 city ids
+const GROUP_SIZE = 20;
+
+// Forecast samples fall on a handful of times of day, so each label is formatted once
+const timeFormat = new Intl.DateTimeFormat('en-US', {
+  hour: '2-digit',
+  minute: '2-digit',
+  hourCycle: 'h23',
+  timeZone: 'UTC'
+});
+const timeLabels = new Map();
+
+// HH:MM for a local timestamp (seconds already shifted by the city's UTC offset)
+const formatLocalTime = (localSeconds) => {
+  const minuteOfDay = Math.floor((((localSeconds % SECONDS_PER_DAY) + SECONDS_PER_DAY) % SECONDS_PER_DAY) / 60);
+
+  let label = timeLabels.get(minuteOfDay);
+  if (!label) {
+    label = timeFormat.format(minuteOfDay * 60 * 1000);
+    timeLabels.set(minuteOfDay, label);
+  }
+  return label;
+};
+
+// Current conditions change within minutes; forecasts are only updated every 3 hours
+const CACHE_POLICIES = {
+  current: { ttl: 10 * MINUTE, staleTtl: 30 * MINUTE },
+  forecast: { ttl: 60 * MINUTE, staleTtl: 180 * MINUTE }
+};
+
+// Recommendation lookup built once at startup; results are shared frozen arrays
+const recommendWeather = compileWeatherRules(WEATHER_RULES);
 
 class WeatherService {
   constructor() {
     this.apiKey = process.env.OPENWEATHER_API_KEY;
     this.baseUrl = 'https://api.openweathermap.org/data/2.5';
+    this.http = createHttpClient({ name: 'openweathermap', timeout: 8000 });
+    this.inflight = new SingleFlight({ name: 'weather', timeoutMs: 10000, clone: true });
+    this.cache = new SwrCache({
+      namespace: 'weather',
+      max: parseInt(process.env.WEATHER_CACHE_MAX_ENTRIES) || 1000,
+      shared: process.env.WEATHER_CACHE_SHARED !== 'false'
+    });
+  }
+
+  // Serve a request from the weather cache; misses and refreshes share one upstream request
+  cached(key, policy, fetcher) {
+    return this.cache.get(key, () => this.inflight.do(key, fetcher), policy);
   }
 
   // Get current weather for a destination
-  async getCurrentWeather(city, country, units = 'metric') {
+  getCurrentWeather(city, country, units = 'metric') {
+    return this.getCurrentWeatherFor({ city, country, units });
+  }
+
+  // Get current weather at a point
+  getCurrentWeatherAt(lat, lon, units = 'metric') {
+    return this.getCurrentWeatherFor({ lat, lon, units });
+  }
+
+  getCurrentWeatherFor(location) {
+    const request = this.locationRequest(location, 'current');
+    return this.cached(request.key, CACHE_POLICIES.current, () => this.fetchCurrentWeather(request.params, request.units));
+  }
+
+  // Cache key and query parameters for a location, by OpenWeather city id, coordinates,
+  // or free-text city and country, in that order of preference. Coordinates are rounded
+  // to two decimals (about 1 km) so nearby lookups share an entry.
+  locationRequest({ city, country, lat, lon, owmCityId, units = 'metric' }, endpoint) {
+    if (owmCityId) {
+      return {
+        key: flightKey('id', owmCityId, units, endpoint),
+        params: { id: owmCityId },
+        units
+      };
+    }
+
+    if (lat !== undefined && lat !== null && lon !== undefined && lon !== null) {
+      const latitude = Number(lat).toFixed(2);
+      const longitude = Number(lon).toFixed(2);
+      return {
+        key: flightKey(latitude, longitude, units, endpoint),
+        params: { lat: latitude, lon: longitude },
+        units
+      };
+    }
+
+    return {
+      key: flightKey(city, country, units, endpoint),
+      params: { q: `${city},${country}` },
+      units
+    };
+  }
+
+  // Weather lookup location for a stored trip destination; resolved ids and
+  // coordinates are preferred over the free-text name
+  destinationLocation(destination, units = 'metric') {
+    return {
+      city: destination.city,
+      country: destination.country,
+      owmCityId: destination.owmCityId,
+      lat: destination.coordinates?.latitude,
+      lon: destination.coordinates?.longitude,
+      units
+    };
+  }
+
+  async fetchCurrentWeather(params, units = 'metric') {
     try {
       if (!this.apiKey) {
         throw new Error('OpenWeather API key not configured');
       }
 
-      const location = `${city},${country}`;
-      const response = await axios.get(`${this.baseUrl}/weather`, {
+      const response = await this.http.get(`${this.baseUrl}/weather`, {
         params: {
-          q: location,
+          ...params,
           appid: this.apiKey,
           units: units
         }
       });
 
-      const data = response.data;
-
-      return {
-        location: {
-          name: data.name,
-          country: data.sys.country,
-          coordinates: {
-            lat: data.coord.lat,
-            lon: data.coord.lon
-          }
-        },
-        current: {
-          temperature: Math.round(data.main.temp),
-          feelsLike: Math.round(data.main.feels_like),
-          humidity: data.main.humidity,
-          pressure: data.main.pressure,
-          visibility: data.visibility,
-          uvIndex: null, // Not available in current weather
-          windSpeed: data.wind.speed,
-          windDirection: data.wind.deg,
-          description: data.weather[0].description,
-          icon: data.weather[0].icon,
-          condition: data.weather[0].main
-        },
-        units: units === 'metric' ? 'celsius' : 'fahrenheit',
-        timestamp: new Date(data.dt * 1000)
-      };
+      return this.formatCurrentWeather(response.data, units);
     } catch (error) {
       console.error('Weather API Error:', error);
       throw new Error(`Failed to fetch weather data: ${error.message}`);
     }
   }
 
+  formatCurrentWeather(data, units) {
+    return {
+      location: {
+        id: data.id,
+        name: data.name,
+        country: data.sys.country,
+        coordinates: {
+          lat: data.coord.lat,
+          lon: data.coord.lon
+        }
+      },
+      current: {
+        temperature: Math.round(data.main.temp),
+        feelsLike: Math.round(data.main.feels_like),
+        humidity: data.main.humidity,
+        pressure: data.main.pressure,
+        visibility: data.visibility,
+        uvIndex: null, // Not available in current weather
+        windSpeed: data.wind.speed,
+        windDirection: data.wind.deg,
+        description: data.weather[0].description,
+        icon: data.weather[0].icon,
+        condition: data.weather[0].main
+      },
+      units: units === 'metric' ? 'celsius' : 'fahrenheit',
+      timestamp: new Date(data.dt * 1000)
+    };
+  }
+
+  // Current weather for many locations in one call. Cached entries are returned as they
+  // are (stale ones are refreshed in the background through the group endpoint, up to
+  // 20 city ids per request); uncached locations are fetched with a bounded pool.
+  // Results keep input order; a location that fails gets { error } instead of aborting the batch.
+  async getCurrentWeatherBatch(locations, { concurrency = 5 } = {}) {
+    const results = new Array(locations.length);
+    const missing = [];
+    const staleGroups = new Map();
+
+    await Promise.all(locations.map(async (location, index) => {
+      const request = this.locationRequest(location, 'current');
+      const entry = await this.cache.peek(request.key);
+
+      if (!entry) {
+        missing.push(index);
+        return;
+      }
+
+      results[index] = entry.value;
+
+      const id = entry.value.location?.id;
+      if (entry.fresh || !id) return;
+
+      if (!staleGroups.has(request.units)) staleGroups.set(request.units, new Map());
+      staleGroups.get(request.units).set(id, request.key);
+    }));
+
+    this.refreshWeatherGroups(staleGroups);
+
+    await mapWithConcurrency(missing, concurrency, async (index) => {
+      try {
+        results[index] = await this.getCurrentWeatherFor(locations[index]);
+      } catch (error) {
+        results[index] = { error: error.message };
+      }
+    });
+
+    return results;
+  }
+
+  // Refresh stale entries with one /group request per 20 city ids and unit system
+  refreshWeatherGroups(staleGroups) {
+    for (const [units, keysById] of staleGroups) {
+      const ids = [...keysById.keys()];
+
+      for (let i = 0; i < ids.length; i += GROUP_SIZE) {
+        const chunk = ids.slice(i, i + GROUP_SIZE);
+
+        this.inflight.do(flightKey('group', units, chunk.join(',')), () => this.fetchWeatherGroup(chunk, units))
+          .then(list => list.forEach(weather => {
+            const key = keysById.get(weather.location.id);
+            if (key) this.cache.put(key, weather, CACHE_POLICIES.current);
+          }))
+          .catch(error => console.warn('Weather group refresh failed:', error.message));
+      }
+    }
+  }
+
+  async fetchWeatherGroup(ids, units = 'metric') {
+    const response = await this.http.get(`${this.baseUrl}/group`, {
+      params: {
+        id: ids.join(','),
+        appid: this.apiKey,
+        units: units
+      }
+    });
+
+    return response.data.list.map(data => this.formatCurrentWeather(data, units));
+  }
+
   // Get weather forecast for multiple days
-  async getWeatherForecast(city, country, days = 5, units = 'metric') {
+  getWeatherForecast(city, country, days = 5, units = 'metric') {
+    return this.getWeatherForecastFor({ city, country, units }, days);
+  }
+
+  async getWeatherForecastFor(location, days = 5) {
+    const request = this.locationRequest(location, 'forecast');
+    const forecast = await this.cached(
+      request.key,
+      CACHE_POLICIES.forecast,
+      () => this.fetchWeatherForecast(request.params, request.units)
+    );
+
+    return {
+      ...forecast,
+      forecast: forecast.forecast.slice(0, days)
+    };
+  }
+
+  // Make sure the cached 5-day forecast for a location is fresh, fetching it only when
+  // the entry is missing or stale. Used by the background prefetch job.
+  async prefetchForecast(location) {
+    const request = this.locationRequest(location, 'forecast');
+    const cached = await this.cache.peek(request.key);
+    if (cached?.fresh) return cached.value;
+
+    const forecast = await this.inflight.do(
+      request.key,
+      () => this.fetchWeatherForecast(request.params, request.units)
+    );
+    this.cache.put(request.key, forecast, CACHE_POLICIES.forecast);
+    return forecast;
+  }
+
+  // Daily forecast or estimate in the shape stored on an itinerary day
+  toItineraryWeather(day) {
+    return {
+      temperature: day.temperature,
+      condition: day.condition?.main || day.condition,
+      precipitation: day.precipitation || 0,
+      humidity: day.humidity
+    };
+  }
+
+  // The full 5-day forecast is fetched once and sliced per request
+  async fetchWeatherForecast(params, units = 'metric') {
     try {
       if (!this.apiKey) {
         throw new Error('OpenWeather API key not configured');
       }
 
-      const location = `${city},${country}`;
-      const response = await axios.get(`${this.baseUrl}/forecast`, {
+      const response = await this.http.get(`${this.baseUrl}/forecast`, {
         params: {
-          q: location,
+          ...params,
           appid: this.apiKey,
           units: units,
-          cnt: days * 8 // 8 forecasts per day (every 3 hours)
+          cnt: 5 * 8 // 8 forecasts per day (every 3 hours)
         }
       });
 
       const data = response.data;
 
       // Group forecasts by day
-      const dailyForecasts = this.groupForecastsByDay(data.list);
+      const dailyForecasts = this.groupForecastsByDay(data.list, data.city.timezone);
 
       return {
         location: {
+          id: data.city.id,
           name: data.city.name,
           country: data.city.country,
           coordinates: {
@@ -87,7 +314,7 @@ class WeatherService {
           },
           timezone: data.city.timezone
         },
-        forecast: dailyForecasts.slice(0, days),
+        forecast: dailyForecasts.slice(0, 5),
         units: units === 'metric' ? 'celsius' : 'fahrenheit'
       };
     } catch (error) {
@@ -96,26 +323,56 @@ class WeatherService {
     }
   }
 
-  // Get weather for specific dates (for trip planning)
-  async getWeatherForTrip(city, country, startDate, endDate, units = 'metric') {
+  // Get weather for specific dates (for trip planning). Every day is estimated from
+  // climate normals; dates the live 5-day forecast covers use the forecast instead.
+  getWeatherForTrip(city, country, startDate, endDate, units = 'metric') {
+    return this.getWeatherForTripAt({ city, country, units }, startDate, endDate);
+  }
+
+  async getWeatherForTripAt(location, startDate, endDate) {
     try {
-      const start = new Date(startDate);
-      const end = new Date(endDate);
-      const diffDays = Math.ceil((end - start) / (1000 * 60 * 60 * 24)) + 1;
-
-      // For dates within 5 days, use forecast API
-      if (diffDays <= 5) {
-        const forecast = await this.getWeatherForecast(city, country, diffDays, units);
-        return forecast;
+      const units = location.units || 'metric';
+      const dates = this.listDates(startDate, endDate);
+      const coordinates = location.lat !== undefined && location.lon !== undefined
+        ? { lat: location.lat, lon: location.lon }
+        : null;
+      const climate = climatologyService.getDailyNormals(location.city, location.country, dates, { units, coordinates });
+
+      if (!climate) {
+        // No normals for this destination: fall back to live data
+        if (dates.length <= 5) {
+          return await this.getWeatherForecastFor(location, dates.length);
+        }
+
+        const current = await this.getCurrentWeatherFor(location);
+        return {
+          ...current,
+          forecast: this.generateExtendedForecast(current, dates),
+          note: 'Extended forecast is projected from current conditions'
+        };
       }
 
-      // For longer periods or historical data, use current weather + general advice
-      const current = await this.getCurrentWeather(city, country, units);
+      const today = new Date().toISOString().split('T')[0];
+      const lastForecastDate = new Date(Date.now() + 4 * DAY).toISOString().split('T')[0];
+      const forecastByDate = new Map();
+      let resolvedLocation = climate.location;
+
+      // Trips starting beyond the forecast window need no network call at all
+      if (dates[0] <= lastForecastDate && dates[dates.length - 1] >= today) {
+        try {
+          const live = await this.getWeatherForecastFor(location, 5);
+          live.forecast.forEach(day => forecastByDate.set(day.date, { ...day, source: 'forecast' }));
+          resolvedLocation = live.location;
+        } catch (error) {
+          console.warn('Live forecast unavailable, using climate normals:', error.message);
+        }
+      }
 
       return {
-        ...current,
-        forecast: this.generateExtendedForecast(current, diffDays),
-        note: 'Extended forecast is estimated based on historical data and current conditions'
+        location: resolvedLocation,
+        forecast: climate.forecast.map(day => forecastByDate.get(day.date) || day),
+        units: units === 'metric' ? 'celsius' : 'fahrenheit',
+        note: 'Days outside the 5-day forecast are estimated from climate normals'
       };
     } catch (error) {
       console.error('Trip Weather Error:', error);
@@ -123,204 +380,129 @@ class WeatherService {
     }
   }
 
-  // Helper method to group 3-hourly forecasts into daily forecasts
-  groupForecastsByDay(forecasts) {
-    const dailyData = {};
+  // Every date from start to end inclusive, as YYYY-MM-DD
+  listDates(startDate, endDate) {
+    const dates = [];
+    const end = new Date(endDate).getTime();
+
+    for (let time = new Date(startDate).getTime(); time <= end; time += DAY) {
+      dates.push(new Date(time).toISOString().split('T')[0]);
+    }
 
-    forecasts.forEach(forecast => {
-      const date = new Date(forecast.dt * 1000).toDateString();
+    return dates;
+  }
 
-      if (!dailyData[date]) {
-        dailyData[date] = {
-          date: new Date(forecast.dt * 1000).toISOString().split('T')[0],
-          temperatures: [],
-          conditions: [],
-          humidity: [],
-          wind: [],
+  // Group 3-hourly forecasts into daily summaries in one pass. Days are split on the
+  // city's local midnight (timezoneOffset in seconds, as returned by OpenWeather).
+  groupForecastsByDay(forecasts, timezoneOffset = 0) {
+    const days = [];
+    const dayIndex = new Map();
+
+    for (const forecast of forecasts) {
+      const localSeconds = forecast.dt + timezoneOffset;
+      const dayNumber = Math.floor(localSeconds / SECONDS_PER_DAY);
+
+      let day = dayIndex.get(dayNumber);
+      if (!day) {
+        day = {
+          date: new Date(dayNumber * SECONDS_PER_DAY * 1000).toISOString().split('T')[0],
+          min: Infinity,
+          max: -Infinity,
+          temperatureSum: 0,
+          humiditySum: 0,
+          windSum: 0,
+          count: 0,
           precipitation: 0,
-          forecasts: []
+          conditionCounts: new Map(),
+          topCount: 0,
+          condition: null,
+          hourlyForecasts: []
         };
+        dayIndex.set(dayNumber, day);
+        days.push(day);
       }
 
-      dailyData[date].temperatures.push(forecast.main.temp);
-      dailyData[date].conditions.push(forecast.weather[0]);
-      dailyData[date].humidity.push(forecast.main.humidity);
-      dailyData[date].wind.push(forecast.wind);
-
-      if (forecast.rain && forecast.rain['3h']) {
-        dailyData[date].precipitation += forecast.rain['3h'];
-      }
-      if (forecast.snow && forecast.snow['3h']) {
-        dailyData[date].precipitation += forecast.snow['3h'];
+      const temperature = forecast.main.temp;
+      const weather = forecast.weather[0];
+
+      if (temperature < day.min) day.min = temperature;
+      if (temperature > day.max) day.max = temperature;
+      day.temperatureSum += temperature;
+      day.humiditySum += forecast.main.humidity;
+      day.windSum += forecast.wind?.speed || 0;
+      day.count++;
+      day.precipitation += (forecast.rain?.['3h'] || 0) + (forecast.snow?.['3h'] || 0);
+
+      // Condition histogram; ties go to the condition that reached the count first
+      const conditionCount = (day.conditionCounts.get(weather.main) || 0) + 1;
+      day.conditionCounts.set(weather.main, conditionCount);
+      if (conditionCount > day.topCount) {
+        day.topCount = conditionCount;
+        day.condition = weather;
       }
 
-      dailyData[date].forecasts.push({
-        time: new Date(forecast.dt * 1000).toLocaleTimeString('en-US', { 
-          hour: '2-digit', 
-          minute: '2-digit',
-          hour12: false 
-        }),
-        temperature: Math.round(forecast.main.temp),
-        condition: forecast.weather[0].main,
-        description: forecast.weather[0].description,
-        icon: forecast.weather[0].icon
+      day.hourlyForecasts.push({
+        time: formatLocalTime(localSeconds),
+        temperature: Math.round(temperature),
+        condition: weather.main,
+        description: weather.description,
+        icon: weather.icon
       });
-    });
+    }
 
-    // Process daily summaries
-    return Object.values(dailyData).map(day => ({
+    return days.map(day => ({
       date: day.date,
       temperature: {
-        min: Math.round(Math.min(...day.temperatures)),
-        max: Math.round(Math.max(...day.temperatures)),
-        avg: Math.round(day.temperatures.reduce((a, b) => a + b, 0) / day.temperatures.length)
+        min: Math.round(day.min),
+        max: Math.round(day.max),
+        avg: Math.round(day.temperatureSum / day.count)
+      },
+      condition: {
+        main: day.condition.main,
+        description: day.condition.description,
+        icon: day.condition.icon
       },
-      condition: this.getMostFrequentCondition(day.conditions),
-      humidity: Math.round(day.humidity.reduce((a, b) => a + b, 0) / day.humidity.length),
-      windSpeed: Math.round(day.wind.reduce((sum, w) => sum + (w.speed || 0), 0) / day.wind.length),
+      humidity: Math.round(day.humiditySum / day.count),
+      windSpeed: Math.round(day.windSum / day.count),
       precipitation: Math.round(day.precipitation * 100) / 100,
-      hourlyForecasts: day.forecasts
+      hourlyForecasts: day.hourlyForecasts
     }));
   }
 
-  // Get the most frequent weather condition for the day
-  getMostFrequentCondition(conditions) {
-    const conditionCounts = {};
-    let maxCount = 0;
-    let mostFrequent = conditions[0];
+  // Project current conditions over the trip dates (fallback without climate normals)
+  generateExtendedForecast(currentWeather, dates) {
+    const { temperature, condition, humidity, windSpeed } = currentWeather.current;
 
-    conditions.forEach(condition => {
-      const main = condition.main;
-      conditionCounts[main] = (conditionCounts[main] || 0) + 1;
-
-      if (conditionCounts[main] > maxCount) {
-        maxCount = conditionCounts[main];
-        mostFrequent = condition;
-      }
-    });
-
-    return {
-      main: mostFrequent.main,
-      description: mostFrequent.description,
-      icon: mostFrequent.icon
-    };
-  }
-
-  // Generate extended forecast based on current conditions (fallback)
-  generateExtendedForecast(currentWeather, days) {
-    const forecast = [];
-    const baseTemp = currentWeather.current.temperature;
-
-    for (let i = 0; i < days; i++) {
-      const date = new Date();
-      date.setDate(date.getDate() + i);
-
-      // Add some randomness to temperature (±5°C)
-      const tempVariation = (Math.random() - 0.5) * 10;
-
-      forecast.push({
-        date: date.toISOString().split('T')[0],
-        temperature: {
-          min: Math.round(baseTemp - 5 + tempVariation),
-          max: Math.round(baseTemp + 5 + tempVariation),
-          avg: Math.round(baseTemp + tempVariation)
-        },
-        condition: currentWeather.current.condition,
-        humidity: currentWeather.current.humidity + Math.round((Math.random() - 0.5) * 20),
-        windSpeed: currentWeather.current.windSpeed + Math.round((Math.random() - 0.5) * 5),
-        precipitation: Math.random() < 0.3 ? Math.round(Math.random() * 5) : 0,
-        note: 'Estimated based on current conditions'
-      });
-    }
-
-    return forecast;
+    return dates.map(date => ({
+      date,
+      temperature: {
+        min: temperature - 5,
+        max: temperature + 5,
+        avg: temperature
+      },
+      condition,
+      humidity,
+      windSpeed,
+      precipitation: 0,
+      note: 'Estimated based on current conditions'
+    }));
   }
 
   // Get weather recommendations for activities
   getWeatherRecommendations(weatherData) {
-    const recommendations = [];
-    const temp = weatherData.current?.temperature || weatherData.temperature?.avg;
-    const condition = weatherData.current?.condition || weatherData.condition?.main;
-    const precipitation = weatherData.precipitation || 0;
-
-    // Temperature-based recommendations
-    if (temp < 0) {
-      recommendations.push({
-        type: 'clothing',
-        message: 'Very cold weather - wear heavy winter clothing, including warm layers, gloves, and waterproof boots.'
-      });
-      recommendations.push({
-        type: 'activity',
-        message: 'Consider indoor activities like museums, shopping centers, or cozy cafes.'
-      });
-    } else if (temp < 10) {
-      recommendations.push({
-        type: 'clothing',
-        message: 'Cold weather - dress in warm layers, bring a jacket and comfortable walking shoes.'
-      });
-    } else if (temp < 20) {
-      recommendations.push({
-        type: 'clothing',
-        message: 'Cool weather - light layers recommended, bring a light jacket for evening.'
-      });
-    } else if (temp < 30) {
-      recommendations.push({
-        type: 'clothing',
-        message: 'Pleasant weather - comfortable clothing, light layers for temperature changes.'
-      });
-    } else {
-      recommendations.push({
-        type: 'clothing',
-        message: 'Hot weather - wear light, breathable clothing, hat, and sunscreen.'
-      });
-      recommendations.push({
-        type: 'activity',
-        message: 'Stay hydrated and consider indoor activities during peak heat hours (12-4 PM).'
-      });
-    }
-
-    // Precipitation-based recommendations
-    if (precipitation > 5) {
-      recommendations.push({
-        type: 'weather',
-        message: 'Heavy rain expected - bring umbrella, waterproof clothing, and plan indoor activities.'
-      });
-    } else if (precipitation > 0) {
-      recommendations.push({
-        type: 'weather',
-        message: 'Light rain possible - bring umbrella or light rain jacket.'
-      });
-    }
+    return recommendWeather(
+      weatherData.current?.temperature ?? weatherData.temperature?.avg,
+      weatherData.precipitation || 0,
+      weatherData.current?.condition ?? weatherData.condition?.main
+    );
+  }
 
-    // Condition-based recommendations
-    switch (condition) {
-      case 'Snow':
-        recommendations.push({
-          type: 'activity',
-          message: 'Snowy conditions - great for winter sports but be cautious of slippery surfaces.'
-        });
-        break;
-      case 'Clear':
-        recommendations.push({
-          type: 'activity',
-          message: 'Perfect weather for outdoor activities, sightseeing, and photography.'
-        });
-        break;
-      case 'Clouds':
-        recommendations.push({
-          type: 'activity',
-          message: 'Overcast but good for walking tours and outdoor activities.'
-        });
-        break;
-      case 'Thunderstorm':
-        recommendations.push({
-          type: 'safety',
-          message: 'Thunderstorm conditions - avoid outdoor activities and seek shelter.'
-        });
-        break;
-    }
+  getCoalescingStats() {
+    return this.inflight.getStats();
+  }
 
-    return recommendations;
+  getCacheStats() {
+    return this.cache.getStats();
   }
 }
 
@@ -0,0 +1,91 @@
+// Circuit breaker: closed -> open after repeated failures, half-open after a
+// cool-down to let a trial request through, closed again once one succeeds.
+class CircuitBreaker {
+  constructor({ name, failureThreshold = 5, resetTimeoutMs = 30000, halfOpenMaxCalls = 1 } = {}) {
+    this.name = name;
+    this.failureThreshold = failureThreshold;
+    this.resetTimeoutMs = resetTimeoutMs;
+    this.halfOpenMaxCalls = halfOpenMaxCalls;
+
+    this.state = 'closed';
+    this.failures = 0;
+    this.openedAt = 0;
+    this.openDurationMs = resetTimeoutMs;
+    this.halfOpenInFlight = 0;
+    this.stats = {
+      opened: 0,
+      rejected: 0
+    };
+  }
+
+  canRequest() {
+    if (this.state === 'open') {
+      if (Date.now() - this.openedAt < this.openDurationMs) return false;
+      this.state = 'half-open';
+      this.halfOpenInFlight = 0;
+    }
+
+    if (this.state === 'half-open') {
+      return this.halfOpenInFlight < this.halfOpenMaxCalls;
+    }
+
+    return true;
+  }
+
+  // Call when a request is actually sent
+  onStart() {
+    if (this.state === 'half-open') this.halfOpenInFlight++;
+  }
+
+  onSuccess() {
+    this.finish();
+    this.failures = 0;
+    this.state = 'closed';
+  }
+
+  onFailure(error) {
+    this.finish();
+    this.failures++;
+
+    // Honour the provider's Retry-After on rate limiting
+    const retryAfter = parseInt(error?.response?.headers?.['retry-after'] || error?.headers?.['retry-after']);
+    if (retryAfter > 0) {
+      this.open(retryAfter * 1000);
+    } else if (this.state === 'half-open' || this.failures >= this.failureThreshold) {
+      this.open(this.resetTimeoutMs);
+    }
+  }
+
+  // Call when a request was cancelled before an outcome was known
+  onCancel() {
+    this.finish();
+  }
+
+  finish() {
+    if (this.halfOpenInFlight > 0) this.halfOpenInFlight--;
+  }
+
+  open(durationMs) {
+    if (this.state !== 'open') this.stats.opened++;
+    this.state = 'open';
+    this.openedAt = Date.now();
+    this.openDurationMs = durationMs;
+  }
+
+  retryAfterMs() {
+    return this.state === 'open'
+      ? Math.max(0, this.openDurationMs - (Date.now() - this.openedAt))
+      : 0;
+  }
+
+  getStats() {
+    return {
+      state: this.state,
+      failures: this.failures,
+      retryAfterMs: this.retryAfterMs(),
+      ...this.stats
+    };
+  }
+}
+
+export default CircuitBreaker;
@@ -0,0 +1,26 @@
+// Opaque pagination cursors: JSON state encoded as base64url so clients pass it back
+// verbatim without depending on its contents
+
+export const encodeCursor = (state) =>
+  Buffer.from(JSON.stringify(state)).toString('base64url');
+
+// The decoded state, or null for anything that is not a cursor we issued
+export const decodeCursor = (cursor) => {
+  if (typeof cursor !== 'string' || cursor.length === 0) return null;
+
+  try {
+    const state = JSON.parse(Buffer.from(cursor, 'base64url').toString('utf8'));
+    return state && typeof state === 'object' && !Array.isArray(state) ? state : null;
+  } catch {
+    return null;
+  }
+};
+
+// Filter for the documents that come after the sort key values in after, for a
+// descending sort on fields such as ['createdAt', '_id']. The last field must be unique.
+export const afterKeyset = (fields, after) => ({
+  $or: fields.map((field, i) => ({
+    ...Object.fromEntries(fields.slice(0, i).map(previous => [previous, after[previous]])),
+    [field]: { $lt: after[field] }
+  }))
+});
@@ -0,0 +1,158 @@
+import mongoose from 'mongoose';
+import Job from '../models/Job.js';
+import { AppError } from '../middleware/errorHandler.js';
+
+// Bounded background job queue. The default 'memory' driver runs jobs in-process;
+// the 'mongo' driver stores them in the jobs collection so they survive restarts
+// and can be claimed by any API process.
+class JobQueue {
+  constructor({
+    name,
+    handler,
+    concurrency = 2,
+    maxQueued = 50,
+    driver = 'memory',
+    pollInterval = 1000,
+    lockTimeout = 10 * 60 * 1000,
+    maxAttempts = 3
+  }) {
+    this.name = name;
+    this.handler = handler;
+    this.concurrency = concurrency;
+    this.maxQueued = maxQueued;
+    this.driver = driver;
+    this.lockTimeout = lockTimeout;
+    this.maxAttempts = maxAttempts;
+
+    this.pending = [];
+    this.active = 0;
+    this.polling = false;
+    this.stats = {
+      enqueued: 0,
+      completed: 0,
+      failed: 0,
+      rejected: 0
+    };
+
+    if (this.driver === 'mongo') {
+      this.poller = setInterval(() => this.poll(), pollInterval);
+      this.poller.unref();
+    }
+  }
+
+  async add(payload, id = new mongoose.Types.ObjectId().toString()) {
+    const queued = this.driver === 'mongo'
+      ? await Job.countDocuments({ queue: this.name, status: 'queued' })
+      : this.pending.length;
+
+    if (queued >= this.maxQueued) {
+      this.stats.rejected++;
+      throw new AppError('Server is busy generating trips, please try again shortly', 503);
+    }
+
+    this.stats.enqueued++;
+
+    if (this.driver === 'mongo') {
+      await Job.create({ _id: id, queue: this.name, payload });
+      this.poll();
+    } else {
+      this.pending.push({ id: String(id), payload });
+      this.drain();
+    }
+
+    return String(id);
+  }
+
+  drain() {
+    while (this.active < this.concurrency && this.pending.length > 0) {
+      this.execute(this.pending.shift());
+    }
+  }
+
+  // Run a job through the handler; resolves with the error (if any) instead of throwing
+  async execute(job) {
+    this.active++;
+    try {
+      await this.handler(job.payload, job.id);
+      this.stats.completed++;
+      return null;
+    } catch (error) {
+      this.stats.failed++;
+      console.error(`Job ${job.id} on queue ${this.name} failed:`, error.message);
+      return error;
+    } finally {
+      this.active--;
+      if (this.driver === 'mongo') {
+        this.poll();
+      } else {
+        this.drain();
+      }
+    }
+  }
+
+  async poll() {
+    if (this.polling || mongoose.connection.readyState !== 1) return;
+
+    this.polling = true;
+    try {
+      while (this.active < this.concurrency) {
+        const job = await this.claim();
+        if (!job) break;
+        this.runDurable(job);
+      }
+    } catch (error) {
+      console.error(`Polling queue ${this.name} failed:`, error.message);
+    } finally {
+      this.polling = false;
+    }
+  }
+
+  // Atomically claim the oldest queued job, or one whose worker died mid-run
+  claim() {
+    const now = new Date();
+
+    return Job.findOneAndUpdate(
+      {
+        queue: this.name,
+        $or: [
+          { status: 'queued' },
+          { status: 'running', lockedUntil: { $lt: now }, attempts: { $lt: this.maxAttempts } }
+        ]
+      },
+      {
+        $set: { status: 'running', lockedUntil: new Date(now.getTime() + this.lockTimeout) },
+        $inc: { attempts: 1 }
+      },
+      { sort: { createdAt: 1 }, new: true }
+    ).lean();
+  }
+
+  async runDurable(job) {
+    const error = await this.execute({ id: job._id.toString(), payload: job.payload });
+
+    try {
+      await Job.updateOne({ _id: job._id }, {
+        $set: {
+          status: error ? 'failed' : 'completed',
+          lastError: error?.message,
+          finishedAt: new Date()
+        }
+      });
+    } catch (updateError) {
+      console.error(`Failed to record job ${job._id} result:`, updateError.message);
+    }
+  }
+
+  getStats() {
+    return {
+      name: this.name,
+      driver: this.driver,
+      concurrency: this.concurrency,
+      active: this.active,
+      queued: this.driver === 'memory' ? this.pending.length : undefined,
+      ...this.stats
+    };
+  }
+}
+
+export default JobQueue;
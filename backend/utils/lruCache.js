@@ -0,0 +1,83 @@
+// In-memory LRU cache with optional per-entry TTL. Bounded by entry count and,
+// when maxBytes is set, by the total of sizeOf(value) across entries. onEvict(key, value)
+// is called for entries pushed out by those bounds.
+class LRUCache {
+  constructor({ max = 500, ttl = 0, maxBytes = 0, sizeOf = null, onEvict = null } = {}) {
+    this.max = max;
+    this.ttl = ttl;
+    this.maxBytes = maxBytes;
+    this.sizeOf = sizeOf || ((value) => Buffer.byteLength(JSON.stringify(value) ?? ''));
+    this.onEvict = onEvict;
+    this.entries = new Map();
+    this.bytes = 0;
+  }
+
+  get size() {
+    return this.entries.size;
+  }
+
+  // Get a value and mark it as most recently used
+  get(key) {
+    const entry = this.entries.get(key);
+    if (!entry) return undefined;
+
+    if (entry.expiresAt && entry.expiresAt <= Date.now()) {
+      this.delete(key);
+      return undefined;
+    }
+
+    // Map keeps insertion order, so re-inserting moves the key to the end
+    this.entries.delete(key);
+    this.entries.set(key, entry);
+    return entry.value;
+  }
+
+  has(key) {
+    const entry = this.entries.get(key);
+    return !!entry && (!entry.expiresAt || entry.expiresAt > Date.now());
+  }
+
+  // Get a value without marking it as used
+  peek(key) {
+    return this.has(key) ? this.entries.get(key).value : undefined;
+  }
+
+  set(key, value, { ttl = this.ttl } = {}) {
+    this.delete(key);
+
+    const bytes = this.maxBytes > 0 ? this.sizeOf(value) : 0;
+    // A value larger than the whole cache would only evict everything else
+    if (this.maxBytes > 0 && bytes > this.maxBytes) return this;
+
+    this.entries.set(key, {
+      value,
+      bytes,
+      expiresAt: ttl > 0 ? Date.now() + ttl : 0
+    });
+    this.bytes += bytes;
+
+    // Evict least recently used entries
+    while (this.entries.size > this.max || (this.maxBytes > 0 && this.bytes > this.maxBytes)) {
+      const [oldestKey, oldest] = this.entries.entries().next().value;
+      this.delete(oldestKey);
+      this.onEvict?.(oldestKey, oldest.value);
+    }
+
+    return this;
+  }
+
+  delete(key) {
+    const entry = this.entries.get(key);
+    if (!entry) return false;
+
+    this.bytes -= entry.bytes;
+    return this.entries.delete(key);
+  }
+
+  clear() {
+    this.entries.clear();
+    this.bytes = 0;
+  }
+}
+
+export default LRUCache;
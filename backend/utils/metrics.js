@@ -0,0 +1,62 @@
+// Lightweight in-process metrics helpers
+
+// Rolling window of latency samples (milliseconds) with percentile lookups
+export class LatencyTracker {
+  constructor(windowSize = 200) {
+    this.samples = new Float64Array(windowSize);
+    this.count = 0;
+  }
+
+  record(ms) {
+    this.samples[this.count % this.samples.length] = ms;
+    this.count++;
+  }
+
+  get size() {
+    return Math.min(this.count, this.samples.length);
+  }
+
+  percentile(p) {
+    const n = this.size;
+    if (n === 0) return 0;
+
+    const sorted = this.samples.slice(0, n).sort();
+    const index = Math.min(n - 1, Math.max(0, Math.ceil((p / 100) * n) - 1));
+    return sorted[index];
+  }
+
+  mean() {
+    const n = this.size;
+    if (n === 0) return 0;
+
+    let total = 0;
+    for (let i = 0; i < n; i++) total += this.samples[i];
+    return total / n;
+  }
+
+  toJSON() {
+    return {
+      count: this.count,
+      mean: Math.round(this.mean()),
+      p50: Math.round(this.percentile(50)),
+      p95: Math.round(this.percentile(95))
+    };
+  }
+}
+
+// Exponentially weighted moving average; the first sample seeds the value
+export class Ewma {
+  constructor(alpha = 0.2) {
+    this.alpha = alpha;
+    this.value = 0;
+    this.initialized = false;
+  }
+
+  update(sample) {
+    this.value = this.initialized
+      ? this.alpha * sample + (1 - this.alpha) * this.value
+      : sample;
+    this.initialized = true;
+    return this.value;
+  }
+}
@@ -0,0 +1,35 @@
+// Newline-delimited JSON helper: sets streaming headers and returns a small writer.
+// Each send() is one complete JSON document on its own line, so clients can render
+// records as they arrive.
+export const openNdjsonStream = (req, res) => {
+  // no-transform keeps the compression middleware from buffering the stream
+  res.status(200).set({
+    'Content-Type': 'application/x-ndjson',
+    'Cache-Control': 'no-cache, no-transform',
+    'X-Accel-Buffering': 'no'
+  });
+  res.flushHeaders();
+
+  // As in openEventStream, only the response reliably reports a client that went away
+  let closed = false;
+  res.on('close', () => {
+    closed = true;
+  });
+
+  return {
+    get closed() {
+      return closed;
+    },
+
+    send(record) {
+      if (closed) return;
+      res.write(`${JSON.stringify(record)}\n`);
+    },
+
+    close() {
+      if (closed) return;
+      closed = true;
+      res.end();
+    }
+  };
+};
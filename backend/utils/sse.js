@@ -0,0 +1,50 @@
+// Server-Sent Events helper: sets streaming headers and returns a small writer
+export const openEventStream = (req, res, { heartbeatMs = 15000 } = {}) => {
+  // no-transform keeps the compression middleware from buffering the stream
+  res.status(200).set({
+    'Content-Type': 'text/event-stream',
+    'Cache-Control': 'no-cache, no-transform',
+    'Connection': 'keep-alive',
+    'X-Accel-Buffering': 'no'
+  });
+  res.flushHeaders();
+
+  let closed = false;
+  const closeHandlers = [];
+
+  const heartbeat = setInterval(() => {
+    if (!closed) res.write(': ping\n\n');
+  }, heartbeatMs);
+
+  const cleanup = () => {
+    if (closed) return;
+    closed = true;
+    clearInterval(heartbeat);
+    closeHandlers.forEach(handler => handler());
+  };
+
+  // The request's 'close' fires once its body is read, so only the response reports
+  // a client that went away
+  res.on('close', cleanup);
+
+  return {
+    get closed() {
+      return closed;
+    },
+
+    send(event, data) {
+      if (closed) return;
+      res.write(`event: ${event}\ndata: ${JSON.stringify(data)}\n\n`);
+    },
+
+    onClose(handler) {
+      closeHandlers.push(handler);
+    },
+
+    close() {
+      if (closed) return;
+      cleanup();
+      res.end();
+    }
+  };
+};
@@ -0,0 +1,95 @@
+import mongoose from 'mongoose';
+import LRUCache from './lruCache.js';
+import CacheEntry from '../models/CacheEntry.js';
+
+// Two-tier cache: per-process LRU in front of a MongoDB collection shared by all processes
+class TieredCache {
+  constructor({ namespace, max = 500, ttl = 60 * 60 * 1000, shared = true } = {}) {
+    this.namespace = namespace;
+    this.ttl = ttl;
+    this.shared = shared;
+    this.memory = new LRUCache({ max, ttl });
+    this.stats = {
+      memoryHits: 0,
+      sharedHits: 0,
+      misses: 0,
+      writes: 0,
+      errors: 0
+    };
+  }
+
+  // The shared tier is only used while mongoose has an open connection
+  isSharedAvailable() {
+    return this.shared && mongoose.connection.readyState === 1;
+  }
+
+  async get(key) {
+    const local = this.memory.get(key);
+    if (local !== undefined) {
+      this.stats.memoryHits++;
+      return local;
+    }
+
+    if (this.isSharedAvailable()) {
+      try {
+        const entry = await CacheEntry.findOne({
+          namespace: this.namespace,
+          key,
+          expiresAt: { $gt: new Date() }
+        }).lean();
+
+        if (entry) {
+          this.stats.sharedHits++;
+          this.memory.set(key, entry.value, { ttl: entry.expiresAt.getTime() - Date.now() });
+          return entry.value;
+        }
+      } catch (error) {
+        this.stats.errors++;
+        console.warn(`Shared cache read failed (${this.namespace}):`, error.message);
+      }
+    }
+
+    this.stats.misses++;
+    return undefined;
+  }
+
+  async set(key, value, ttl = this.ttl) {
+    this.memory.set(key, value, { ttl });
+    this.stats.writes++;
+
+    if (!this.isSharedAvailable()) return;
+
+    try {
+      await CacheEntry.updateOne(
+        { namespace: this.namespace, key },
+        { $set: { value, expiresAt: new Date(Date.now() + ttl) } },
+        { upsert: true }
+      );
+    } catch (error) {
+      this.stats.errors++;
+      console.warn(`Shared cache write failed (${this.namespace}):`, error.message);
+    }
+  }
+
+  async delete(key) {
+    this.memory.delete(key);
+
+    if (this.isSharedAvailable()) {
+      await CacheEntry.deleteOne({ namespace: this.namespace, key });
+    }
+  }
+
+  getStats() {
+    const hits = this.stats.memoryHits + this.stats.sharedHits;
+    const lookups = hits + this.stats.misses;
+
+    return {
+      namespace: this.namespace,
+      entries: this.memory.size,
+      ...this.stats,
+      hitRate: lookups > 0 ? Math.round((hits / lookups) * 1000) / 1000 : 0
+    };
+  }
+}
+
+export default TieredCache;
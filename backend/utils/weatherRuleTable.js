@@ -0,0 +1,91 @@
+// Compiles the weather recommendation rules into a lookup table. Temperature and
+// precipitation are reduced to buckets by the bounds the rules mention, the condition
+// by the values they list. Every rule is evaluated once per bucket combination at
+// startup, so a lookup costs a few comparisons however many rules there are.
+
+const COMPARATORS = {
+  lt: (value, bound) => value < bound,
+  lte: (value, bound) => value <= bound,
+  gt: (value, bound) => value > bound,
+  gte: (value, bound) => value >= bound
+};
+
+// Bounds split the number line into open intervals and the bound points themselves.
+// The last bucket is for a missing value, which no bound matches.
+const numericAxis = (rules, name) => {
+  const bounds = rules.flatMap(rule => Object.values(rule.when[name] || {}));
+  const points = [...new Set(bounds)].sort((a, b) => a - b);
+  const samples = [];
+
+  points.forEach((point, i) => {
+    samples.push(i === 0 ? point - 1 : (points[i - 1] + point) / 2, point);
+  });
+  samples.push(points.length > 0 ? points[points.length - 1] + 1 : 0, NaN);
+
+  const missing = samples.length - 1;
+
+  return {
+    samples,
+    bucket: (value) => {
+      if (typeof value !== 'number' || Number.isNaN(value)) return missing;
+
+      let i = 0;
+      while (i < points.length && value > points[i]) i++;
+      return i < points.length && value === points[i] ? 2 * i + 1 : 2 * i;
+    }
+  };
+};
+
+// Listed values get a bucket each; anything else falls into the last one
+const categoricalAxis = (rules, name) => {
+  const listed = [...new Set(rules.flatMap(rule => rule.when[name] || []))];
+  const index = new Map(listed.map((value, i) => [value, i]));
+  const other = listed.length;
+
+  return {
+    samples: [...listed, undefined],
+    bucket: (value) => index.get(value) ?? other
+  };
+};
+
+const matches = (rule, sample) => Object.entries(rule.when).every(([name, condition]) =>
+  Array.isArray(condition)
+    ? condition.includes(sample[name])
+    : Object.entries(condition).every(([operator, bound]) => COMPARATORS[operator](sample[name], bound)));
+
+// Returns recommend(temperature, precipitation, condition). The arrays it returns
+// are frozen and shared between calls.
+export const compileWeatherRules = (rules) => {
+  const temperatureAxis = numericAxis(rules, 'temperature');
+  const precipitationAxis = numericAxis(rules, 'precipitation');
+  const conditionAxis = categoricalAxis(rules, 'condition');
+
+  const precipitationSize = precipitationAxis.samples.length;
+  const conditionSize = conditionAxis.samples.length;
+
+  const frozenRules = rules.map(rule => rule.recommendations.map(item => Object.freeze({ ...item })));
+  const shared = new Map();
+  const table = [];
+
+  // Row-major over temperature, precipitation, condition
+  temperatureAxis.samples.forEach(temperature => {
+    precipitationAxis.samples.forEach(precipitation => {
+      conditionAxis.samples.forEach(condition => {
+        const sample = { temperature, precipitation, condition };
+        const matched = rules.flatMap((rule, i) => matches(rule, sample) ? [i] : []);
+
+        // Combinations that match the same rules share one array
+        const signature = matched.join(',');
+        if (!shared.has(signature)) {
+          shared.set(signature, Object.freeze(matched.flatMap(i => frozenRules[i])));
+        }
+        table.push(shared.get(signature));
+      });
+    });
+  });
+
+  return (temperature, precipitation, condition) => table[
+    (temperatureAxis.bucket(temperature) * precipitationSize + precipitationAxis.bucket(precipitation)) * conditionSize +
+    conditionAxis.bucket(condition)
+  ];
+};